@@ -0,0 +1,343 @@
+"""The benchmarked comparisons, one per matcher, at each input size.
+
+Each case is a function of the size, returning a callable of no arguments that
+makes the comparison. Anything that isn't being measured (e.g. building the
+values) happens before it returns.
+"""
+
+import asyncio
+import copy
+import json
+import typing as tp
+import uuid
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+
+from joythief.compound import AllOf, AnyOf, Not
+from joythief.data_structures import (
+    AllUnique,
+    AsyncIterableMatching,
+    AtPath,
+    DictContaining,
+    EveryItem,
+    IsSorted,
+    IterableEqual,
+    IterableMatching,
+)
+from joythief.numbers import (
+    AtLeast,
+    AtMost,
+    Between,
+    Close,
+    GreaterThan,
+    LessThan,
+    NaN,
+)
+from joythief.objects import Anything, InstanceOf, Nothing, Nullable
+from joythief.strings import (
+    DatetimeString,
+    JsonString,
+    StringContaining,
+    StringMatching,
+    UrlString,
+    UuidString,
+)
+
+Case = tp.Callable[[int], tp.Callable[[], object]]
+
+SIZES = (1, 100, 10_000)
+"""The input sizes each case is run at, e.g. the number of items."""
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> tp.Callable[[Case], Case]:
+    """Register a case under the name (module and matcher)."""
+
+    def register(func: Case) -> Case:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def each(
+    matcher: tp.Callable[[], object], values: list[tp.Any]
+) -> tp.Callable[[], object]:
+    """Compare a list of values to a list of (separate) matchers."""
+    expected = [matcher() for _ in values]
+    return lambda: values == expected
+
+
+def repeated(matcher: object, values: list[tp.Any]) -> tp.Callable[[], object]:
+    """Compare a list of values to a list of the same matcher, so that anything
+    it caches is reused."""
+    expected = [matcher] * len(values)
+    return lambda: values == expected
+
+
+def compared_tree(size: int) -> DictContaining:
+    """A tree of matchers, having been compared to a mapping of lists."""
+    matcher = DictContaining(
+        {
+            f"key{i}": AllOf[tp.Any](InstanceOf(list), EveryItem(InstanceOf(int)))
+            for i in range(size)
+        },
+        extra=Nullable(AnyOf[tp.Any](InstanceOf(int), InstanceOf(str))),
+    )
+    value: dict[str, tp.Any] = {f"key{i}": list(range(100)) for i in range(size)}
+    value["extra"] = 1
+    _ = value == matcher
+    return matcher
+
+
+@tp.runtime_checkable
+class Closeable(tp.Protocol):
+    def close(self) -> None: ...
+
+
+class Resource:
+    def close(self) -> None:
+        pass
+
+
+# core
+
+
+@case("core.flat")
+def _(size: int) -> tp.Callable[[], object]:
+    values = [{"id": i, "name": str(i)} for i in range(size)]
+    return each(lambda: DictContaining(id=InstanceOf(int)), values)
+
+
+@case("core.deep")
+def _(size: int) -> tp.Callable[[], object]:
+    node = DictContaining(value=InstanceOf(int))
+    node["child"] = Nullable(node)
+    value: tp.Any = None
+    for index in range(size):
+        value = dict(value=index, child=value)
+    return lambda: value == node
+
+
+@case("core.clone")
+def _(size: int) -> tp.Callable[[], object]:
+    return compared_tree(size).clone
+
+
+@case("core.deepcopy")
+def _(size: int) -> tp.Callable[[], object]:
+    matcher = compared_tree(size)
+    return lambda: copy.deepcopy(matcher)
+
+
+# objects
+
+
+@case("objects.Anything")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(Anything, list(range(size)))
+
+
+@case("objects.Nothing")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(Nothing, list(range(size)))
+
+
+@case("objects.Nullable")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: Nullable[int](InstanceOf(int)), [None, 1] * (size // 2) or [1])
+
+
+@case("objects.InstanceOf")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: InstanceOf(int), list(range(size)))
+
+
+@case("objects.InstanceOf.concrete")
+def _(size: int) -> tp.Callable[[], object]:
+    return repeated(InstanceOf(int), list(range(size)))
+
+
+@case("objects.InstanceOf.abc")
+def _(size: int) -> tp.Callable[[], object]:
+    return repeated(InstanceOf(Mapping), [{"id": i} for i in range(size)])
+
+
+@case("objects.InstanceOf.abc_miss")
+def _(size: int) -> tp.Callable[[], object]:
+    # every item is compared, as a list comparison would stop at the first
+    values, matcher = [[i] for i in range(size)], InstanceOf(Mapping)
+    return lambda: [value == matcher for value in values]
+
+
+@case("objects.InstanceOf.protocol")
+def _(size: int) -> tp.Callable[[], object]:
+    return repeated(InstanceOf(Closeable), [Resource() for _ in range(size)])
+
+
+# strings
+
+
+@case("strings.JsonString")
+def _(size: int) -> tp.Callable[[], object]:
+    document = json.dumps({str(i): [i, None, "x"] for i in range(size)})
+    matcher = JsonString({str(i): [i, None, "x"] for i in range(size)})
+    return lambda: document == matcher
+
+
+@case("strings.StringMatching")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(StringMatching.iso8601, [datetime.now().isoformat()] * size)
+
+
+@case("strings.UrlString")
+def _(size: int) -> tp.Callable[[], object]:
+    query = "&".join(f"key{i}=value{i}" for i in range(size))
+    matcher = UrlString(
+        hostname="example.com",
+        query={f"key{i}": [f"value{i}"] for i in range(size)},
+    )
+    url = f"https://example.com/path?{query}"
+    return lambda: url == matcher
+
+
+@case("strings.StringContaining")
+def _(size: int) -> tp.Callable[[], object]:
+    haystack = "x" * size + "needle"
+    matcher = StringContaining("needle")
+    return lambda: haystack == matcher
+
+
+@case("strings.DatetimeString")
+def _(size: int) -> tp.Callable[[], object]:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    values = [(start + timedelta(seconds=i)).isoformat() for i in range(size)]
+    return each(lambda: DatetimeString(timezone=True), values)
+
+
+@case("strings.UuidString")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(UuidString, [str(uuid.uuid4()) for _ in range(size)])
+
+
+# numbers
+
+
+@case("numbers.NaN")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(NaN, [float("nan")] * size)
+
+
+@case("numbers.Between")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: Between(0, size), list(range(size)))
+
+
+@case("numbers.GreaterThan")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: GreaterThan(-1), list(range(size)))
+
+
+@case("numbers.AtLeast")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: AtLeast(0), list(range(size)))
+
+
+@case("numbers.LessThan")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: LessThan(size), list(range(size)))
+
+
+@case("numbers.AtMost")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: AtMost(size), list(range(size)))
+
+
+@case("numbers.Close")
+def _(size: int) -> tp.Callable[[], object]:
+    values = [i / 3 for i in range(size)]
+    matcher = Close([value + 1e-9 for value in values], rel=1e-6)
+    return lambda: values == matcher
+
+
+# compound
+
+
+@case("compound.AllOf")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: AllOf(InstanceOf(int), AtLeast(0)), list(range(size)))
+
+
+@case("compound.AnyOf")
+def _(size: int) -> tp.Callable[[], object]:
+    matcher = AnyOf[tp.Any](*(Between(i * 10, i * 10 + 5) for i in range(size + 1)))
+    value = size * 10 + 3
+    return lambda: value == matcher
+
+
+@case("compound.Not")
+def _(size: int) -> tp.Callable[[], object]:
+    return each(lambda: Not(InstanceOf(str)), list(range(size)))
+
+
+# data_structures
+
+
+@case("data_structures.DictContaining")
+def _(size: int) -> tp.Callable[[], object]:
+    actual = {f"key{i}": i for i in range(size * 2)}
+    matcher = DictContaining({f"key{i}": InstanceOf(int) for i in range(size)})
+    return lambda: actual == matcher
+
+
+@case("data_structures.AtPath")
+def _(size: int) -> tp.Callable[[], object]:
+    document = {"data": {"items": [{"id": i, "name": str(i)} for i in range(size)]}}
+    matcher = AtPath({f"data.items[{i}].id": InstanceOf(int) for i in range(size)})
+    return lambda: document == matcher
+
+
+@case("data_structures.EveryItem")
+def _(size: int) -> tp.Callable[[], object]:
+    values = [{"id": i, "name": str(i)} for i in range(size)]
+    matcher = EveryItem[tp.Any](DictContaining(id=InstanceOf(int)))
+    return lambda: values == matcher
+
+
+@case("data_structures.IsSorted")
+def _(size: int) -> tp.Callable[[], object]:
+    values = list(range(size))
+    matcher = IsSorted[int]()
+    return lambda: values == matcher
+
+
+@case("data_structures.AllUnique")
+def _(size: int) -> tp.Callable[[], object]:
+    values = list(range(size))
+    matcher = AllUnique[int]()
+    return lambda: values == matcher
+
+
+@case("data_structures.IterableMatching")
+def _(size: int) -> tp.Callable[[], object]:
+    values = list(range(size))
+    matcher = IterableMatching[int](InstanceOf(int))
+    return lambda: values == matcher
+
+
+@case("data_structures.AsyncIterableMatching")
+def _(size: int) -> tp.Callable[[], object]:
+    async def produce() -> tp.AsyncIterator[int]:
+        for i in range(size):
+            yield i
+
+    matcher = AsyncIterableMatching[int](InstanceOf(int))
+    return lambda: asyncio.run(matcher.check(produce()))
+
+
+@case("data_structures.IterableEqual")
+def _(size: int) -> tp.Callable[[], object]:
+    values = list(range(size))
+    matcher = IterableEqual[int]([InstanceOf(int)] * size)
+    return lambda: values == matcher
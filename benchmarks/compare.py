@@ -0,0 +1,52 @@
+"""Compare benchmark results to a baseline, flagging any regressions.
+
+Usage: ``python -m benchmarks.compare BASELINE RESULTS [--threshold FRACTION]``
+
+Lists every case in both files with the ratio of the new time to the old one,
+and exits with status 1 if any is slower by more than the threshold (by
+default 20%, as timings on shared machines are noisy). Only compare results
+from the same machine and Python version.
+"""
+
+import argparse
+import json
+import sys
+import typing as tp
+
+
+def load(path: str) -> dict[str, float]:
+    with open(path) as file:
+        return tp.cast(dict[str, float], json.load(file)["results"])
+
+
+def main(argv: tp.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="default: %(default)s"
+    )
+    args = parser.parse_args(argv)
+    baseline, results = load(args.baseline), load(args.results)
+    regressions = []
+    for key in sorted(baseline.keys() & results.keys()):
+        ratio = results[key] / baseline[key]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(
+            f"{key}: {baseline[key]:.3g}s -> {results[key]:.3g}s ({ratio:.2f}x){flag}"
+        )
+    for key in sorted(baseline.keys() - results.keys()):
+        print(f"{key}: not run")
+    for key in sorted(results.keys() - baseline.keys()):
+        print(f"{key}: new, {results[key]:.3g}s")
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
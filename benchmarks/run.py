@@ -0,0 +1,64 @@
+"""Run the benchmarks, writing the results as JSON.
+
+Usage: ``python -m benchmarks.run [--output FILE] [--repeat N] [NAME ...]``
+
+Each case is timed with :py:class:`timeit.Timer`; the number of calls per
+repeat is chosen with ``autorange`` (so each takes at least 0.2s), and the
+fastest repeat is reported, as the least affected by anything else running.
+The results map ``<module>.<matcher>[<size>]`` to seconds per call.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import typing as tp
+
+from benchmarks.cases import CASES, SIZES
+
+
+def measure(func: tp.Callable[[], object], repeat: int) -> float:
+    """The fastest time, in seconds, for one call of the function."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(argv: tp.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="NAME",
+        help="only run cases whose names contain any of these",
+    )
+    parser.add_argument("--output", help="file to write to (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=3, help="default: %(default)s")
+    args = parser.parse_args(argv)
+    results = {}
+    for name, case in CASES.items():
+        if args.names and not any(part in name for part in args.names):
+            continue
+        for size in SIZES:
+            key = f"{name}[{size}]"
+            results[key] = measure(case(size), args.repeat)
+            print(f"{key}: {results[key]:.3g}s", file=sys.stderr)
+    report = json.dumps(
+        {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
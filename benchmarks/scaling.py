@@ -0,0 +1,120 @@
+"""Measure how comparisons with InParallel scale with the number of workers.
+
+Usage: ``python -m benchmarks.scaling [--output FILE] [--size N] [--repeat N]``
+
+Compares a list of heavyweight records (each a JSON document, matched with
+nested matchers) serially, then with a pool of 1, 2, 4, ... workers up to the
+number of CPUs. The pool is started (and warmed up) before timing, so only
+the comparison itself is measured. The results map ``serial`` and
+``workers=<n>`` to seconds per comparison, including the speedup over serial.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+
+from joythief.data_structures import DictContaining, EveryItem
+from joythief.objects import InstanceOf
+from joythief.parallel import InParallel
+from joythief.strings import JsonString
+
+
+def records(size: int) -> list[dict[str, tp.Any]]:
+    return [
+        {
+            "id": index,
+            "body": json.dumps(
+                {
+                    "name": f"record {index}",
+                    "tags": [f"tag{tag}" for tag in range(20)],
+                    "values": {str(key): key * index for key in range(20)},
+                }
+            ),
+        }
+        for index in range(size)
+    ]
+
+
+def expected(size: int) -> list[tp.Any]:
+    return [
+        DictContaining(
+            id=InstanceOf(int),
+            body=JsonString(
+                DictContaining(
+                    name=InstanceOf(str),
+                    tags=EveryItem[str](InstanceOf(str)),
+                    values=DictContaining(
+                        {str(key): InstanceOf(int) for key in range(20)}
+                    ),
+                )
+            ),
+        )
+        for _ in range(size)
+    ]
+
+
+def measure(
+    actual: list[tp.Any], matcher: tp.Callable[[], tp.Any], repeat: int
+) -> float:
+    """The fastest time, in seconds, to compare to a new matcher."""
+    timings = []
+    for _ in range(repeat):
+        expected = matcher()
+        start = time.perf_counter()
+        assert actual == expected
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: tp.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="file to write to (default: stdout)")
+    parser.add_argument("--size", type=int, default=20_000, help="default: %(default)s")
+    parser.add_argument("--repeat", type=int, default=3, help="default: %(default)s")
+    args = parser.parse_args(argv)
+    actual = records(args.size)
+    serial = measure(
+        actual,
+        lambda: InParallel(expected(args.size), chunk_size=args.size),
+        args.repeat,
+    )
+    results: dict[str, tp.Any] = {"serial": {"seconds": serial}}
+    print(f"serial: {serial:.3g}s", file=sys.stderr)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(workers) as executor:
+            list(executor.map(abs, range(workers)))
+            seconds = measure(
+                actual,
+                lambda: InParallel(expected(args.size), executor=executor),
+                args.repeat,
+            )
+        key = f"workers={workers}"
+        results[key] = {"seconds": seconds, "speedup": serial / seconds}
+        print(f"{key}: {seconds:.3g}s ({serial / seconds:.2f}x)", file=sys.stderr)
+        workers *= 2
+    report = json.dumps(
+        {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "size": args.size,
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output is None:
+        print(report)
+    else:
+        with open(args.output, "w") as file:
+            file.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
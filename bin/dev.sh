@@ -10,6 +10,17 @@ if [ "$#" -lt 1 ]; then
   exit 0
 fi
 
+bench () {
+  poetryRun python -m benchmarks.run --output "$ROOT/benchmarks/results.json" "$@"
+}
+
+benchCompare () {
+  poetryRun python -m benchmarks.compare \
+    "$ROOT/benchmarks/baseline.json" \
+    "$ROOT/benchmarks/results.json" \
+    "$@"
+}
+
 docs () {
   poetryRun sphinx-build --builder html --fail-on-warning docs/source/ docs/build/
 }
@@ -23,8 +34,8 @@ exportDeps () {
 }
 
 _lint () {
-  poetryRun black "$@" docs/ src/ tests/
-  poetryRun isort "$@" src/ tests/
+  poetryRun black "$@" benchmarks/ docs/ src/ tests/
+  poetryRun isort "$@" benchmarks/ src/ tests/
 }
 
 lint () {
@@ -47,7 +58,7 @@ testCover () {
 }
 
 typecheck () {
-  poetryRun mypy src/ tests/
+  poetryRun mypy benchmarks/ src/ tests/
 }
 
 usePoetry () {
@@ -55,6 +66,8 @@ usePoetry () {
 }
 
 case "$1" in
+  bench) shift; bench "$@";;
+  'bench:compare') shift; benchCompare "$@";;
   docs) docs;;
   lint) lint;;
   'lint:fix') lintFix;;
@@ -47,7 +47,7 @@ intersphinx_mapping = dict(
 # https://www.sphinx-doc.org/en/master/usage/extensions/autodoc.html#configuration
 
 autodoc_default_options = {
-    "exclude-members": "compare,represent",
+    "exclude-members": "compare,compare_children,represent",
 }
 autodoc_typehints = "description"
 
@@ -168,9 +168,9 @@ equal can have their representations resolved.
 .. _pytest: https://docs.pytest.org/en/stable/
 """
 
-from .core import Matcher
+from .core import Matcher, Mismatch, explain
 
-__all__ = ["Matcher"]
+__all__ = ["Matcher", "Mismatch", "explain"]
 
 Matcher = Matcher
 """The core generic matcher type.
@@ -0,0 +1,226 @@
+"""Matchers for `NumPy`_ arrays.
+
+.. versionadded:: 0.10.0
+
+The comparisons are vectorised, so they stay fast for arrays with millions of
+elements. NumPy is *not* a dependency of JoyThief; these matchers raise
+:py:class:`ImportError` on creation if it isn't installed.
+
+.. _NumPy: https://numpy.org/
+
+"""
+
+import importlib
+import typing as tp
+from abc import ABC, abstractmethod
+
+from joythief.compound import Not
+from joythief.core import Matcher, Mismatch
+from joythief.numbers import NaN
+
+
+def _numpy() -> tp.Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ImportError("NumPy is required for joythief.arrays") from exc
+
+
+class _ArrayMatcher(Matcher[tp.Any], ABC):
+    """Base class for matchers comparing :py:class:`numpy.ndarray` elementwise.
+
+    After a comparison with ``==``, :py:meth:`~joythief.core.Matcher.mismatches`
+    lists (up to) the first ten elements that didn't match, with their indices
+    as the path, and :py:meth:`mismatch_count` counts all of them.
+    """
+
+    _REPORTED: tp.ClassVar[int] = 10
+    """The maximum number of elements to list as mismatches."""
+
+    __array_ufunc__ = None
+    """Make NumPy defer to the matcher, so ``array == matcher`` works."""
+
+    _transient = Matcher._transient | {"_count"}
+
+    _count: int
+
+    def __init__(self) -> None:
+        _numpy()
+        super().__init__()
+
+    def compare(self, other: tp.Any) -> bool:
+        np = _numpy()
+        if not isinstance(other, np.ndarray):
+            return self.not_implemented
+        self._matched(np, other)
+        return not self._count
+
+    def mismatch_count(self) -> int:
+        """The number of elements that didn't match the last time ``==`` was used.
+
+        Every element is counted as a mismatch if the array couldn't be
+        compared at all (e.g. because its shape was wrong).
+
+        :raises ValueError: if the matcher hasn't been compared to exactly one
+            array.
+        """
+        np = _numpy()
+        if not self._compared_once or not isinstance(self._compared_to, np.ndarray):
+            raise ValueError("matcher has not been compared to a single array")
+        return self._count
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        np = _numpy()
+        if not isinstance(other, np.ndarray):
+            return self.not_implemented, [Mismatch((), self, other)]
+        matched = self._matched(np, other)
+        if matched is None:
+            return False, [Mismatch((), self, other)]
+        if not self._count:
+            return True, []
+        failed = np.flatnonzero(~matched)[: self._REPORTED]
+        return False, [
+            Mismatch(index, self._expected_at(index), other[index])
+            for index in (
+                tuple(int(i) for i in indices)
+                for indices in zip(*np.unravel_index(failed, other.shape))
+            )
+        ]
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._count = 0
+
+    def _matched(self, np: tp.Any, other: tp.Any) -> tp.Any:
+        """Match the elements, counting those that didn't match, so the count
+        doesn't change if the array does afterwards."""
+        matched = self._match(np, other)
+        if matched is None:
+            self._count = int(other.size)
+        else:
+            self._count = int(matched.size - np.count_nonzero(matched))
+        return matched
+
+    @abstractmethod
+    def _match(self, np: tp.Any, other: tp.Any) -> tp.Any:
+        """Boolean array of which elements match, or :py:const:`None` if the
+        array can't be compared at all."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _expected_at(self, index: tuple[int, ...]) -> tp.Any:
+        """What was expected at the index, for reporting mismatches."""
+        raise NotImplementedError
+
+
+class ArrayAllNaN(_ArrayMatcher):
+    """Matches any floating point (or complex) array where every element is NaN.
+
+    .. versionadded:: 0.10.0
+
+    The array equivalent of :py:class:`~joythief.numbers.NaN`.
+    """
+
+    def represent(self) -> str:
+        return super().represent()
+
+    def _match(self, np: tp.Any, other: tp.Any) -> tp.Any:
+        if not np.issubdtype(other.dtype, np.inexact):
+            return None
+        return np.isnan(other)
+
+    def _expected_at(self, index: tuple[int, ...]) -> tp.Any:
+        return NaN()
+
+
+class ArrayNaNAt(_ArrayMatcher):
+    """Matches any floating point (or complex) array with NaN exactly where the
+    mask is true.
+
+    .. versionadded:: 0.10.0
+
+    :param mask: boolean array-like, the same shape as the expected array
+
+    .. code-block:: python
+
+        assert result == ArrayNaNAt([[False, True], [False, False]])
+    """
+
+    _mask: tp.Any
+
+    def __init__(self, mask: tp.Any):
+        super().__init__()
+        self._mask = _numpy().asarray(mask, dtype=bool)
+
+    def represent(self) -> str:
+        return f"ArrayNaNAt({self._mask!r})"
+
+    def _match(self, np: tp.Any, other: tp.Any) -> tp.Any:
+        if other.shape != self._mask.shape or not np.issubdtype(
+            other.dtype, np.inexact
+        ):
+            return None
+        return np.isnan(other) == self._mask
+
+    def _expected_at(self, index: tuple[int, ...]) -> tp.Any:
+        return NaN() if self._mask[index] else Not(NaN())
+
+
+class ArrayClose(_ArrayMatcher):
+    """Matches any numeric array of the same shape, where every element is close
+    to the expected one.
+
+    .. versionadded:: 0.10.0
+
+    :param expected: array-like of the expected values
+    :param rtol: the relative tolerance
+    :param atol: the absolute tolerance
+    :param equal_nan: whether NaN in the same position counts as close
+
+    Elements are compared with :py:func:`numpy.isclose`, i.e. ``actual`` is
+    close to ``expected`` if ``abs(actual - expected) <= atol + rtol *
+    abs(expected)``. Unlike :py:func:`numpy.allclose`, the array isn't
+    broadcast, so its shape must match exactly.
+    """
+
+    _atol: float
+    _equal_nan: bool
+    _expected: tp.Any
+    _rtol: float
+
+    def __init__(
+        self,
+        expected: tp.Any,
+        *,
+        rtol: float = 1e-05,
+        atol: float = 1e-08,
+        equal_nan: bool = False,
+    ):
+        super().__init__()
+        self._atol = atol
+        self._equal_nan = equal_nan
+        self._expected = _numpy().asarray(expected)
+        self._rtol = rtol
+
+    def represent(self) -> str:
+        return (
+            f"ArrayClose({self._expected!r}, rtol={self._rtol!r}, "
+            f"atol={self._atol!r}{', equal_nan=True' if self._equal_nan else ''})"
+        )
+
+    def _match(self, np: tp.Any, other: tp.Any) -> tp.Any:
+        if other.shape != self._expected.shape:
+            return None
+        try:
+            return np.isclose(
+                other,
+                self._expected,
+                rtol=self._rtol,
+                atol=self._atol,
+                equal_nan=self._equal_nan,
+            )
+        except TypeError:
+            return None
+
+    def _expected_at(self, index: tuple[int, ...]) -> tp.Any:
+        return self._expected[index]
@@ -0,0 +1,436 @@
+"""Matchers for callables, comparing what happens when they're called.
+
+.. versionadded:: 0.10.0
+
+"""
+
+import asyncio
+import gc
+import inspect
+import math
+import time
+import tracemalloc
+import typing as tp
+from abc import ABC, abstractmethod
+
+from joythief.core import (
+    Comparison,
+    ContainerMatcher,
+    Matcher,
+    MaybeMatcher,
+    _evaluate,
+    _pass_through,
+    _Unrecorded,
+)
+
+T = tp.TypeVar("T")
+
+
+class Eventually(ContainerMatcher[tp.Callable[[], T]]):
+    """Matches any callable that returns a matching value within the timeout.
+
+    .. versionadded:: 0.10.0
+
+    :param expected: value or matcher the result should match
+    :param timeout: the number of seconds to keep trying for
+    :param interval: the number of seconds to wait after the first attempt
+    :param backoff: the factor to multiply the wait by after each attempt
+
+    :raises ValueError: if the timeout is negative, the interval isn't
+        positive, or the backoff is less than one.
+
+    The callable is called with no arguments until the result matches, waiting
+    exponentially longer between attempts, so a value that changes quickly is
+    seen quickly without polling a slow one too often:
+
+    .. code-block:: python
+
+        assert partial(client.get_job, job_id) == Eventually(
+            DictContaining(status="done"), timeout=30
+        )
+
+    Once the timeout has expired, the matcher represents itself (and lists its
+    mismatches) as the expected value compared to the last result. Use
+    :py:meth:`check` for async code.
+    """
+
+    _repeatable = False
+
+    _backoff: float
+    _expected: MaybeMatcher[T]
+    _interval: float
+    _timeout: float
+
+    def __init__(
+        self,
+        expected: MaybeMatcher[T],
+        /,
+        *,
+        timeout: float = 5.0,
+        interval: float = 0.01,
+        backoff: float = 2.0,
+    ):
+        if timeout < 0:
+            raise ValueError("timeout cannot be negative")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if backoff < 1:
+            raise ValueError("backoff must be at least one")
+        super().__init__()
+        self._backoff = backoff
+        self._expected = expected
+        self._interval = interval
+        self._timeout = timeout
+
+    async def check(
+        self, poll: tp.Callable[[], tp.Union[T, tp.Awaitable[T]]], /
+    ) -> bool:
+        """Call the function until the result matches, waiting asynchronously.
+
+        If the function returns an awaitable (e.g. it's a coroutine function),
+        it's awaited to get the result. Afterwards the matcher represents
+        itself and lists its mismatches as it would after ``==``.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout
+        delay = self._interval
+        while True:
+            value = poll()
+            if inspect.isawaitable(value):
+                value = await value
+            unrecorded = _pass_through(_Unrecorded(self._expected), value)
+            if _evaluate(unrecorded, None, value)[0]:
+                break
+            if (remaining := deadline - loop.time()) <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay *= self._backoff
+        result, self._mismatches = _evaluate(
+            _pass_through(self._expected, value), None, value
+        )
+        self._record(poll, result)
+        return result
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not callable(other):
+            return self.not_implemented
+        deadline = time.monotonic() + self._timeout
+        delay = self._interval
+        while True:
+            value = other()
+            if (yield _Unrecorded(self._expected), value):
+                break
+            if (remaining := deadline - time.monotonic()) <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay *= self._backoff
+        return (yield self._expected, value)
+
+    def represent(self) -> str:
+        if self._compared_once:
+            return repr(self._expected)
+        return (
+            f"Eventually({self._expected!r}, timeout={self._timeout!r}, "
+            f"interval={self._interval!r}, backoff={self._backoff!r})"
+        )
+
+
+class _Timed(Matcher[tp.Callable[[], tp.Any]], ABC):
+    """Base class for matchers timing calls to a callable.
+
+    After a warmup, each call is timed separately with
+    :py:func:`time.perf_counter_ns`, and the given percentile of the durations
+    (by default the median, which ignores e.g. the occasional garbage
+    collection) is compared to the limit.
+    """
+
+    _repeatable = False
+
+    _transient = Matcher._transient | {"_samples"}
+
+    _percentile: float
+    _repeat: int
+    _samples: list[int]
+    _warmup: int
+
+    def __init__(self, *, repeat: int, warmup: int, percentile: float):
+        if repeat < 1:
+            raise ValueError("repeat must be at least one")
+        if warmup < 0:
+            raise ValueError("warmup cannot be negative")
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be greater than 0, at most 100")
+        super().__init__()
+        self._percentile = percentile
+        self._repeat = repeat
+        self._warmup = warmup
+
+    def compare(self, other: tp.Any) -> bool:
+        if not callable(other):
+            return self.not_implemented
+        for _ in range(self._warmup):
+            other()
+        samples = []
+        for _ in range(self._repeat):
+            start = time.perf_counter_ns()
+            other()
+            samples.append(time.perf_counter_ns() - start)
+        samples.sort()
+        self._samples = samples
+        rank = math.ceil(self._percentile / 100 * len(samples)) - 1
+        return self._accept(samples[max(rank, 0)] / 1e9)
+
+    def represent(self) -> str:
+        parameters = [
+            *self._describe(),
+            f"repeat={self._repeat!r}",
+            f"warmup={self._warmup!r}",
+            f"percentile={self._percentile!r}",
+        ]
+        if self._compared_once and self._samples:
+            measured = ", ".join(f"{value:.3g}" for value in self._measured())
+            parameters.append(f"measured=[{measured}]")
+        return f"{type(self).__name__}({', '.join(parameters)})"
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._samples = []
+
+    @abstractmethod
+    def _accept(self, duration: float) -> bool:
+        """Whether the duration (in seconds) of the percentile call is OK."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _describe(self) -> list[str]:
+        """The parameters specific to the matcher, for its representation."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _measured(self) -> list[float]:
+        """The distribution of the measurements, for its representation."""
+        raise NotImplementedError
+
+
+class CompletesWithin(_Timed):
+    """Matches any callable that completes within the time limit.
+
+    .. versionadded:: 0.10.0
+
+    :param seconds: the time limit
+    :param repeat: the number of calls to time
+    :param warmup: the number of calls to make (e.g. to fill caches) before
+        timing any
+    :param percentile: the percentile of the durations that must be within the
+        limit, e.g. ``90`` to require nine calls in ten to be fast enough
+
+    :raises ValueError: if the limit is negative, or any of the others are out
+        of range.
+
+    .. code-block:: python
+
+        assert partial(parse, document) == CompletesWithin(0.01)
+
+    After failing a single comparison, the matcher represents itself with the
+    sorted ``measured`` durations in seconds.
+    """
+
+    _seconds: float
+
+    def __init__(
+        self,
+        seconds: float,
+        /,
+        *,
+        repeat: int = 5,
+        warmup: int = 1,
+        percentile: float = 50,
+    ):
+        if seconds < 0:
+            raise ValueError("time limit cannot be negative")
+        super().__init__(repeat=repeat, warmup=warmup, percentile=percentile)
+        self._seconds = seconds
+
+    def _accept(self, duration: float) -> bool:
+        return duration <= self._seconds
+
+    def _describe(self) -> list[str]:
+        return [repr(self._seconds)]
+
+    def _measured(self) -> list[float]:
+        return [sample / 1e9 for sample in self._samples]
+
+
+class Throughput(_Timed):
+    """Matches any callable that can be called at least as often as required.
+
+    .. versionadded:: 0.10.0
+
+    :param at_least: the minimum number of calls per second
+    :param repeat: the number of calls to time
+    :param warmup: the number of calls to make before timing any
+    :param percentile: the percentile of the durations to convert to a rate
+
+    :raises ValueError: if the rate isn't positive, or any of the others are
+        out of range.
+
+    .. code-block:: python
+
+        assert partial(handler, request) == Throughput(at_least=1_000, repeat=100)
+
+    After failing a single comparison, the matcher represents itself with the
+    ``measured`` rates in calls per second, slowest first.
+    """
+
+    _at_least: float
+
+    def __init__(
+        self,
+        *,
+        at_least: float,
+        repeat: int = 5,
+        warmup: int = 1,
+        percentile: float = 50,
+    ):
+        if at_least <= 0:
+            raise ValueError("rate must be positive")
+        super().__init__(repeat=repeat, warmup=warmup, percentile=percentile)
+        self._at_least = at_least
+
+    def _accept(self, duration: float) -> bool:
+        return duration * self._at_least <= 1
+
+    def _describe(self) -> list[str]:
+        return [f"at_least={self._at_least!r}"]
+
+    def _measured(self) -> list[float]:
+        return [
+            1e9 / sample if sample else math.inf for sample in reversed(self._samples)
+        ]
+
+
+class AllocatesAtMost(Matcher[tp.Callable[[], tp.Any]]):
+    """Matches any callable that allocates at most the given number of bytes.
+
+    .. versionadded:: 0.10.0
+
+    :param size: the maximum peak allocation, in bytes
+    :param net: the maximum net allocation (i.e. memory still allocated once
+        the call returns and garbage has been collected), in bytes; e.g. ``0``
+        to check for leaks
+    :param traceback_limit: the number of frames to record for each
+        allocation, see :py:func:`tracemalloc.start`
+
+    :raises ValueError: if either size is negative, or the traceback limit
+        isn't positive.
+
+    The callable is called once under :py:mod:`tracemalloc` (started, if it
+    isn't already tracing, and stopped again afterwards):
+
+    .. code-block:: python
+
+        assert partial(cache.get, key) == AllocatesAtMost(1_024, net=0)
+
+    After failing a single comparison, the matcher represents itself with the
+    measured peak and net allocations, and the source lines (or tracebacks)
+    that allocated the most memory still held afterwards. Memory allocated and
+    freed again during the call counts towards the peak, but can't be
+    attributed to a line.
+    """
+
+    _TOP: tp.ClassVar[int] = 5
+    """The number of allocating lines to show."""
+
+    _repeatable = False
+
+    _transient = Matcher._transient | {"_measured"}
+
+    _measured: tp.Optional[tuple[int, int, list[str]]]
+    _net: tp.Optional[int]
+    _size: int
+    _traceback_limit: int
+
+    def __init__(
+        self,
+        size: int,
+        /,
+        *,
+        net: tp.Optional[int] = None,
+        traceback_limit: int = 1,
+    ):
+        if size < 0 or (net is not None and net < 0):
+            raise ValueError("allocation limits cannot be negative")
+        if traceback_limit < 1:
+            raise ValueError("traceback limit must be at least one")
+        super().__init__()
+        self._net = net
+        self._size = size
+        self._traceback_limit = traceback_limit
+
+    def compare(self, other: tp.Any) -> bool:
+        if not callable(other):
+            return self.not_implemented
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(self._traceback_limit)
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            other()
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            if started:
+                tracemalloc.stop()
+        differences = self._differences(after, before)
+        net = sum(stat.size_diff for stat in differences)
+        self._measured = peak, net, self._top(differences)
+        return peak <= self._size and (self._net is None or net <= self._net)
+
+    def represent(self) -> str:
+        parameters = [repr(self._size)]
+        if self._net is not None:
+            parameters.append(f"net={self._net!r}")
+        if self._traceback_limit != 1:
+            parameters.append(f"traceback_limit={self._traceback_limit!r}")
+        if self._compared_once and self._measured is not None:
+            peak, net, top = self._measured
+            parameters.append(f"measured_peak={peak!r}")
+            parameters.append(f"measured_net={net!r}")
+            parameters.append(f"top={top!r}")
+        return f"AllocatesAtMost({', '.join(parameters)})"
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._measured = None
+
+    def _differences(
+        self, after: tracemalloc.Snapshot, before: tracemalloc.Snapshot
+    ) -> list[tracemalloc.StatisticDiff]:
+        """The changes in allocations made by the callable, largest first.
+
+        Those made by :py:mod:`tracemalloc` and this matcher (e.g. to record
+        the measurements) are excluded.
+        """
+        ignored = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        key = "lineno" if self._traceback_limit == 1 else "traceback"
+        return after.filter_traces(ignored).compare_to(
+            before.filter_traces(ignored), key
+        )
+
+    def _top(self, differences: list[tracemalloc.StatisticDiff]) -> list[str]:
+        """Describe the allocations held afterwards, largest first."""
+        held = [stat for stat in differences if stat.size_diff > 0]
+        return [
+            " <- ".join(
+                f"{frame.filename}:{frame.lineno}" for frame in reversed(stat.traceback)
+            )
+            + f": {stat.size_diff:+d} B"
+            for stat in held[: self._TOP]
+        ]
@@ -1,11 +1,44 @@
 import typing as tp
 import warnings
 from abc import ABC
+from decimal import Decimal
+from fractions import Fraction
 
-from .core import Matcher
+from .core import (
+    Comparison,
+    Matcher,
+    MaybeMatcher,
+    _settle,
+    _shallow_depth,
+    _ShallowMatcher,
+    _structure,
+)
+from .numbers import _Range, _RangeIndex
+from .objects import Anything, Nothing
 
 T = tp.TypeVar("T")
 
+_INERT: frozenset[tp.Any] = frozenset(
+    type_.__eq__
+    for type_ in (
+        bytes,
+        complex,
+        Decimal,
+        dict,
+        float,
+        Fraction,
+        frozenset,
+        int,
+        list,
+        object,
+        set,
+        str,
+        tuple,
+    )
+)
+"""The ``__eq__`` methods that never claim a value is equal to a matcher that
+doesn't accept its type, so such matchers can be skipped."""
+
 
 class PointlessCompound(UserWarning):
     """Emitted if you create a compound matcher with a single child matcher."""
@@ -24,7 +57,13 @@ class ZeroMatchers(TypeError):
         super().__init__(self.MESSAGE)
 
 
-class _Compound(Matcher[T], tp.Generic[T], ABC):
+class _Compound(_ShallowMatcher[T], tp.Generic[T], ABC):
+
+    _absorbing: tp.ClassVar[type[Matcher[tp.Any]]]
+    """Matcher that decides the result on its own, whatever the others."""
+
+    _identity: tp.ClassVar[type[Matcher[tp.Any]]]
+    """Matcher that never affects the result."""
 
     _matchers: tuple[Matcher[T], ...]
 
@@ -35,22 +74,65 @@ class _Compound(Matcher[T], tp.Generic[T], ABC):
             warnings.warn(PointlessCompound.MESSAGE, PointlessCompound, stacklevel=2)
         super().__init__()
         self._matchers = matchers
+        self._shallow = _shallow_depth(matchers)
 
     def represent(self) -> str:
-        return f"{type(self).__name__}({', '.join(repr(m) for m in self._matchers)})"
+        children = ", ".join(repr(self._elide(m)) for m in self._matchers)
+        return f"{type(self).__name__}({children})"
+
+    @classmethod
+    def _combine(cls, *operands: Matcher[tp.Any]) -> Matcher[T]:
+        """Simplest equivalent of ``cls(*operands)``, for the operators."""
+        children: dict[tp.Hashable, Matcher[tp.Any]] = {}
+        pending = list(reversed(operands))
+        while pending:
+            matcher = pending.pop()
+            if type(matcher) is cls:
+                pending.extend(reversed(matcher._matchers))
+            elif type(matcher) is cls._absorbing:
+                return matcher
+            elif type(matcher) is not cls._identity:
+                children.setdefault(_structure(matcher, set()), matcher)
+        if not children:
+            return cls._identity()
+        if len(children) == 1:
+            (child,) = children.values()
+            return child
+        return cls(*children.values())
 
 
 class AllOf(_Compound[T]):
     """Matches values which match all of the child matchers.
 
     .. note:: Unlike :py:func:`all` this comparison is not lazy; all matchers
-        are compared, whether or not any are unequal.
+        are compared, whether or not any are unequal (unless the
+        :py:func:`~joythief.core.mismatch_budget` runs out).
     """
 
-    def compare(self, other: tp.Any) -> bool:
+    _absorbing = Nothing
+    _identity = Anything
+
+    def compare_children(self, other: tp.Any) -> Comparison:
         equal: bool = True
         for matcher in self._matchers:
-            if matcher != other:
+            if not (yield matcher, other):
+                equal = False
+        return equal
+
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        equal = True
+        start, budget = len(failures), self._budget
+        for matcher in self._matchers:
+            if budget is not None and len(failures) - start >= budget:
+                self._elided = True
+                return False
+            if not _settle(matcher, other, record, path, failures):
                 equal = False
         return equal
 
@@ -59,12 +141,137 @@ class AnyOf(_Compound[T]):
     """Matches values which match any of the child matchers.
 
     .. note:: Unlike :py:func:`any` this comparison is not lazy; all matchers
-        are compared, whether or not any are equal.
+        are compared, whether or not any are equal. However, where there are
+        many, matchers that can't match the value are skipped, so their
+        representations only reflect the values they were actually compared
+        to. This includes those that declare the types they accept (e.g.
+        :py:class:`~joythief.strings.JsonString`) for values of other types
+        and, where there are many numeric ranges (e.g.
+        :py:class:`~joythief.numbers.Between`), those not containing the value.
+        Values of other types than the built-in ones (e.g. mocks) may claim to
+        be equal to any matcher, so all matchers are compared to them.
     """
 
-    def compare(self, other: tp.Any) -> bool:
+    _DISPATCHED: tp.ClassVar[int] = 8
+    """The number of matchers from which to skip those that can't match."""
+
+    _INDEXED: tp.ClassVar[int] = 8
+    """The number of numeric ranges from which to index them."""
+
+    _provisional = True
+
+    _caches = frozenset({"_dispatch"})
+    _transient = _Compound._transient | _caches
+
+    _absorbing = Anything
+    _identity = Nothing
+
+    _dispatch: dict[
+        type[tp.Any], tuple[tuple[Matcher[T], ...], tp.Optional[_RangeIndex]]
+    ]
+
+    def compare_children(self, other: tp.Any) -> Comparison:
         equal: bool = False
-        for matcher in self._matchers:
-            if matcher == other:
+        for matcher in self._candidates(other):
+            if (yield matcher, other):
                 equal = True
         return equal
+
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        equal = False
+        for matcher in self._candidates(other):
+            if _settle(matcher, other, record, path, failures):
+                equal = True
+        return equal
+
+    def _candidates(self, other: tp.Any) -> tuple[Matcher[T], ...]:
+        """The matchers that may match ``other``."""
+        if len(self._matchers) < self._DISPATCHED:
+            return self._matchers
+        type_ = type(other)
+        if other.__class__ is not type_:  # e.g. a mock with a spec
+            return self._matchers
+        if (dispatch := self._dispatch.get(type_)) is None:
+            dispatch = self._dispatch[type_] = self._dispatch_type(type_)
+        compatible, index = dispatch
+        if index is None:
+            return compatible
+        return compatible + tp.cast(tuple[Matcher[T], ...], index.candidates(other))
+
+    def _dispatch_type(
+        self, type_: type[tp.Any]
+    ) -> tuple[tuple[Matcher[T], ...], tp.Optional[_RangeIndex]]:
+        """The matchers that may match values of the type, except any numeric
+        ranges that are indexed instead."""
+        if type_.__eq__ not in _INERT:
+            return self._matchers, None
+        compatible = [
+            matcher
+            for matcher in self._matchers
+            if (accepts := getattr(matcher, "_accepts", None)) is None
+            or issubclass(type_, accepts)
+        ]
+        ranges = [m for m in compatible if isinstance(m, _Range)]
+        if len(ranges) < self._INDEXED:
+            return tuple(compatible), None
+        return (
+            tuple(m for m in compatible if not isinstance(m, _Range)),
+            _RangeIndex(ranges),
+        )
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._dispatch = {}
+
+
+class Not(_ShallowMatcher[tp.Any]):
+    """Matches values which don't match the child value or matcher.
+
+    .. versionadded:: 0.10.0
+
+    Also available as ``~matcher``, which simplifies e.g. ``~~matcher`` to
+    ``matcher`` and ``~Anything()`` to ``Nothing()``.
+    """
+
+    _provisional = True
+
+    _value: tp.Any
+
+    def __init__(self, value: MaybeMatcher[tp.Any], /):
+        super().__init__()
+        self._value = value
+        self._shallow = _shallow_depth((value,))
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        return not (yield self._value, other)
+
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        return not _settle(self._value, other, record, path, failures)
+
+    def represent(self) -> str:
+        return f"Not({self._value!r})"
+
+    @classmethod
+    def _combine(cls, matcher: Matcher[tp.Any]) -> Matcher[tp.Any]:
+        """Simplest equivalent of ``Not(matcher)``, for the ``~`` operator."""
+        if type(matcher) is cls:
+            value = matcher._value
+            if isinstance(value, Matcher):
+                return value
+        elif type(matcher) is Anything:
+            return Nothing()
+        elif type(matcher) is Nothing:
+            return Anything()
+        return cls(matcher)
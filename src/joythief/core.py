@@ -1,13 +1,45 @@
 from __future__ import annotations
 
+import importlib
 import typing as tp
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum, auto
 
 if tp.TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
 T = tp.TypeVar("T")
+U = tp.TypeVar("U")
+M = tp.TypeVar("M", bound="Matcher[tp.Any]")
+
+
+class _Sentinel:
+    """A unique value that keeps its identity when pickled or copied.
+
+    :param module: the name of the module defining it
+    :param qualname: where it's defined in the module, e.g. ``"Class.NAME"``
+    """
+
+    def __init__(self, module: str, qualname: str, representation: str) -> None:
+        self._module = module
+        self._qualname = qualname
+        self._representation = representation
+
+    def __reduce__(self) -> tuple[tp.Any, ...]:
+        return _sentinel, (self._module, self._qualname)
+
+    def __repr__(self) -> str:
+        return self._representation
+
+
+def _sentinel(module: str, qualname: str) -> _Sentinel:
+    value: tp.Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return tp.cast(_Sentinel, value)
 
 
 class _MatcherState(Enum):
@@ -47,42 +79,136 @@ class Matcher(tp.Generic[T], ABC):
             def represent(self) -> str:
                 return super().represent()  # 'IsWelcoming()'
 
+    If :py:meth:`~joythief.core.Matcher.compare` only accepts certain types,
+    returning :py:const:`NotImplemented` for any other, declare them in the
+    ``_accepts`` class attribute (e.g. ``_accepts = (str,)``). This allows e.g.
+    :py:class:`~joythief.compound.AnyOf` to skip the comparison altogether.
+
+    Matchers can be pickled (e.g. to share expected values with
+    `pytest-xdist`_ workers or a :py:class:`~concurrent.futures.ProcessPoolExecutor`).
+    Only their configuration is included, so they unpickle as if they had never
+    been compared, unless pickled within :py:func:`retain_state`. The same
+    applies to :py:func:`copy.copy` and :py:func:`copy.deepcopy`.
+
+    .. versionchanged:: 0.10.0
+        Pickling and copying no longer include previous comparisons.
+
     .. _comparable for equality: https://docs.python.org/3/reference/datamodel.html#object.__eq__
+    .. _pytest-xdist: https://pytest-xdist.readthedocs.io/en/stable/
     .. _representation: https://docs.python.org/3/reference/datamodel.html#object.__repr__
     """
 
-    __PLACEHOLDER = object()
+    __PLACEHOLDER = _Sentinel(
+        __name__, "Matcher._Matcher__PLACEHOLDER", "<placeholder>"
+    )
+
+    _caches: tp.ClassVar[frozenset[str]] = frozenset()
+    """The transient attributes that only cache derived values, which are
+    never pickled."""
+
+    _accepts: tp.ClassVar[tp.Optional[tuple[type[tp.Any], ...]]] = None
+
+    _compares: tp.ClassVar[bool] = False
+    """Whether :py:meth:`compare` is overridden below the class defining how
+    comparisons are explained (e.g. to add a check), so must be called to have
+    the final say; see ``__init_subclass__``."""
+
+    _repeatable: tp.ClassVar[bool] = True
+    """Whether comparing again has no side effects (e.g. calling the value, or
+    consuming an iterator), so a comparison can be repeated to explain it."""
+
+    _transient: tp.ClassVar[frozenset[str]] = frozenset(
+        {"_compared_to", "_mismatches", "_state"}
+    )
 
     _compared_to: tp.Any
+    _mismatches: list[Mismatch]
     _state: _MatcherState
 
     def __init__(self, *args: tp.Any, **kwargs: tp.Any) -> None:
         super().__init__(*args, **kwargs)
-        self._compared_to = self.__PLACEHOLDER
-        self._state = _MatcherState.UNCOMPARED
+        self._forget()
+
+    def __init_subclass__(cls, **kwargs: tp.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        definer = next(
+            vars(base)
+            for base in cls.__mro__
+            if "compare" in vars(base) or "_explain" in vars(base)
+        )
+        cls._compares = "_explain" not in definer
 
     def __eq__(self, other: tp.Any) -> bool:
-        result = self.compare(other)
-        if self._state is _MatcherState.UNCOMPARED:
-            self._compared_to = other
-            self._state = (
-                _MatcherState.EQUAL_ONCE
-                if result is not NotImplemented and result
-                else _MatcherState.UNEQUAL_ONCE
-            )
-        elif other is not self._compared_to:
-            self._compared_to = self.__PLACEHOLDER
-            self._state = _MatcherState.OTHER
+        if self._compares:
+            result, self._mismatches = Matcher._explain(self, other)
+        else:
+            result, self._mismatches = self._explain(other)
+        self._record(other, result)
         return result
 
     def __ne__(self, other: tp.Any) -> bool:
         return not self == other
 
+    def __getstate__(self) -> dict[str, tp.Any]:
+        excluded = self._caches if _RETAIN_STATE.get() else self._transient
+        return {
+            name: attr for name, attr in self.__dict__.items() if name not in excluded
+        }
+
+    def __setstate__(self, state: dict[str, tp.Any]) -> None:
+        self._forget()
+        self.__dict__.update(state)
+
     def __repr__(self) -> str:
         if self._state is _MatcherState.EQUAL_ONCE:
             return repr(self._compared_to)
         return self.represent()
 
+    def __and__(self, other: Matcher[tp.Any]) -> Matcher[T]:
+        """Match values that match both, see :py:class:`~joythief.compound.AllOf`.
+
+        .. versionadded:: 0.10.0
+
+        Combining matchers with the operators ``&``, ``|`` and ``~`` builds the
+        simplest equivalent compound matcher: nested compounds of the same kind
+        are flattened, structurally identical children (same type and
+        configuration) are only included once, and
+        :py:class:`~joythief.objects.Anything` and
+        :py:class:`~joythief.objects.Nothing` are folded away:
+
+        .. code-block:: python
+
+            (InstanceOf(int) | InstanceOf(str)) | (InstanceOf(str) | Nothing())
+            # AnyOf(InstanceOf(<class 'int'>), InstanceOf(<class 'str'>))
+
+        As a result, an operand may not be compared at all.
+        """
+        if not isinstance(other, Matcher):
+            return NotImplemented
+        from .compound import AllOf
+
+        return AllOf._combine(self, other)
+
+    def __or__(self, other: Matcher[U]) -> Matcher[tp.Union[T, U]]:
+        """Match values that match either, see :py:class:`~joythief.compound.AnyOf`.
+
+        .. versionadded:: 0.10.0
+        """
+        if not isinstance(other, Matcher):
+            return NotImplemented
+        from .compound import AnyOf
+
+        return AnyOf[tp.Union[T, U]]._combine(self, other)
+
+    def __invert__(self) -> Matcher[tp.Any]:
+        """Match values that don't match, see :py:class:`~joythief.compound.Not`.
+
+        .. versionadded:: 0.10.0
+        """
+        from .compound import Not
+
+        return Not._combine(self)
+
     @abstractmethod
     def compare(self, other: tp.Any) -> bool:
         """Equivalent to  `__eq__`__.
@@ -99,6 +225,48 @@ class Matcher(tp.Generic[T], ABC):
         """
         return f"{type(self).__name__}()"
 
+    def mismatches(self) -> list[Mismatch]:
+        """The mismatches found by the last comparison using ``==``.
+
+        .. versionadded:: 0.10.0
+
+        These are collected during the comparison, see :py:func:`explain`. Only
+        the matcher that was directly compared has mismatches; those of any
+        children are included (with their paths) in its list.
+        """
+        return list(self._mismatches)
+
+    def clone(self: M) -> M:
+        """Create a copy of the matcher, as if it had never been compared.
+
+        .. versionadded:: 0.10.0
+
+        Child matchers are cloned too, but the values any of them were compared
+        to are never copied. Unlike :py:func:`copy.deepcopy`, which copies
+        everything else, any other configuration (e.g. expected values) is
+        shared with the original, which makes this much cheaper.
+        """
+        return tp.cast(M, _clone(self, {}))
+
+    def frozen(self) -> Frozen[T]:
+        """Create an immutable, hashable copy of the matcher.
+
+        .. versionadded:: 0.10.0
+
+        See :py:class:`Frozen`.
+        """
+        return Frozen(self)
+
+    def reset(self) -> None:
+        """Forget any previous comparisons, including those of child matchers.
+
+        .. versionadded:: 0.10.0
+
+        The matcher can then be reused, e.g. across parametrised test cases, and
+        will represent itself as if it had never been compared.
+        """
+        _reset(self, set())
+
     @property
     def not_implemented(self) -> bool:
         """The value :py:const:`NotImplemented`, force-cast to :py:class:`bool`.
@@ -114,6 +282,992 @@ class Matcher(tp.Generic[T], ABC):
     def _compared_once(self) -> bool:
         return self._state in {_MatcherState.EQUAL_ONCE, _MatcherState.UNEQUAL_ONCE}
 
+    def _record(self, other: tp.Any, result: bool) -> None:
+        if self._state is _MatcherState.UNCOMPARED:
+            self._compared_to = other
+            self._state = (
+                _MatcherState.EQUAL_ONCE
+                if result is not NotImplemented and result
+                else _MatcherState.UNEQUAL_ONCE
+            )
+        elif other is not self._compared_to:
+            self._compared_to = self.__PLACEHOLDER
+            self._state = _MatcherState.OTHER
+
+    def _absorb(self, state: dict[str, tp.Any]) -> None:
+        """Take the state of a copy compared elsewhere (e.g. in another
+        process), see :py:meth:`_retained`, as if this matcher had made the
+        same comparisons."""
+        previous, compared_to = self._state, self._compared_to
+        self.__dict__.update(state)
+        if previous is _MatcherState.UNCOMPARED:
+            return
+        if (
+            previous is _MatcherState.OTHER
+            or self._state is _MatcherState.OTHER
+            or self._compared_to is not compared_to
+        ):
+            self._compared_to = self.__PLACEHOLDER
+            self._state = _MatcherState.OTHER
+        else:
+            self._compared_to, self._state = compared_to, previous
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        result = self.compare(other)
+        if result is NotImplemented or not result:
+            return result, [Mismatch((), self, other)]
+        return result, []
+
+    def _retained(self) -> dict[str, tp.Any]:
+        """The transient attributes, other than caches."""
+        return {
+            name: attr
+            for name, attr in self.__dict__.items()
+            if name in self._transient and name not in self._caches
+        }
+
+    def _forget(self) -> None:
+        """Initialise the transient attributes recording comparisons.
+
+        Subclasses adding to ``_transient`` must extend this accordingly.
+        """
+        self._compared_to = self.__PLACEHOLDER
+        self._mismatches = []
+        self._state = _MatcherState.UNCOMPARED
+
+
+class ContainerMatcher(Matcher[T], tp.Generic[T], ABC):
+    """Abstract base class for matchers that compare child values.
+
+    .. versionadded:: 0.10.0
+
+    Rather than comparing child values (e.g. with ``==``) themselves, which
+    recurses once per level of nesting, container matchers implement
+    :py:meth:`compare_children` as a generator that *yields* each
+    ``(expected, actual)`` pair to be compared and is *sent* the result:
+
+    .. code-block:: python
+
+        import typing as tp
+
+        from joythief.core import Comparison, ContainerMatcher
+
+
+        class Pair(ContainerMatcher[tuple[tp.Any, tp.Any]]):
+
+            def __init__(self, first: tp.Any, second: tp.Any) -> None:
+                super().__init__()
+                self._first = first
+                self._second = second
+
+            def compare_children(self, other: tp.Any) -> Comparison:
+                if not isinstance(other, tuple) or len(other) != 2:
+                    return self.not_implemented
+                first = yield self._first, other[0], 0
+                second = yield self._second, other[1], 1
+                return first and second
+
+            def represent(self) -> str:
+                return f"Pair({self._first!r}, {self._second!r})"
+
+    The optional third item is the key (or index) of the actual value within
+    ``other``, used in the path of any :py:class:`Mismatch`; pairs are compared
+    at the same path as the container itself. Yield :py:data:`MISSING` as the
+    actual value if it doesn't exist, to report the mismatch without comparing.
+
+    All the comparisons are then driven from an explicit stack (only recursing
+    a few levels, for speed), so arbitrarily deep structures (e.g. those
+    matched by self-referential matchers) don't reach the recursion limit.
+    Plain :py:class:`list`, :py:class:`tuple` and :py:class:`dict` values are
+    unpacked in the same way; as for the built-in container matchers, these
+    comparisons are not lazy. Each child matcher
+    records its comparison exactly as if it had been compared with ``==``, and
+    a matcher that is already being compared to the same value further up the
+    stack (i.e. a reference cycle in the value) is assumed to be equal.
+
+    By default, any child mismatch is assumed to mean the container doesn't
+    match either. If that's not the case (e.g. the alternatives in
+    :py:class:`~joythief.compound.AnyOf`), set the ``_provisional`` class
+    attribute to :py:const:`True`; failures are then reported as a single
+    mismatch of the container itself, and child mismatches don't count towards
+    any :py:func:`mismatch_budget`.
+
+    A subclass (e.g. of :py:class:`~joythief.data_structures.DictContaining`)
+    can still override :py:meth:`~Matcher.compare`, e.g. to add a check. It
+    then has the final say, and the matcher is compared like any other, so a
+    failure is reported as a single mismatch of the matcher itself.
+    """
+
+    _provisional: tp.ClassVar[bool] = False
+
+    _transient = Matcher._transient | {"_elided"}
+
+    _budget: tp.Optional[int] = None
+    _elided: bool
+
+    _shallow: tp.Optional[int] = None
+    """How deeply shallow matchers are nested in this one, if it's a
+    :py:class:`_ShallowMatcher` and none of its children is any other kind of
+    container (see :py:func:`_shallow_depth`)."""
+
+    def compare(self, other: tp.Any) -> bool:
+        return self._explain(other)[0]
+
+    def limit_mismatches(self: C, limit: int) -> C:
+        """Stop comparing children once ``limit`` mismatches have been found.
+
+        .. versionadded:: 0.10.0
+
+        The matcher is returned, to allow e.g.:
+
+        .. code-block:: python
+
+            assert actual == EveryItem(InstanceOf(int)).limit_mismatches(10)
+
+        Any child matchers not compared as a result are represented as ``...``.
+        See also :py:func:`mismatch_budget`, to limit all comparisons.
+
+        :raises TypeError: if the matcher is provisional (e.g.
+            :py:class:`~joythief.compound.AnyOf`), as a later child may match.
+        :raises ValueError: if the limit is less than one.
+        """
+        if self._provisional:
+            raise TypeError(f"{type(self).__name__} cannot limit mismatches")
+        self._budget = _validate_budget(limit)
+        return self
+
+    @abstractmethod
+    def compare_children(self, other: tp.Any) -> Comparison:
+        """Generator comparing the children of the matcher to ``other``.
+
+        Yield ``(expected, actual)`` or ``(expected, actual, key)`` tuples, and
+        return the overall result.
+        """
+        raise NotImplementedError
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        return _evaluate(self.compare_children(other), self, other)
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._elided = False
+
+    def _elide(self, child: tp.Any) -> tp.Any:
+        """Replace the child with ``...`` if its comparison was elided."""
+        if (
+            self._elided
+            and isinstance(child, Matcher)
+            and child._state is _MatcherState.UNCOMPARED
+        ):
+            return ELIDED
+        return child
+
+
+class _ShallowMatcher(ContainerMatcher[T], tp.Generic[T], ABC):
+    """Base class for container matchers that can also compare their children
+    in place, without the overhead of the stack, when none of them is any
+    other kind of container.
+
+    Subclasses opt in by setting ``_shallow`` in ``__init__`` (see
+    :py:func:`_shallow_depth`), and implement :py:meth:`_compare_shallow` to
+    match :py:meth:`compare_children` exactly.
+    """
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        if self._shallow is not None and (
+            self._provisional or _MISMATCH_BUDGET.get() is None
+        ):
+            return self._explain_shallow(other)
+        return super()._explain(other)
+
+    def _explain_shallow(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        """Equivalent to :py:meth:`_explain`, via :py:meth:`_compare_shallow`."""
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]] = []
+        self._elided = False
+        result = self._compare_shallow(other, True, None, failures)
+        if result is not NotImplemented and result:
+            return result, []
+        if not failures or self._provisional:
+            return result, [Mismatch((), self, other)]
+        return result, [Mismatch(_keys(p), e, a) for p, e, a in failures]
+
+    @abstractmethod
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        """Compare the children in place, exactly as :py:meth:`compare_children`
+        would (each with :py:func:`_settle`).
+
+        Only used if ``_shallow`` is set, and no mismatch budget applies, so
+        must respect ``_budget`` (if it can be set) and set ``_elided``.
+        """
+        raise NotImplementedError
+
+
+class Frozen(ContainerMatcher[T], tp.Generic[T]):
+    """Immutable, hashable wrapper of a matcher.
+
+    .. versionadded:: 0.10.0
+
+    Matchers define ``__eq__`` to compare themselves to values, so they aren't
+    hashable; this wraps a :py:meth:`~Matcher.clone` of any matcher, also
+    copying any built-in containers (:py:class:`list`, :py:class:`tuple`,
+    :py:class:`dict`, :py:class:`set` and :py:class:`bytearray`) in its
+    configuration (e.g. expected values), to allow e.g.:
+
+    .. code-block:: python
+
+        expectations = {InstanceOf(int).frozen(), InstanceOf(int).frozen()}
+        assert len(expectations) == 1
+
+    It compares to other values exactly like the wrapped matcher, but two
+    frozen matchers are equal if the matchers they wrap have the same type and
+    configuration (ignoring any previous comparisons), and the hash is
+    consistent with that. Configuration that can't be hashed (e.g. a
+    :py:class:`set` of expected values) is compared by identity. Any other
+    values (e.g. instances of your own classes) are shared with the original,
+    so must not be changed while frozen. A frozen matcher can also be used as a
+    key in :py:class:`~joythief.data_structures.DictContaining`, to match any
+    key it is equal to.
+    """
+
+    _hash: int
+    _key: tp.Hashable
+    _matcher: Matcher[T]
+
+    def __init__(self, matcher: Matcher[T], /):
+        super().__init__()
+        clone = _clone(
+            matcher._matcher if isinstance(matcher, Frozen) else matcher, {}, True
+        )
+        key = _structure(clone, set())
+        object.__setattr__(self, "_hash", hash(key))
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_matcher", clone)
+
+    def __getstate__(self) -> dict[str, tp.Any]:
+        state = super().__getstate__()
+        # hashes of e.g. str differ between processes, so are recalculated
+        del state["_hash"], state["_key"]
+        return state
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __setstate__(self, state: dict[str, tp.Any]) -> None:
+        super().__setstate__(state)
+        key = _structure(self._matcher, set())
+        object.__setattr__(self, "_hash", hash(key))
+        object.__setattr__(self, "_key", key)
+
+    def __setattr__(self, name: str, value: tp.Any) -> None:
+        if name not in self._transient:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if isinstance(other, Frozen):
+            return self._key == other._key
+        return (yield self._matcher, other)
+
+    def frozen(self) -> Frozen[T]:
+        return self
+
+    def represent(self) -> str:
+        return repr(self._matcher)
+
+
+ELIDED: tp.Final[tp.Any] = _Sentinel(__name__, "ELIDED", "...")
+"""Represents values that weren't compared, see :py:func:`mismatch_budget`.
+
+.. versionadded:: 0.10.0
+"""
+
+
+C = tp.TypeVar("C", bound=ContainerMatcher[tp.Any])
+
+_MISMATCH_BUDGET: ContextVar[tp.Optional[int]] = ContextVar(
+    "mismatch_budget", default=None
+)
+
+
+@contextmanager
+def mismatch_budget(limit: tp.Optional[int]) -> Iterator[None]:
+    """Stop comparing once ``limit`` mismatches have been found.
+
+    .. versionadded:: 0.10.0
+
+    Container matchers are not lazy, so that the representation of every child
+    can be resolved, but this means a badly broken value takes as long to fail
+    as to pass. Within this context, comparisons stop as soon as ``limit``
+    definite mismatches have been found (i.e. not those of e.g. alternatives
+    in :py:class:`~joythief.compound.AnyOf`, which may yet match). Use
+    :py:const:`None` for no limit; ``mismatch_budget(1)`` fails fast.
+
+    .. code-block:: python
+
+        with mismatch_budget(10):
+            assert actual == expected
+
+    To apply a budget to a whole test suite, use e.g. an autouse fixture.
+    See also :py:meth:`ContainerMatcher.limit_mismatches`.
+
+    :raises ValueError: if the limit is less than one.
+    """
+    token = _MISMATCH_BUDGET.set(None if limit is None else _validate_budget(limit))
+    try:
+        yield
+    finally:
+        _MISMATCH_BUDGET.reset(token)
+
+
+def _validate_budget(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("mismatch budget must be at least one")
+    return limit
+
+
+_RETAIN_STATE: ContextVar[bool] = ContextVar("retain_state", default=False)
+
+
+@contextmanager
+def retain_state() -> Iterator[None]:
+    """Include previous comparisons when pickling or copying matchers.
+
+    .. versionadded:: 0.10.0
+
+    By default, only the configuration of a matcher is pickled. Within this
+    context, the values it was compared to and the mismatches found are
+    included too, so e.g. a matcher compared in another process represents
+    itself the same way once unpickled:
+
+    .. code-block:: python
+
+        with retain_state():
+            data = pickle.dumps(matcher)
+
+    The compared values must therefore be picklable. Cached values (e.g. of
+    :py:class:`~joythief.objects.InstanceOf` decisions) are never included.
+    """
+    token = _RETAIN_STATE.set(True)
+    try:
+        yield
+    finally:
+        _RETAIN_STATE.reset(token)
+
+
+class Mismatch(tp.NamedTuple):
+    """A value that did not match, as reported by :py:func:`explain`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    path: tuple[tp.Any, ...]
+    """The keys (or indices) leading from the compared value to the mismatch."""
+
+    expected: tp.Any
+    """The matcher (or other value) that did not match."""
+
+    actual: tp.Any
+    """The value it was compared to, or :py:data:`MISSING`."""
+
+
+MISSING: tp.Final[tp.Any] = _Sentinel(__name__, "MISSING", "MISSING")
+"""Stands in for a value that is not present, e.g. a key absent from a mapping.
+
+.. versionadded:: 0.10.0
+"""
+
+
+def explain(expected: tp.Any, actual: tp.Any) -> list[Mismatch]:
+    """Compare the values, as ``expected == actual``, listing the mismatches.
+
+    .. versionadded:: 0.10.0
+
+    The mismatches are collected during the comparison itself, without a
+    second traversal or rendering the compared values:
+
+    .. code-block:: python
+
+        >>> explain(DictContaining(foo=[InstanceOf(int)], bar=123), dict(foo=["baz"]))
+        [Mismatch(path=('foo', 0), expected=InstanceOf(<class 'int'>), actual='baz'),
+         Mismatch(path=('bar',), expected=123, actual=MISSING)]
+
+    An empty list means the values are equal.
+    """
+    result, mismatches = _evaluate(_pass_through(expected, actual), None, actual)
+    if isinstance(expected, Matcher):
+        expected._mismatches = mismatches
+    return mismatches
+
+
+class _Unrecorded(tp.NamedTuple):
+    """Yield in place of a child to compare it without recording any state."""
+
+    expected: tp.Any
+
+
+class _Precomputed(tp.NamedTuple):
+    """Yield in place of a child already compared elsewhere, e.g. in another
+    process, to record the outcome as if it had been compared here.
+
+    If the comparison is being recorded, each matcher absorbs its state (see
+    :py:meth:`Matcher._absorb`), and the mismatches are added under the
+    child's path.
+    """
+
+    result: bool
+    mismatches: list[Mismatch]
+    states: list[tuple[Matcher[tp.Any], dict[str, tp.Any]]]
+
+
+_RECURSIVE_DEPTH = 16
+"""The depth to which nested comparisons are driven recursively, before
+continuing from the explicit stack in :py:func:`_evaluate`."""
+
+
+def _evaluate(
+    comparison: Comparison,
+    expected: tp.Any,
+    actual: tp.Any,
+) -> tuple[bool, list[Mismatch]]:
+    budget = _MISMATCH_BUDGET.get()
+    if isinstance(expected, ContainerMatcher):
+        is_matcher, provisional = True, expected._provisional
+        cap = _cap(0, expected._budget, None if provisional else budget)
+    else:
+        is_matcher, provisional, cap = False, False, budget
+    evaluation = _Evaluation(expected, actual)
+    mismatches, suspended = evaluation.mismatches, evaluation.suspended
+    elided, result = evaluation.drive(
+        comparison, None, None, cap, None if provisional else budget, True, 0
+    )
+    if elided is not None:
+        # nothing was nested too deeply, so the stack is never set up
+        if is_matcher:
+            expected._elided = elided
+        if result is not NotImplemented and result:
+            return result, []
+        if expected is not None and (not mismatches or provisional):
+            return result, [Mismatch((), expected, actual)]
+        return result, [Mismatch(_keys(p), e, a) for p, e, a in mismatches]
+    frames: list[_Frame] = [
+        (comparison, expected, actual, True, is_matcher, None, 0, cap, provisional)
+    ]
+    provisional_frames = int(provisional)
+    while True:
+        if elided is None:
+            # the innermost comparison has just started, the others are waiting
+            # for the result of the one within them
+            for frame in reversed(suspended):
+                frames.append(frame)
+                provisional_frames += frame[8]
+            suspended.clear()
+            result = None
+        else:
+            (
+                comparison,
+                expected,
+                actual,
+                record,
+                is_matcher,
+                path,
+                start,
+                cap,
+                provisional,
+            ) = frames.pop()
+            if is_matcher:
+                expected._elided = elided
+                if frames:
+                    if record:
+                        expected._record(actual, result)
+                    result = (
+                        _resolve(expected, actual)
+                        if result is NotImplemented
+                        else bool(result)
+                    )
+            if record:
+                if result is not NotImplemented and result:
+                    del mismatches[start:]
+                elif expected is not None and (len(mismatches) == start or provisional):
+                    del mismatches[start:]
+                    mismatches.append((path, expected, actual))
+            if not frames:
+                return tp.cast(bool, result), [
+                    Mismatch(_keys(path), expected, actual)
+                    for path, expected, actual in mismatches
+                ]
+            evaluation.active.discard((id(expected), id(actual)))
+            provisional_frames -= provisional
+        comparison, _, _, record, _, path, _, cap, _ = frames[-1]
+        elided, result = evaluation.drive(
+            comparison,
+            result,
+            path,
+            cap,
+            None if provisional_frames else budget,
+            record,
+            0,
+        )
+
+
+class _Evaluation:
+    """The state of one call of :py:func:`_evaluate`, shared by every
+    comparison it drives."""
+
+    __slots__ = ("active", "mismatches", "suspended")
+
+    active: set[tuple[int, int]]
+    """The IDs of the ``(expected, actual)`` pairs being compared, so that a
+    reference cycle in the value is detected."""
+
+    mismatches: list[tuple[tp.Any, tp.Any, tp.Any]]
+    """The ``(path, expected, actual)`` mismatches found so far."""
+
+    suspended: list[_Frame]
+    """The frames waiting for a comparison that had to be started on the
+    stack, innermost first."""
+
+    def __init__(self, expected: tp.Any, actual: tp.Any) -> None:
+        self.active = {(id(expected), id(actual))}
+        self.mismatches = []
+        self.suspended = []
+
+    def drive(
+        self,
+        comparison: Comparison,
+        result: tp.Any,
+        path: tp.Any,
+        cap: tp.Optional[int],
+        budget: tp.Optional[int],
+        record: bool,
+        depth: int,
+    ) -> tuple[tp.Optional[bool], tp.Any]:
+        """Resume the comparison, sending it the result of the last child, and
+        drive it to the end, stopping once there are ``cap`` mismatches.
+
+        Nested comparisons are driven recursively, so a frame on the explicit
+        stack is only needed for those more than :py:data:`_RECURSIVE_DEPTH`
+        levels deep. Returns whether the comparison was elided and the result
+        once it's finished or, if a nested comparison had to be started on the
+        stack, ``None``, having added the frames of all those waiting for it to
+        ``suspended``.
+        """
+        kinds = _KINDS
+        mismatches = self.mismatches
+        send = comparison.send
+        # the cap only needs checking after any mismatches are added
+        exhausted = result is not None and cap is not None and len(mismatches) >= cap
+        while True:
+            if exhausted:
+                comparison.close()
+                return True, False
+            try:
+                child_tuple = send(result)
+            except StopIteration as stop:
+                return False, stop.value
+            child = child_tuple[0]
+            value = child_tuple[1]
+            if (kind := kinds.get(type(child))) is None:
+                kind = _kind(type(child))
+            child_record = record
+            while kind is _Kind.UNRECORDED:
+                child, child_record = child.expected, False
+                if (kind := kinds.get(type(child))) is None:
+                    kind = _kind(type(child))
+            if value is MISSING:
+                result = False
+            elif kind is _Kind.MATCHER:
+                result = child.compare(value)
+                if child_record:
+                    child._record(value, result)
+                if result is NotImplemented:
+                    result = _resolve(child, value)
+                elif result is not True:
+                    result = bool(result)
+            elif kind is _Kind.VALUE:
+                result = child == value
+                if result is not True:
+                    result = bool(result)
+            elif kind is _Kind.PRECOMPUTED:
+                result = child.result
+                if child_record:
+                    for matcher, state in child.states:
+                        matcher._absorb(state)
+                    child_path = _child_path(path, child_tuple)
+                    for mismatch in child.mismatches:
+                        mismatch_path = child_path
+                        for key in mismatch.path:
+                            mismatch_path = (mismatch_path, key)
+                        mismatches.append((mismatch_path, *mismatch[1:]))
+                    exhausted = cap is not None and len(mismatches) >= cap
+                continue
+            elif (
+                kind is _Kind.CONTAINER
+                and child._shallow is not None
+                and (budget is None or child._provisional)
+            ):
+                result = _settle(
+                    child,
+                    value,
+                    child_record,
+                    _child_path(path, child_tuple),
+                    mismatches if child_record else [],
+                )
+                exhausted = cap is not None and len(mismatches) >= cap
+                continue
+            elif (key := (id(child), id(value))) in self.active:
+                result = True
+            else:
+                child_path = _child_path(path, child_tuple)
+                nested_start = len(mismatches)
+                is_matcher = kind is _Kind.CONTAINER
+                if is_matcher:
+                    nested = child.compare_children(value)
+                    provisional = child._provisional
+                    nested_budget = None if provisional else budget
+                    nested_cap = _cap(nested_start, child._budget, nested_budget)
+                else:
+                    nested = _compare_plain(child, value)
+                    provisional, nested_budget, nested_cap = False, budget, budget
+                self.active.add(key)
+                if depth < _RECURSIVE_DEPTH:
+                    elided, result = self.drive(
+                        nested,
+                        None,
+                        child_path,
+                        nested_cap,
+                        nested_budget,
+                        child_record,
+                        depth + 1,
+                    )
+                else:
+                    elided = None
+                if elided is None:
+                    self.suspended.append(
+                        (
+                            nested,
+                            child,
+                            value,
+                            child_record,
+                            is_matcher,
+                            child_path,
+                            nested_start,
+                            nested_cap,
+                            provisional,
+                        )
+                    )
+                    return None, None
+                self.active.discard(key)
+                if is_matcher:
+                    child._elided = elided
+                    if child_record:
+                        child._record(value, result)
+                    if result is NotImplemented:
+                        result = _resolve(child, value)
+                result = bool(result)
+                if child_record:
+                    if result:
+                        del mismatches[nested_start:]
+                    elif len(mismatches) == nested_start or provisional:
+                        del mismatches[nested_start:]
+                        mismatches.append((child_path, child, value))
+                    exhausted = cap is not None and len(mismatches) >= cap
+                continue
+            if not result and child_record:
+                if len(child_tuple) == 3:
+                    mismatches.append(((path, child_tuple[2]), child, value))
+                else:
+                    mismatches.append((path, child, value))
+                exhausted = cap is not None and len(mismatches) >= cap
+
+
+def _cap(
+    start: int, limit: tp.Optional[int], budget: tp.Optional[int]
+) -> tp.Optional[int]:
+    """The number of mismatches at which a comparison stops, given how many
+    there were before it, its own limit and the mismatch budget."""
+    if limit is None:
+        return budget
+    if budget is None:
+        return start + limit
+    return min(start + limit, budget)
+
+
+def _child_path(path: tp.Any, child_tuple: tp.Any) -> tp.Any:
+    """The path to the yielded child, which only has a key if one is included."""
+    return (path, child_tuple[2]) if len(child_tuple) == 3 else path
+
+
+class _Kind(Enum):
+    VALUE = auto()
+    MATCHER = auto()
+    CONTAINER = auto()
+    PLAIN_CONTAINER = auto()
+    UNRECORDED = auto()
+    PRECOMPUTED = auto()
+
+
+_KINDS: dict[type[tp.Any], _Kind] = {}
+
+
+def _kind(type_: type[tp.Any]) -> _Kind:
+    # a container matcher that overrides compare is compared by calling it
+    if issubclass(type_, ContainerMatcher) and not type_._compares:
+        kind = _Kind.CONTAINER
+    elif issubclass(type_, Matcher):
+        kind = _Kind.MATCHER
+    elif type_ is _Unrecorded:
+        kind = _Kind.UNRECORDED
+    elif type_ is _Precomputed:
+        kind = _Kind.PRECOMPUTED
+    elif type_ in {dict, list, tuple}:
+        kind = _Kind.PLAIN_CONTAINER
+    else:
+        kind = _Kind.VALUE
+    _KINDS[type_] = kind
+    return kind
+
+
+def _keys(path: tp.Any) -> tuple[tp.Any, ...]:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    return tuple(reversed(keys))
+
+
+def _pass_through(expected: tp.Any, actual: tp.Any) -> Comparison:
+    return (yield expected, actual)
+
+
+def _shallow_depth(children: tp.Iterable[tp.Any]) -> tp.Optional[int]:
+    """How deeply the shallow matchers among the children are nested, or
+    ``None`` if any is another kind of container, or they're nested too deeply
+    to compare recursively."""
+    depth = 1
+    for child in children:
+        if (kind := _KINDS.get(type(child))) is None:
+            kind = _kind(type(child))
+        if kind is _Kind.CONTAINER:
+            if child._shallow is None or child._shallow >= _RECURSIVE_DEPTH:
+                return None
+            depth = max(depth, child._shallow + 1)
+        elif kind is not _Kind.MATCHER and kind is not _Kind.VALUE:
+            return None
+    return depth
+
+
+def _settle(
+    child: tp.Any,
+    value: tp.Any,
+    record: bool,
+    path: tp.Any,
+    failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+) -> bool:
+    """Compare a child of a shallow matcher in place, exactly as it would be
+    from the stack, adding any mismatches (of it or its own children) to
+    ``failures`` in the same form as :py:func:`_evaluate`."""
+    if (kind := _KINDS.get(type(child))) is None:
+        kind = _kind(type(child))
+    if value is MISSING:
+        result = False
+    elif kind is _Kind.MATCHER:
+        result = child.compare(value)
+        if record:
+            child._record(value, result)
+        result = _resolve(child, value) if result is NotImplemented else bool(result)
+    elif kind is _Kind.CONTAINER:
+        start = len(failures)
+        child._elided = False
+        result = child._compare_shallow(value, record, path, failures)
+        if record:
+            child._record(value, result)
+        result = _resolve(child, value) if result is NotImplemented else bool(result)
+        if result:
+            del failures[start:]
+        elif len(failures) == start or child._provisional:
+            del failures[start:]
+            failures.append((path, child, value))
+        return result
+    else:
+        result = bool(child == value)
+    if not result:
+        failures.append((path, child, value))
+    return result
+
+
+def _resolve(expected: Matcher[tp.Any], actual: tp.Any) -> bool:
+    """Emulate ``==`` falling back to the reflected operation."""
+    result = actual.__eq__(expected)
+    if result is NotImplemented:
+        return expected is actual
+    return bool(result)
+
+
+def _compare_plain(expected: tp.Any, actual: tp.Any) -> Comparison:
+    """Generator equivalent to ``==`` for the plain container types."""
+    if type(actual) is not type(expected) or len(actual) != len(expected):
+        return bool(expected == actual)
+    equal = True
+    if type(expected) is dict:
+        for key, item in expected.items():
+            other = actual.get(key, MISSING)
+            if item is not other and not (yield item, other, key):
+                equal = False
+        return equal
+    for index, (item, other) in enumerate(zip(expected, actual)):
+        if item is not other and not (yield item, other, index):
+            equal = False
+    return equal
+
+
+def _clone(value: tp.Any, memo: dict[int, tp.Any], snapshot: bool = False) -> tp.Any:
+    """Clone the matchers in ``value``, sharing any other values unless taking a
+    ``snapshot``, which copies built-in containers (e.g. expected values)."""
+    if isinstance(value, Matcher):
+        if (existing := memo.get(id(value))) is not None:
+            return existing
+        type_ = type(value)
+        clone = type_.__new__(type_)
+        memo[id(value)] = clone
+        transient = type_._transient
+        clone.__dict__.update(
+            (name, _clone(attr, memo, snapshot))
+            for name, attr in value.__dict__.items()
+            if name not in transient
+        )
+        if isinstance(value, dict):
+            pairs = (
+                (key, _clone(item, memo, snapshot)) for key, item in dict.items(value)
+            )
+            dict.update(tp.cast(dict[tp.Any, tp.Any], clone), pairs)
+        clone._forget()
+        return clone
+    if type(value) in {list, tuple}:
+        items = [_clone(item, memo, snapshot) for item in value]
+        if not snapshot and all(new is old for new, old in zip(items, value)):
+            return value
+        return type(value)(items)
+    if type(value) is dict:
+        values = {key: _clone(item, memo, snapshot) for key, item in value.items()}
+        if not snapshot and all(values[key] is item for key, item in value.items()):
+            return value
+        return values
+    if snapshot and type(value) in {set, bytearray}:
+        return type(value)(value)
+    return value
+
+
+def _reset(value: tp.Any, seen: set[int]) -> None:
+    if id(value) in seen:
+        return
+    seen.add(id(value))
+    if isinstance(value, Matcher):
+        value._forget()
+        transient = type(value)._transient
+        for name, attr in value.__dict__.items():
+            if name not in transient:
+                _reset(attr, seen)
+        if isinstance(value, dict):
+            for item in dict.values(value):
+                _reset(item, seen)
+    elif type(value) in {list, tuple}:
+        for item in value:
+            _reset(item, seen)
+    elif type(value) is dict:
+        for item in value.values():
+            _reset(item, seen)
+
+
+def _is_repeatable(value: tp.Any) -> bool:
+    """Whether the value, and any matchers it contains, can be compared again
+    without side effects (see ``Matcher._repeatable``)."""
+    stack, seen = [value], set()
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, Matcher):
+            if not value._repeatable:
+                return False
+            transient = type(value)._transient
+            stack.extend(
+                attr for name, attr in value.__dict__.items() if name not in transient
+            )
+            if isinstance(value, dict):
+                stack.extend(dict.values(value))
+        elif type(value) in {list, tuple}:
+            stack.extend(value)
+        elif type(value) is dict:
+            stack.extend(value.values())
+    return True
+
+
+class _Identity(tp.NamedTuple):
+    id: int
+
+
+def _structure(value: tp.Any, active: set[int]) -> tp.Hashable:
+    """Key that is equal for values with the same type and configuration.
+
+    Transient attributes are ignored, so comparisons don't affect the key.
+    Values that can't be hashed (or contain themselves) are keyed by identity.
+    """
+    if isinstance(value, Matcher) or type(value) in {list, tuple, dict}:
+        if id(value) in active:
+            return _Identity(id(value))
+        active.add(id(value))
+        key: tuple[tp.Any, ...]
+        if isinstance(value, Matcher):
+            transient = type(value)._transient
+            key = (
+                type(value),
+                frozenset(
+                    (name, _structure(attr, active))
+                    for name, attr in value.__dict__.items()
+                    if name not in transient
+                ),
+            )
+            if isinstance(value, dict):
+                key += (_structure(dict(dict.items(value)), active),)
+        elif type(value) is dict:
+            key = (
+                dict,
+                frozenset((k, _structure(item, active)) for k, item in value.items()),
+            )
+        else:
+            key = (type(value), tuple(_structure(item, active) for item in value))
+        active.discard(id(value))
+        return key
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(id(value))
+    return type(value), value
+
 
 MaybeMatcher: TypeAlias = tp.Union[T, Matcher[T]]
 """Either ``T`` or a matcher of ``T``."""
+
+Comparison: TypeAlias = tp.Generator[
+    tp.Union[tuple[tp.Any, tp.Any], tuple[tp.Any, tp.Any, tp.Any]], bool, bool
+]
+"""Generator of ``(expected, actual)`` pairs, see
+:py:class:`~joythief.core.ContainerMatcher`.
+
+.. versionadded:: 0.10.0
+"""
+
+_Frame: TypeAlias = tuple[
+    Comparison, tp.Any, tp.Any, bool, bool, tp.Any, int, tp.Optional[int], bool
+]
+"""A comparison on the stack in :py:func:`_evaluate`, with its expected and
+actual values, whether it's recorded, whether it's a matcher's, its path, the
+number of mismatches before it and at which it stops, and whether it's
+provisional."""
@@ -1,14 +1,53 @@
+import asyncio
 import itertools
+import json
+import operator
+import re
 import typing as tp
-from collections.abc import Hashable, Iterable, Iterator, Mapping
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from functools import lru_cache
 
-from .core import Matcher, MaybeMatcher
+from .core import (
+    _KINDS,
+    _MISMATCH_BUDGET,
+    ELIDED,
+    MISSING,
+    Comparison,
+    ContainerMatcher,
+    Frozen,
+    Matcher,
+    MaybeMatcher,
+    Mismatch,
+    _evaluate,
+    _Kind,
+    _kind,
+    _resolve,
+    _settle,
+    _shallow_depth,
+    _ShallowMatcher,
+    _Unrecorded,
+)
 from .objects import Nothing
 
 T = tp.TypeVar("T")
 
+_NAME = re.compile(r'[^.\[\]"]+')
+_SEGMENT = re.compile(r'\.([^.\[\]"]+)|\[(-?\d+)\]|\[("(?:[^"\\]|\\.)*")\]')
 
-class DictContaining(Matcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any]):
+
+class DictContaining(
+    _ShallowMatcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any]
+):
     """Match the specified keys in a mapping, ignoring any extra keys.
 
     :param content: mapping or iterable of key-value pairs to include in the
@@ -23,6 +62,9 @@ class DictContaining(Matcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any])
 
     .. versionchanged:: 0.8.0 added :py:meth:`optionally`.
 
+    .. versionchanged:: 0.10.0 a :py:class:`~joythief.core.Frozen` matcher key
+        matches the first key in the mapping it's equal to.
+
     .. code-block:: python
 
         assert (
@@ -49,6 +91,11 @@ class DictContaining(Matcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any])
 
     """
 
+    _accepts = (Mapping,)
+
+    # combine matchers, rather than merging mappings
+    __or__ = ContainerMatcher.__or__  # type: ignore[assignment]
+
     @tp.overload
     def __init__(self, /, **kwargs: tp.Any) -> None: ...
 
@@ -85,21 +132,30 @@ class DictContaining(Matcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any])
             )
         return own_keys
 
-    def compare(self, other: tp.Any) -> bool:
+    def compare_children(self, other: tp.Any) -> Comparison:
         if not isinstance(other, Mapping):
             return self.not_implemented
         is_equal: bool = True
         for key, value in self.items():
             if key in other:
-                if self[key] != other[key]:
+                if not (yield value, other[key], key):
+                    is_equal = False
+            elif isinstance(key, Frozen) and (
+                (actual := next((k for k in other if key == k), MISSING)) is not MISSING
+            ):
+                if not (yield value, other[actual], actual):
                     is_equal = False
             elif isinstance(value, _OptionalKey):
                 _ = value == Nothing()
             else:
+                yield value, MISSING, key
                 is_equal = False
         return is_equal
 
     def represent(self) -> str:
+        if self._elided:
+            elided = {key: self._elide(value) for key, value in dict.items(self)}
+            return f"DictContaining(**{elided!r})"
         return f"DictContaining(**{dict.__repr__(self)})"
 
     @staticmethod
@@ -133,17 +189,874 @@ class DictContaining(Matcher[Mapping[Hashable, tp.Any]], dict[Hashable, tp.Any])
     def _compared_to_mapping(self) -> bool:
         return self._compared_once and isinstance(self._compared_to, Mapping)
 
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        # the values can change (e.g. to refer to the matcher itself), so
+        # whether they're shallow is checked every time
+        if (
+            _MISMATCH_BUDGET.get() is None
+            and _shallow_depth(dict.values(self)) is not None
+        ):
+            return self._explain_shallow(other)
+        return super()._explain(other)
 
-class _OptionalKey(Matcher[T]):
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        if not isinstance(other, Mapping):
+            return self.not_implemented
+        is_equal = True
+        start, budget = len(failures), self._budget
+        for key, value in self.items():
+            if budget is not None and len(failures) - start >= budget:
+                self._elided = True
+                return False
+            if key in other:
+                actual = key
+            elif isinstance(key, Frozen) and (
+                (actual := next((k for k in other if key == k), MISSING)) is not MISSING
+            ):
+                pass
+            elif isinstance(value, _OptionalKey):
+                _ = value == Nothing()
+                continue
+            else:
+                _settle(value, MISSING, record, (path, key), failures)
+                is_equal = False
+                continue
+            if not _settle(value, other[actual], record, (path, actual), failures):
+                is_equal = False
+        return is_equal
+
+
+class _OptionalKey(_ShallowMatcher[T]):
 
     _value: MaybeMatcher[T]
 
     def __init__(self, value: MaybeMatcher[T], /):
         super().__init__()
         self._value = value
+        self._shallow = _shallow_depth((value,))
 
-    def compare(self, other: tp.Any) -> bool:
-        return tp.cast(bool, self._value == other)
+    def compare_children(self, other: tp.Any) -> Comparison:
+        return (yield self._value, other)
+
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
+        return _settle(self._value, other, record, path, failures)
 
     def represent(self) -> str:
         return f"DictContaining.optionally({self._value!r})"
+
+
+class _Branch(ContainerMatcher[tp.Any]):
+    """Node of the trie of paths in :py:class:`AtPath`, matching the values at
+    the paths below it (relative to the value it's compared to)."""
+
+    _children: dict[Hashable, list[tp.Any]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._children = {}
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not isinstance(other, (Mapping, Sequence)) or isinstance(
+            other, (str, bytes)
+        ):
+            return self.not_implemented
+        equal = True
+        for key, children in self._children.items():
+            # looked up once, however many paths share this prefix
+            value = _lookup(other, key)
+            for child in children:
+                if not (yield child, value, key):
+                    equal = False
+        return equal
+
+    def represent(self) -> str:
+        return f"AtPath({dict(self._paths(()))!r})"
+
+    def _add(self, keys: tuple[Hashable, ...], expected: tp.Any) -> None:
+        node = self
+        for key in keys[:-1]:
+            children = node._children.setdefault(key, [])
+            branch = next((c for c in children if type(c) is _Branch), None)
+            if branch is None:
+                branch = _Branch()
+                children.append(branch)
+            node = branch
+        node._children.setdefault(keys[-1], []).append(expected)
+
+    def _paths(self, prefix: tuple[Hashable, ...]) -> Iterator[tuple[str, tp.Any]]:
+        for key, children in self._children.items():
+            for child in children:
+                if type(child) is _Branch:
+                    yield from child._paths((*prefix, key))
+                else:
+                    yield _format((*prefix, key)), child
+
+
+class AtPath(_Branch):
+    """Match the values at the specified paths in a document (e.g. parsed
+    JSON), ignoring everything else.
+
+    :param path: the path of the value to match
+    :param expected: the value or matcher it must match
+    :param paths: mapping of paths to the values or matchers they must match,
+        instead of a single path
+
+    :raises ValueError: if no paths are specified, or any is invalid.
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert actual == AtPath("data.items[0].id", InstanceOf(int))
+        assert actual == AtPath(
+            {
+                "data.items[0].id": InstanceOf(int),
+                "data.items[-1].id": InstanceOf(int),
+                'data.links["next page"]': UrlString(scheme="https"),
+            }
+        )
+
+    Each path is a key, then any number of ``.key``, ``[index]`` (an integer,
+    possibly negative) or ``["key"]`` (a JSON string, for keys that contain
+    e.g. ``.`` or ``[``) segments. Keys (and indices) are looked up in
+    mappings, and indices in sequences (but not strings); any other value
+    doesn't match, and a path that doesn't exist is reported against
+    :py:data:`~joythief.core.MISSING`. Paths are parsed once (and cached), and
+    those with a common prefix share a single lookup of it, so matching many
+    values in a large document only visits the parts leading to them.
+
+    **Note**: like the matchers in :py:mod:`joythief.compound`, this
+    comparison is not lazy; every path is compared, whether or not any are
+    unequal. Mismatches are reported at the full path of the value, and a
+    missing (or unmatchable) prefix against the paths below it.
+    """
+
+    _expected: list[tuple[str, tp.Any]]
+    _single: bool
+
+    @tp.overload
+    def __init__(self, path: str, expected: tp.Any, /) -> None: ...
+
+    @tp.overload
+    def __init__(self, paths: Mapping[str, tp.Any], /) -> None: ...
+
+    def __init__(self, paths: tp.Any, expected: tp.Any = MISSING, /) -> None:
+        super().__init__()
+        self._single = expected is not MISSING
+        if self._single:
+            paths = {paths: expected}
+        if not paths:
+            raise ValueError("an empty AtPath matches any document")
+        self._expected = list(paths.items())
+        for path, value in self._expected:
+            self._add(_parse_path(path), value)
+
+    def represent(self) -> str:
+        expected = [(path, self._elide(value)) for path, value in self._expected]
+        if self._single:
+            [(path, value)] = expected
+            return f"AtPath({path!r}, {value!r})"
+        return f"AtPath({dict(expected)!r})"
+
+
+class EveryItem(ContainerMatcher[Iterable[T]]):
+    """Match iterables in which every item matches the template.
+
+    :param template: value or matcher that each item must match
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert actual == EveryItem(DictContaining(id=InstanceOf(int)))
+
+    The template is compared to each item without recording the comparison
+    (directly, without the overhead of the comparison engine, unless it has
+    children of its own), and a :py:meth:`~joythief.core.Matcher.clone` of the
+    template is only made for items that do *not* match, so the cost of
+    representing the result is proportional to the number of failures rather
+    than the number of items. The clone is then compared to the item, and
+    decides the result (e.g. if the template resolves an expected value each
+    time it's compared).
+    After a single comparison with a list or tuple, the matcher represents
+    itself as that sequence, with each failing item replaced by the copy of the
+    template that rejected it (and ``...`` in place of any items not compared,
+    see :py:meth:`~joythief.core.ContainerMatcher.limit_mismatches`).
+
+    An empty iterable matches (like :py:func:`all`), and strings are not
+    treated as iterables of characters.
+
+    **Note**: like the matchers in :py:mod:`joythief.compound`, this comparison
+    is not lazy; every item is compared, whether or not any are unequal.
+    """
+
+    _transient = ContainerMatcher._transient | {"_failures"}
+
+    _failures: dict[int, MaybeMatcher[T]]
+    _template: MaybeMatcher[T]
+
+    def __init__(self, template: MaybeMatcher[T], /):
+        super().__init__()
+        self._template = template
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not _is_iterable(other):
+            return self.not_implemented
+        self._failures = failures = {}
+        template = self._template
+        kind = _kind(type(template))
+        for index, item in enumerate(other):
+            if kind is _Kind.VALUE:
+                matched = bool(template == item)
+            elif kind is _Kind.MATCHER and isinstance(template, Matcher):
+                result = template.compare(item)
+                matched = (
+                    _resolve(template, item)
+                    if result is NotImplemented
+                    else bool(result)
+                )
+            else:
+                matched = yield _Unrecorded(template), item
+            if not matched:
+                failures[index] = failure = self._copy_template()
+                if (yield failure, item, index):
+                    del failures[index]
+        return not failures
+
+    def represent(self) -> str:
+        if self._compared_once and isinstance(self._compared_to, (list, tuple)):
+            compared = self._compared_to
+            if self._elided:
+                compared = compared[: max(self._failures) + 1]
+            items = [
+                self._failures.get(index, item) for index, item in enumerate(compared)
+            ]
+            if self._elided:
+                items.append(ELIDED)
+            if isinstance(self._compared_to, tuple):
+                return repr(tuple(items))
+            return repr(items)
+        return f"EveryItem({self._template!r})"
+
+    def _copy_template(self) -> MaybeMatcher[T]:
+        if isinstance(self._template, Matcher):
+            return self._template.clone()
+        return self._template
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._failures = {}
+
+
+class IsSorted(Matcher[Iterable[T]]):
+    """Match iterables whose items are in order.
+
+    :param key: function of one argument to extract a comparison key from each
+        item, as for :py:func:`sorted`
+    :param reverse: whether the items should be in descending order
+    :param strict: whether equal items are out of order
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert actual == IsSorted(key=itemgetter("created"), reverse=True)
+
+    The items are checked in a single pass (each must be ``>=`` the previous,
+    or ``>``, ``<=`` or ``<`` depending on ``reverse`` and ``strict``), without
+    copying more than a chunk of them at a time, or sorting them. Any iterable
+    is accepted, including generators, except that strings are not treated as
+    iterables of characters. Comparison stops once the mismatches to report
+    have been found. After a comparison with ``==``, :py:meth:`~joythief.core.Matcher.mismatches`
+    lists (up to) the first ten items that were out of order.
+    """
+
+    _CHUNK: tp.ClassVar[int] = 1024
+    """The number of items to check at a time."""
+
+    _REPORTED: tp.ClassVar[int] = 10
+    """The maximum number of items to list as mismatches."""
+
+    _key: tp.Optional[tp.Callable[[T], tp.Any]]
+    _reverse: bool
+    _strict: bool
+
+    def __init__(
+        self,
+        *,
+        key: tp.Optional[tp.Callable[[T], tp.Any]] = None,
+        reverse: bool = False,
+        strict: bool = False,
+    ):
+        super().__init__()
+        self._key = key
+        self._reverse = reverse
+        self._strict = strict
+
+    def compare(self, other: tp.Any) -> bool:
+        if not _is_iterable(other):
+            return self.not_implemented
+        if self._key is not None:
+            return next(self._unordered_keys(other, self._key), None) is None
+        previous, current = itertools.tee(other)
+        next(current, None)
+        try:
+            return all(map(self._in_order, previous, current))
+        except TypeError:
+            return False
+
+    def represent(self) -> str:
+        parameters = [
+            f"{name}={value!r}"
+            for name, value in [
+                ("key", self._key),
+                ("reverse", self._reverse),
+                ("strict", self._strict),
+            ]
+            if value
+        ]
+        return f"IsSorted({', '.join(parameters)})"
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        if not _is_iterable(other):
+            return self.not_implemented, [Mismatch((), self, other)]
+        unordered = (
+            self._unordered(other)
+            if self._key is None
+            else self._unordered_keys(other, self._key)
+        )
+        mismatches = [
+            Mismatch((index,), self, item)
+            for index, item in itertools.islice(unordered, self._REPORTED)
+        ]
+        return not mismatches, mismatches
+
+    def _unordered(self, other: Iterable[tp.Any]) -> Iterator[tuple[int, tp.Any]]:
+        """The indices and items out of order, checking a chunk of items at a
+        time with :py:func:`all` and only looping over those that fail."""
+        in_order = self._in_order
+        chunks: Iterable[Sequence[tp.Any]]
+        if isinstance(other, (list, tuple)):
+            size = self._CHUNK
+            chunks = (other[i : i + size] for i in range(0, len(other), size))
+        else:
+            items = iter(other)
+            chunks = iter(lambda: list(itertools.islice(items, self._CHUNK)), [])
+        head: tuple[tp.Any, ...] = ()
+        start = 0
+        for chunk in chunks:
+            try:
+                ordered = all(map(in_order, *self._adjacent(head, chunk)))
+            except TypeError:
+                ordered = False
+            if not ordered:
+                pairs = zip(*self._adjacent(head, chunk))
+                for index, (left, right) in enumerate(pairs, start + 1 - len(head)):
+                    try:
+                        ordered = in_order(left, right)
+                    except TypeError:
+                        ordered = False
+                    if not ordered:
+                        yield index, right
+            head = (chunk[-1],)
+            start += len(chunk)
+
+    def _unordered_keys(
+        self, other: Iterable[tp.Any], key: tp.Callable[[T], tp.Any]
+    ) -> Iterator[tuple[int, tp.Any]]:
+        """The indices and items whose keys are out of order, applying the key
+        outside the ``try`` so that any error it raises isn't mistaken for
+        unorderable keys."""
+        in_order = self._in_order
+        previous = MISSING
+        for index, item in enumerate(other):
+            current = key(item)
+            if previous is not MISSING:
+                try:
+                    ordered = in_order(previous, current)
+                except TypeError:
+                    ordered = False
+                if not ordered:
+                    yield index, item
+            previous = current
+
+    @staticmethod
+    def _adjacent(
+        head: tuple[tp.Any, ...], items: Sequence[tp.Any]
+    ) -> tuple[Iterator[tp.Any], Iterator[tp.Any]]:
+        """Iterators of the earlier and later items of each adjacent pair,
+        starting with any last item of the previous chunk."""
+        earlier = itertools.chain(head, items)
+        return earlier, itertools.islice(items, 1 - len(head), None)
+
+    @property
+    def _in_order(self) -> tp.Callable[[tp.Any, tp.Any], bool]:
+        if self._reverse:
+            return operator.gt if self._strict else operator.ge
+        return operator.lt if self._strict else operator.le
+
+
+class AllUnique(Matcher[Iterable[T]]):
+    """Match iterables in which no two items are equal.
+
+    :param key: function of one argument to extract the value to compare from
+        each item, e.g. ``operator.itemgetter("id")``
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert actual == AllUnique(key=itemgetter("id"))
+
+    Hashable items (and sets) are checked in a single pass using a
+    :py:class:`set`; otherwise they are sorted, so duplicates are adjacent, and
+    only if they can't be ordered either are all pairs compared. Any iterable
+    is accepted, including generators, except that strings are not treated as
+    iterables of characters. After a comparison with ``==``,
+    :py:meth:`~joythief.core.Matcher.mismatches` lists (up to) the first ten
+    items that duplicate an earlier one.
+    """
+
+    _REPORTED: tp.ClassVar[int] = 10
+    """The maximum number of items to list as mismatches."""
+
+    _key: tp.Optional[tp.Callable[[T], tp.Any]]
+
+    def __init__(self, *, key: tp.Optional[tp.Callable[[T], tp.Any]] = None):
+        super().__init__()
+        self._key = key
+
+    def compare(self, other: tp.Any) -> bool:
+        if not _is_iterable(other):
+            return self.not_implemented
+        keys = list(other if self._key is None else map(self._key, other))
+        try:
+            return len(set(keys)) == len(keys)
+        except TypeError:
+            return not self._duplicates(keys)
+
+    def represent(self) -> str:
+        return "AllUnique()" if self._key is None else f"AllUnique(key={self._key!r})"
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        if not _is_iterable(other):
+            return self.not_implemented, [Mismatch((), self, other)]
+        items = other if isinstance(other, Sequence) else list(other)
+        keys = list(items if self._key is None else map(self._key, items))
+        duplicates = self._duplicates(keys)[: self._REPORTED]
+        return not duplicates, [
+            Mismatch((index,), self, items[index]) for index in duplicates
+        ]
+
+    @staticmethod
+    def _duplicates(keys: list[tp.Any]) -> list[int]:
+        """The indices of keys equal to an earlier key, in order."""
+        for hashable in (keys, [_freeze(key) for key in keys]):
+            first: dict[tp.Any, int] = {}
+            try:
+                return [
+                    index
+                    for index, key in enumerate(hashable)
+                    if first.setdefault(key, index) != index
+                ]
+            except TypeError:
+                pass
+        # unhashable, so sort (assuming a total order) to make duplicates adjacent
+        try:
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+        except TypeError:  # unorderable too, so compare every pair
+            return [
+                index
+                for index, key in enumerate(keys)
+                if any(keys[earlier] == key for earlier in range(index))
+            ]
+        duplicates = [
+            later
+            for earlier, later in zip(order, order[1:])
+            if keys[earlier] == keys[later]
+        ]
+        return sorted(duplicates)
+
+
+class _Streaming(ContainerMatcher[Iterable[T]], ABC):
+    """Base class for matchers consuming an iterable one item at a time.
+
+    Only the first few failing items are recorded as mismatches, with a few
+    items either side of each kept to represent the result, so the memory used
+    doesn't depend on the length of the iterable.
+    """
+
+    _CONTEXT: tp.ClassVar[int] = 2
+    """The number of items to show either side of each failure."""
+
+    _REPORTED: tp.ClassVar[int] = 10
+    """The maximum number of failing items to record."""
+
+    _repeatable = False
+
+    _transient = ContainerMatcher._transient | {
+        "_after",
+        "_before",
+        "_count",
+        "_failures",
+        "_windows",
+    }
+
+    _after: int
+    _before: deque[tuple[int, tp.Any]]
+    _count: int
+    _failures: int
+    _windows: list[list[tuple[int, tp.Any]]]
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not _is_iterable(other):
+            return self.not_implemented
+        self._restart()
+        return (yield from self._consume(self._pairs(other)))
+
+    def _consume(self, pairs: Iterable[tuple[tp.Any, tp.Any]]) -> Comparison:
+        """Compare the pairs, continuing from any previously consumed.
+
+        Returns whether they all matched. The progress is kept in local
+        variables for speed, and only stored when the pairs are exhausted (or
+        the comparison is stopped).
+        """
+        windows, before, after = self._windows, self._before, self._after
+        count = self._count
+        failures = failed = self._failures
+        try:
+            for index, (expected, actual) in enumerate(pairs, count):
+                count += 1
+                if (kind := _KINDS.get(type(expected))) is None:
+                    kind = _kind(type(expected))
+                if actual is MISSING:
+                    matched = False
+                elif kind is _Kind.VALUE:
+                    matched = bool(expected == actual)
+                elif kind is _Kind.MATCHER and isinstance(expected, Matcher):
+                    result = expected.compare(actual)
+                    matched = (
+                        _resolve(expected, actual)
+                        if result is NotImplemented
+                        else bool(result)
+                    )
+                else:
+                    matched = yield _Unrecorded(expected), actual
+                if not matched:
+                    failures += 1
+                if not matched and failures <= self._REPORTED:
+                    if isinstance(expected, Matcher):
+                        expected = expected.clone()
+                    yield expected, actual, index
+                    if not after:
+                        windows.append([*before])
+                        before.clear()
+                    windows[-1].append((index, expected))
+                    after = self._CONTEXT
+                elif after:
+                    windows[-1].append((index, actual if matched else expected))
+                    after -= 1
+                elif failures < self._REPORTED:
+                    before.append((index, actual))
+        finally:
+            self._after, self._count, self._failures = after, count, failures
+        return failures == failed
+
+    def represent(self) -> str:
+        if not (self._compared_once and self._windows):
+            return self._describe()
+        items: list[tp.Any] = []
+        position = 0
+        for window in self._windows:
+            if window[0][0] > position:
+                items.append(ELIDED)
+            items.extend(item for _, item in window if item is not MISSING)
+            position = window[-1][0] + 1
+        if position < self._count:
+            items.append(ELIDED)
+        return repr(items)
+
+    @abstractmethod
+    def _describe(self) -> str:
+        """Represent the matcher itself, rather than the comparison."""
+        raise NotImplementedError
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._restart()
+
+    @abstractmethod
+    def _pairs(self, other: Iterable[tp.Any]) -> Iterator[tuple[tp.Any, tp.Any]]:
+        """The ``(expected, actual)`` items to compare."""
+        raise NotImplementedError
+
+    def _restart(self) -> None:
+        """Forget the progress through any previous iterable."""
+        self._after = self._count = self._failures = 0
+        self._before = deque(maxlen=self._CONTEXT)
+        self._windows = []
+
+
+class IterableMatching(_Streaming[T]):
+    """Match iterables in which every item matches the template, consuming
+    them lazily.
+
+    :param template: value or matcher that each item must match
+    :param length: value or matcher that the number of items must match
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert pipeline.rows() == IterableMatching(
+            DictContaining(id=InstanceOf(int)), length=AtLeast(1)
+        )
+
+    Unlike :py:class:`EveryItem`, this never stores the whole iterable (or
+    every failure), so e.g. a generator of millions of rows can be checked in
+    constant memory. Only the first ten failing items are reported as
+    mismatches, and after a single comparison the matcher represents itself as
+    a list of those items with a couple of their neighbours either side, and
+    ``...`` in place of the rest.
+    """
+
+    _length: tp.Optional[MaybeMatcher[int]]
+    _template: MaybeMatcher[T]
+
+    def __init__(
+        self,
+        template: MaybeMatcher[T],
+        /,
+        *,
+        length: tp.Optional[MaybeMatcher[int]] = None,
+    ):
+        super().__init__()
+        self._length = length
+        self._template = template
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        result = yield from super().compare_children(other)
+        if result is NotImplemented:
+            return self.not_implemented
+        length_matched = yield from self._compare_length()
+        return result and length_matched
+
+    def _compare_length(self) -> Comparison:
+        if self._length is None:
+            return True
+        return (yield self._length, self._count)
+
+    def _describe(self) -> str:
+        name = type(self).__name__
+        if self._length is None:
+            return f"{name}({self._template!r})"
+        return f"{name}({self._template!r}, length={self._length!r})"
+
+    def _pairs(self, other: Iterable[tp.Any]) -> Iterator[tuple[tp.Any, tp.Any]]:
+        return zip(itertools.repeat(self._template), other)
+
+
+class AsyncIterableMatching(IterableMatching[T]):
+    """Match asynchronous iterables (or queues) in which every item matches the
+    template, consuming them lazily.
+
+    :param template: value or matcher that each item must match
+    :param length: value or matcher that the number of items must match
+
+    .. versionadded:: 0.10.0
+
+    As ``==`` can't be awaited, use :py:meth:`check` instead:
+
+    .. code-block:: python
+
+        assert await AsyncIterableMatching(InstanceOf(Event)).check(
+            service.events(), timeout=5
+        )
+
+    Afterwards, the matcher represents itself and lists its mismatches
+    exactly as :py:class:`IterableMatching` does after ``==`` (which also
+    works, for synchronous iterables).
+    """
+
+    async def check(
+        self,
+        stream: tp.Union[AsyncIterable[tp.Any], asyncio.Queue[tp.Any]],
+        /,
+        *,
+        timeout: tp.Optional[float] = None,
+        fail_fast: bool = False,
+    ) -> bool:
+        """Consume the stream, comparing each item as it arrives.
+
+        :param stream: the async iterable, or :py:class:`asyncio.Queue`, to
+            compare. If the length is an :py:class:`int`, that many items are
+            taken from a queue (waiting for them if necessary), otherwise the
+            items currently in it.
+        :param timeout: the maximum number of seconds to take in total
+        :param fail_fast: whether to stop at the first failure (including
+            more items than an :py:class:`int` length), rather than consuming
+            the whole stream
+
+        If the stream isn't fully consumed (because the result was already
+        known, or the timeout expired), it is closed with ``aclose()``, which
+        cancels e.g. an async generator producing the items.
+
+        :raises TimeoutError: if the timeout expires.
+        :raises TypeError: if the stream isn't an async iterable or a queue.
+        """
+        items: AsyncIterator[tp.Any]
+        if isinstance(stream, asyncio.Queue):
+            items = _from_queue(stream, self._length)
+        elif isinstance(stream, AsyncIterable):
+            items = stream.__aiter__()
+        else:
+            raise TypeError(f"cannot consume {type(stream).__name__} asynchronously")
+        self._restart()
+        mismatches: list[Mismatch] = []
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        exhausted = False
+        try:
+            while not (
+                fail_fast
+                and (
+                    self._failures
+                    or (isinstance(self._length, int) and self._count > self._length)
+                )
+            ):
+                try:
+                    if deadline is None:
+                        item = await items.__anext__()
+                    else:
+                        item = await asyncio.wait_for(
+                            items.__anext__(), deadline - loop.time()
+                        )
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"timed out after {self._count} items in {timeout}s"
+                    ) from None
+                pairs = [(self._template, item)]
+                mismatches.extend(_evaluate(self._consume(pairs), None, item)[1])
+        finally:
+            if not exhausted and (close := getattr(items, "aclose", None)):
+                await close()
+        length_matched, found = _evaluate(self._compare_length(), None, stream)
+        mismatches.extend(found)
+        result = not self._failures and length_matched
+        self._mismatches = mismatches
+        self._record(stream, result)
+        return result
+
+
+class IterableEqual(_Streaming[T]):
+    """Match iterables whose items match the expected ones in order,
+    consuming them lazily.
+
+    :param expected: iterable of the values or matchers each item must match
+
+    .. versionadded:: 0.10.0
+
+    .. code-block:: python
+
+        assert transform(read_rows()) == IterableEqual(expected_rows())
+
+    The expected iterable is also consumed lazily, so it can be e.g. a
+    generator (but then the matcher can only be compared once). As for
+    :py:class:`IterableMatching`, neither iterable is stored; only the first
+    ten differences are reported, and represented with a couple of their
+    neighbours either side.
+    """
+
+    _expected: Iterable[MaybeMatcher[T]]
+
+    def __init__(self, expected: Iterable[MaybeMatcher[T]], /):
+        super().__init__()
+        self._expected = expected
+
+    def _describe(self) -> str:
+        return f"IterableEqual({self._expected!r})"
+
+    def _pairs(self, other: Iterable[tp.Any]) -> Iterator[tuple[tp.Any, tp.Any]]:
+        return itertools.zip_longest(self._expected, other, fillvalue=MISSING)
+
+
+async def _from_queue(
+    queue: asyncio.Queue[tp.Any], length: tp.Optional[MaybeMatcher[int]]
+) -> AsyncIterator[tp.Any]:
+    if isinstance(length, int):
+        for _ in range(length):
+            yield await queue.get()
+    else:
+        while not queue.empty():
+            yield queue.get_nowait()
+
+
+def _freeze(value: tp.Any) -> tp.Any:
+    """Sets are only partially ordered, but equal to the equivalent frozenset."""
+    return frozenset(value) if isinstance(value, set) else value
+
+
+def _is_iterable(value: tp.Any) -> bool:
+    return isinstance(value, Iterable) and not isinstance(value, (str, bytes))
+
+
+@lru_cache(maxsize=1_024)
+def _parse_path(path: str) -> tuple[Hashable, ...]:
+    """Split a path (see :py:class:`AtPath`) into the keys to look up."""
+    if (match := _NAME.match(path)) is not None:
+        keys: list[Hashable] = [match.group()]
+        position = match.end()
+    else:
+        keys, position = [], 0
+    while position < len(path):
+        match = _SEGMENT.match(path, position)
+        # names only follow a dot after the first segment
+        if match is None or (position == 0 and match.group(1) is not None):
+            raise ValueError(f"invalid path {path!r} at position {position}")
+        name, index, quoted = match.groups()
+        if name is not None:
+            keys.append(name)
+        elif index is not None:
+            keys.append(int(index))
+        else:
+            keys.append(json.loads(quoted))
+        position = match.end()
+    if not keys:
+        raise ValueError("an empty path matches the whole document")
+    return tuple(keys)
+
+
+def _format(keys: tuple[Hashable, ...]) -> str:
+    """The path to the keys, the inverse of :py:func:`_parse_path`."""
+    path = ""
+    for key in keys:
+        if isinstance(key, int):
+            path += f"[{key}]"
+        elif isinstance(key, str) and _NAME.fullmatch(key):
+            path += f".{key}" if path else key
+        else:
+            path += f"[{json.dumps(key)}]"
+    return path
+
+
+def _lookup(value: tp.Any, key: Hashable) -> tp.Any:
+    if isinstance(value, Mapping):
+        return value.get(key, MISSING)
+    if isinstance(key, int) and -len(value) <= key < len(value):
+        return value[key]
+    return MISSING
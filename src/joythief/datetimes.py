@@ -0,0 +1,108 @@
+"""Matchers for :py:mod:`datetime` values, and strings representing them.
+
+.. versionadded:: 0.10.0
+
+"""
+
+import typing as tp
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from joythief.core import Matcher
+
+Reference = tp.Union[datetime, str, tp.Callable[[], datetime]]
+
+
+class DatetimeCloseTo(Matcher[datetime]):
+    """Matches any :py:class:`~datetime.datetime`, or :py:class:`str` in
+    `ISO 8601`_ format, within a tolerance of the reference.
+
+    .. versionadded:: 0.10.0
+
+    :param reference: the expected datetime, as an object or ISO 8601 string,
+        or a function of no arguments returning it (e.g.
+        :py:meth:`datetime.datetime.now`)
+    :param tolerance: the maximum difference either side of the reference, as
+        a :py:class:`~datetime.timedelta` or a number of seconds
+
+    :raises ValueError: if the reference string can't be parsed, or the
+        tolerance is negative.
+
+    A function reference is called on each matcher's first comparison, and
+    the result used for any subsequent ones, so the reference is taken when
+    e.g. an API payload is checked, not when the matcher is created. Each
+    matcher calls the function separately, so the instants may differ
+    slightly, well within any practical tolerance:
+
+    .. code-block:: python
+
+        now = partial(datetime.now, tz=timezone.utc)
+        assert response.json() == DictContaining(
+            created_at=DatetimeCloseTo(now, 5),
+            updated_at=DatetimeCloseTo(now, 5),
+        )
+
+    Parsed strings are cached, so comparing many matchers to the same payload
+    only parses each timestamp once. A timestamp with a UTC offset never
+    matches a reference without one, and vice versa.
+
+    .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
+    """
+
+    _accepts = (str, datetime)
+
+    _transient = Matcher._transient | {"_resolved"}
+
+    _reference: tp.Union[datetime, tp.Callable[[], datetime]]
+    _resolved: tp.Optional[datetime]
+    _tolerance: timedelta
+
+    def __init__(self, reference: Reference, tolerance: tp.Union[timedelta, float]):
+        if isinstance(reference, str):
+            if (parsed := _parse(reference)) is None:
+                raise ValueError(f"invalid ISO 8601 timestamp: {reference!r}")
+            reference = parsed
+        if not isinstance(tolerance, timedelta):
+            tolerance = timedelta(seconds=tolerance)
+        if tolerance < timedelta(0):
+            raise ValueError("tolerance cannot be negative")
+        super().__init__()
+        self._reference = reference
+        self._tolerance = tolerance
+
+    def compare(self, other: tp.Any) -> bool:
+        if isinstance(other, str):
+            if (parsed := _parse(other)) is None:
+                return False
+        elif isinstance(other, datetime):
+            parsed = other
+        else:
+            return self.not_implemented
+        if (reference := self._resolved) is None:
+            reference = self._resolved = (
+                self._reference
+                if isinstance(self._reference, datetime)
+                else self._reference()
+            )
+        try:
+            return abs(parsed - reference) <= self._tolerance
+        except TypeError:
+            return False
+
+    def represent(self) -> str:
+        return f"DatetimeCloseTo({self._reference!r}, {self._tolerance!r})"
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._resolved = None
+
+
+@lru_cache(maxsize=1_024)
+def _parse(value: str) -> tp.Optional[datetime]:
+    """Parse an ISO 8601 string, accepting ``Z`` for UTC on any version."""
+    if value[-1:] in {"Z", "z"}:
+        value = f"{value[:-1]}+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
@@ -6,8 +6,15 @@
 
 import math
 import typing as tp
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Integral, Rational, Real
 
-from joythief.core import Matcher
+from joythief.core import MISSING, Matcher, Mismatch
+
+N = tp.TypeVar("N")
 
 
 class NaN(Matcher[float]):
@@ -15,8 +22,11 @@ class NaN(Matcher[float]):
 
     `IEEE 754`_ NaN (*"not a number"*) instances are, by definition, not
     equal to each other. This matcher compares equal to e.g.
-    :py:data:`math.nan` or :code:`float("nan")` using
-    :py:func:`math.isnan`.
+    :py:data:`math.nan` or :code:`float("nan")`.
+
+    .. versionchanged:: 0.10.0 also matches other non-integral
+        :py:class:`~numbers.Real` types representing NaN, e.g.
+        ``numpy.float32("nan")``. See also :py:mod:`joythief.arrays`.
 
     Originally formulated for `this answer`_.
 
@@ -25,10 +35,392 @@ class NaN(Matcher[float]):
 
     """
 
+    _accepts = (Real,)
+
     def compare(self, other: tp.Any) -> bool:
-        if not isinstance(other, float):
+        if not isinstance(other, Real) or isinstance(other, Integral):
             return self.not_implemented
-        return math.isnan(other)
+        return other != other
 
     def represent(self) -> str:
         return super().represent()
+
+
+class _Range(Matcher[N], tp.Generic[N]):
+    """Base class for matchers of numbers in a range.
+
+    The values compared can be any mix of :py:class:`int`, :py:class:`float`,
+    :py:class:`~decimal.Decimal` and :py:class:`~fractions.Fraction`, and are
+    compared exactly. NaN is never in range, and :py:class:`bool` is rejected.
+    """
+
+    _accepts = (Real, Decimal)
+
+    _include_lower: bool
+    _include_upper: bool
+    _lower: tp.Optional[N]
+    _upper: tp.Optional[N]
+
+    def __init__(
+        self,
+        lower: tp.Optional[N],
+        upper: tp.Optional[N],
+        *,
+        include_lower: bool,
+        include_upper: bool,
+    ):
+        super().__init__()
+        for bound in (lower, upper):
+            if bound is not None and not _is_number(bound):
+                raise TypeError(f"range bounds must be numbers, not {bound!r}")
+            if bound is not None and _is_nan(bound):
+                raise ValueError("range bounds cannot be NaN")
+        if lower is not None and upper is not None:
+            if lower > upper or (  # type: ignore[operator]
+                lower == upper and not (include_lower and include_upper)
+            ):
+                raise ValueError(f"empty range from {lower!r} to {upper!r}")
+        self._include_lower = include_lower
+        self._include_upper = include_upper
+        self._lower = lower
+        self._upper = upper
+
+    def compare(self, other: tp.Any) -> bool:
+        if not _is_number(other):
+            return self.not_implemented
+        if _is_nan(other):
+            return False
+        if (lower := self._lower) is not None and not (
+            lower <= other if self._include_lower else lower < other
+        ):
+            return False
+        if (upper := self._upper) is not None and not (
+            other <= upper if self._include_upper else other < upper
+        ):
+            return False
+        return True
+
+
+class Between(_Range[N]):
+    """Matches any number between the bounds, inclusive by default.
+
+    .. versionadded:: 0.10.0
+
+    :param lower: the lowest number in the range
+    :param upper: the highest number in the range
+    :param include_lower: whether ``lower`` itself is in the range
+    :param include_upper: whether ``upper`` itself is in the range
+
+    :raises ValueError: if the range is empty (or a bound is NaN).
+
+    Any mix of :py:class:`int`, :py:class:`float`,
+    :py:class:`~decimal.Decimal` and :py:class:`~fractions.Fraction` is
+    compared exactly. NaN is never in range, and :py:class:`bool` isn't
+    considered a number. Many ranges can be combined efficiently with
+    :py:class:`~joythief.compound.AnyOf`, e.g. for bucket boundaries:
+
+    .. code-block:: python
+
+        assert port == AnyOf(Between(80, 89), Between(8000, 8999))
+    """
+
+    def __init__(
+        self,
+        lower: N,
+        upper: N,
+        *,
+        include_lower: bool = True,
+        include_upper: bool = True,
+    ):
+        super().__init__(
+            lower, upper, include_lower=include_lower, include_upper=include_upper
+        )
+
+    def represent(self) -> str:
+        flags = "".join(
+            f", {name}=False"
+            for name in ["include_lower", "include_upper"]
+            if not getattr(self, f"_{name}")
+        )
+        return f"Between({self._lower!r}, {self._upper!r}{flags})"
+
+
+class GreaterThan(_Range[N]):
+    """Matches any number greater than the bound, see :py:class:`Between`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, lower: N, /):
+        super().__init__(lower, None, include_lower=False, include_upper=False)
+
+    def represent(self) -> str:
+        return f"GreaterThan({self._lower!r})"
+
+
+class AtLeast(_Range[N]):
+    """Matches any number greater than or equal to the bound, see
+    :py:class:`Between`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, lower: N, /):
+        super().__init__(lower, None, include_lower=True, include_upper=False)
+
+    def represent(self) -> str:
+        return f"AtLeast({self._lower!r})"
+
+
+class LessThan(_Range[N]):
+    """Matches any number less than the bound, see :py:class:`Between`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, upper: N, /):
+        super().__init__(None, upper, include_lower=False, include_upper=False)
+
+    def represent(self) -> str:
+        return f"LessThan({self._upper!r})"
+
+
+class AtMost(_Range[N]):
+    """Matches any number less than or equal to the bound, see
+    :py:class:`Between`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, upper: N, /):
+        super().__init__(None, upper, include_lower=False, include_upper=True)
+
+    def represent(self) -> str:
+        return f"AtMost({self._upper!r})"
+
+
+class Close(Matcher[N], tp.Generic[N]):
+    """Matches numbers, or nested structures of them, within a tolerance.
+
+    .. versionadded:: 0.10.0
+
+    :param expected: a number, or nested :py:class:`dict`, :py:class:`list`
+        and :py:class:`tuple` containing numbers (and any other values or
+        matchers, which are compared with ``==``)
+    :param rel: the relative tolerance, as a fraction of the expected number
+    :param abs: the absolute tolerance
+    :param nan_equal: whether NaN matches NaN
+
+    Like :py:func:`pytest.approx`, a number matches if it differs from the
+    expected number by no more than ``max(rel * abs(expected), abs)``. The
+    structure is walked once, without creating a matcher per number, and long
+    lists of :py:class:`float` are checked in a single pass:
+
+    .. code-block:: python
+
+        assert metrics == Close({"p50": 0.12, "points": [(1.0, 2.5)]}, rel=1e-3)
+
+    Any mix of :py:class:`int`, :py:class:`float`,
+    :py:class:`~decimal.Decimal` and :py:class:`~fractions.Fraction` can be
+    compared, but :py:class:`bool` isn't considered a number. After a comparison
+    with ``==``, :py:meth:`~joythief.core.Matcher.mismatches` lists every
+    number that wasn't close, with its path.
+    """
+
+    _BATCHED: tp.ClassVar[int] = 16
+    """The minimum length of list of :py:class:`float` to check in one pass."""
+
+    _caches = frozenset({"_batches"})
+    _transient = Matcher._transient | _caches
+
+    _abs: float
+    _batches: "dict[int, tp.Optional[tuple[array[float], array[float]]]]"
+    _expected: N
+    _nan_equal: bool
+    _rel: float
+
+    def __init__(
+        self,
+        expected: N,
+        *,
+        rel: float = 1e-06,
+        abs: float = 1e-12,
+        nan_equal: bool = False,
+    ):
+        if rel < 0 or abs < 0:
+            raise ValueError("tolerances cannot be negative")
+        super().__init__()
+        self._abs = abs
+        self._expected = expected
+        self._nan_equal = nan_equal
+        self._rel = rel
+
+    def compare(self, other: tp.Any) -> bool:
+        return self._walk(other, None)
+
+    def represent(self) -> str:
+        return (
+            f"Close({self._expected!r}, rel={self._rel!r}, abs={self._abs!r}"
+            f"{', nan_equal=True' if self._nan_equal else ''})"
+        )
+
+    def _explain(self, other: tp.Any) -> tuple[bool, list[Mismatch]]:
+        mismatches: list[Mismatch] = []
+        return self._walk(other, mismatches), mismatches
+
+    def _forget(self) -> None:
+        super()._forget()
+        self._batches = {}
+
+    def _walk(self, other: tp.Any, mismatches: tp.Optional[list[Mismatch]]) -> bool:
+        """Compare the structure to ``other``, stopping at the first mismatch
+        unless collecting them."""
+        equal = True
+        stack: list[tuple[tuple[tp.Any, ...], tp.Any, tp.Any]] = [
+            ((), self._expected, other)
+        ]
+        while stack:
+            path, expected, actual = stack.pop()
+            if actual is MISSING:
+                matched = False
+            elif isinstance(expected, dict):
+                if (
+                    matched := isinstance(actual, dict)
+                    and actual.keys() <= expected.keys()
+                ):
+                    stack.extend(
+                        (path + (key,), value, actual.get(key, MISSING))
+                        for key, value in reversed(expected.items())
+                    )
+            elif isinstance(expected, (list, tuple)):
+                if matched := (
+                    isinstance(actual, list if isinstance(expected, list) else tuple)
+                    and len(actual) == len(expected)
+                ):
+                    if not self._batched(expected, actual):
+                        stack.extend(
+                            (path + (index,), value, actual[index])
+                            for index, value in reversed(list(enumerate(expected)))
+                        )
+            elif _is_number(expected):
+                matched = self._close(expected, actual)
+            else:
+                matched = bool(expected == actual)
+            if not matched:
+                if mismatches is None:
+                    return False
+                mismatches.append(Mismatch(path, expected, actual))
+                equal = False
+        return equal
+
+    def _batched(self, expected: tp.Any, actual: tp.Any) -> bool:
+        """Whether a long list of floats is close, in a single pass.
+
+        Returns :py:const:`False` if it can't tell, e.g. for a NaN or an
+        infinity, which are left to :py:meth:`_close`.
+        """
+        if type(expected) is not list or type(actual) is not list:
+            return False
+        if (batch := self._batches.get(id(expected), MISSING)) is MISSING:
+            batch = None
+            if len(expected) >= self._BATCHED and all(
+                type(value) is float and math.isfinite(value) for value in expected
+            ):
+                batch = (
+                    array("d", expected),
+                    array("d", (max(self._rel * abs(v), self._abs) for v in expected)),
+                )
+            self._batches[id(expected)] = batch
+        if batch is None:
+            return False
+        try:
+            for value, tolerance, other in zip(*batch, actual):
+                if (type(other) is not float and type(other) is not int) or not (
+                    abs(other - value) <= tolerance
+                ):
+                    return False
+        except OverflowError:  # e.g. an int too large for a float
+            return False
+        return True
+
+    def _close(self, expected: tp.Any, actual: tp.Any) -> bool:
+        if not _is_number(actual):
+            return False
+        if _is_nan(expected) or _is_nan(actual):
+            return self._nan_equal and _is_nan(expected) and _is_nan(actual)
+        if expected == actual:
+            return True
+        if _is_infinite(expected) or _is_infinite(actual):
+            return False
+        try:
+            return bool(
+                abs(actual - expected) <= max(self._rel * abs(expected), self._abs)
+            )
+        except (OverflowError, TypeError):  # e.g. huge int, or Decimal and float
+            expected, actual = Fraction(expected), Fraction(actual)
+            return bool(
+                abs(actual - expected)
+                <= max(Fraction(self._rel) * abs(expected), Fraction(self._abs))
+            )
+
+
+class _RangeIndex:
+    """Sorted index of range matchers, to find those that may contain a value.
+
+    The distinct bounds split the number line into alternating open intervals
+    and single points ("slots"), each listing the ranges that overlap it, so a
+    value is located with one :py:func:`~bisect.bisect_left`.
+    """
+
+    _bounds: list[tp.Any]
+    _slots: list[tuple[_Range[tp.Any], ...]]
+
+    def __init__(self, ranges: tp.Iterable[_Range[tp.Any]]):
+        ranges = tuple(ranges)
+        self._bounds = sorted(
+            {
+                bound
+                for range_ in ranges
+                for bound in (range_._lower, range_._upper)
+                if bound is not None
+            }
+        )
+        slots: list[list[_Range[tp.Any]]] = [
+            [] for _ in range(2 * len(self._bounds) + 1)
+        ]
+        for range_ in ranges:
+            first = 0 if range_._lower is None else self._slot(range_._lower)
+            last = (
+                len(slots) - 1 if range_._upper is None else self._slot(range_._upper)
+            )
+            for slot in slots[first : last + 1]:
+                slot.append(range_)
+        self._slots = [tuple(slot) for slot in slots]
+
+    def candidates(self, value: tp.Any) -> tuple[_Range[tp.Any], ...]:
+        """The ranges that may contain the value."""
+        if not _is_number(value) or _is_nan(value):
+            return ()
+        return self._slots[self._slot(value)]
+
+    def _slot(self, value: tp.Any) -> int:
+        index = bisect_left(self._bounds, value)
+        if index < len(self._bounds) and self._bounds[index] == value:
+            return 2 * index + 1
+        return 2 * index
+
+
+def _is_number(value: tp.Any) -> bool:
+    return isinstance(value, (Real, Decimal)) and not isinstance(value, bool)
+
+
+def _is_nan(value: tp.Any) -> bool:
+    if isinstance(value, Decimal):
+        return value.is_nan()
+    return bool(value != value)
+
+
+def _is_infinite(value: tp.Any) -> bool:
+    if isinstance(value, Decimal):
+        return value.is_infinite()
+    return not isinstance(value, Rational) and math.isinf(value)
@@ -1,8 +1,16 @@
 """Matchers for general object types."""
 
 import typing as tp
+from abc import ABCMeta, get_cache_token
 
-from joythief.core import Matcher, MaybeMatcher
+from joythief.core import (
+    Comparison,
+    Matcher,
+    MaybeMatcher,
+    _settle,
+    _shallow_depth,
+    _ShallowMatcher,
+)
 
 T = tp.TypeVar("T")
 
@@ -39,7 +47,7 @@ class Nothing(Matcher[tp.Any]):
         return super().represent()
 
 
-class Nullable(tp.Generic[T], Matcher[tp.Optional[T]]):
+class Nullable(tp.Generic[T], _ShallowMatcher[tp.Optional[T]]):
     """Adds ``None`` to the supplied value or matcher.
 
     Matcher equivalent of :py:class:`typing.Optional`.
@@ -55,11 +63,23 @@ class Nullable(tp.Generic[T], Matcher[tp.Optional[T]]):
             raise TypeError("Nullable value cannot be None")
         super().__init__()
         self._value = value
+        self._shallow = _shallow_depth((value,))
 
-    def compare(self, other: tp.Any) -> bool:
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if other is None:
+            return True
+        return (yield self._value, other)
+
+    def _compare_shallow(
+        self,
+        other: tp.Any,
+        record: bool,
+        path: tp.Any,
+        failures: list[tuple[tp.Any, tp.Any, tp.Any]],
+    ) -> bool:
         if other is None:
             return True
-        return tp.cast(bool, self._value == other)
+        return _settle(self._value, other, record, path, failures)
 
     def represent(self) -> str:
         return f"Nullable({self._value!r})"
@@ -73,27 +93,86 @@ class InstanceOf(tp.Generic[T], Matcher[T]):
     of types. With :code:`nullable` set to :py:const:`True`, the
     received value can also be :py:const:`None`.
 
+    .. versionchanged:: 0.10.0 checks against abstract base classes like
+        :py:class:`~collections.abc.Mapping` are cached for each type of value,
+        and :py:func:`~typing.runtime_checkable` protocols are supported.
+
     Originally formulated for `this answer`_.
 
     .. _this answer: https://stackoverflow.com/a/64973325/3001761
 
+    :raises TypeError: if the type(s) can't be used with :py:func:`isinstance`,
+        e.g. a :py:class:`~typing.Protocol` that isn't runtime checkable.
+
     """
 
+    _DECISIONS: tp.ClassVar[int] = 256
+    """The maximum number of types to cache decisions for."""
+
+    _caches = frozenset({"_decisions", "_token"})
+    _transient = Matcher._transient | _caches
+
+    _abstract: tuple[type[tp.Any], ...] = ()
+    _concrete: tuple[type[tp.Any], ...]
+    _dynamic: tuple[type[tp.Any], ...] = ()
     _nullable: bool
+    _decisions: dict[type[tp.Any], bool]
+    _token: object = None
+    """The ABC cache token the decisions are valid for; until the first lookup
+    (including in clones, which don't copy caches) there are none."""
     _type: Type[T]
 
     def __init__(self, type_: Type[T], *, nullable: bool = False):
         super().__init__()
         self._nullable = nullable
         self._type = type_
+        if type(type_) is type:  # the common case, so skip classifying
+            self._concrete = (type_, type(None)) if nullable else (type_,)
+            return
+        types: tuple[type[tp.Any], ...] = (
+            type_ if isinstance(type_, tuple) else (type_,)
+        )
+        if nullable:
+            types += (type(None),)
+        concrete: list[type[tp.Any]] = []
+        abstract: list[type[tp.Any]] = []
+        dynamic: list[type[tp.Any]] = []
+        for t in types:
+            if type(t) is type:
+                concrete.append(t)
+            elif type(t) is ABCMeta:
+                abstract.append(t)
+            else:
+                dynamic.append(t)
+        self._concrete = tuple(concrete)
+        if abstract:
+            self._abstract = tuple(abstract)
+        if dynamic:
+            self._dynamic = tuple(dynamic)
+            isinstance(None, self._dynamic)
 
     def compare(self, other: tp.Any) -> bool:
-        type_: tuple[type[tp.Any], ...] = (
-            self._type if isinstance(self._type, tuple) else (self._type,)
-        )
-        if self._nullable:
-            type_ = type_ + (type(None),)
-        return isinstance(other, type_)
+        if isinstance(other, self._concrete):
+            return True
+        if self._abstract:
+            type_ = type(other)
+            if other.__class__ is not type_:
+                if isinstance(other, self._abstract):
+                    return True
+            else:
+                # issubclass is cached per type, until a virtual subclass is
+                # registered with any ABC (see abc.get_cache_token)
+                if (token := get_cache_token()) != self._token:
+                    self._decisions = {}
+                    self._token = token
+                decisions = self._decisions
+                if (decision := decisions.get(type_)) is None:
+                    if len(decisions) >= self._DECISIONS:
+                        decisions.clear()
+                    decision = decisions[type_] = issubclass(type_, self._abstract)
+                if decision:
+                    return True
+        return bool(self._dynamic) and isinstance(other, self._dynamic)
 
     def represent(self) -> str:
         return (
@@ -0,0 +1,250 @@
+"""Matchers comparing values in parallel, in other processes.
+
+.. versionadded:: 0.10.0
+
+"""
+
+import io
+import math
+import multiprocessing
+import os
+import pickle
+import typing as tp
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from joythief.core import (
+    _KINDS,
+    MISSING,
+    Comparison,
+    ContainerMatcher,
+    Matcher,
+    MaybeMatcher,
+    Mismatch,
+    _evaluate,
+    _Kind,
+    _kind,
+    _MatcherState,
+    _pass_through,
+    _Precomputed,
+    retain_state,
+)
+
+T = tp.TypeVar("T")
+
+
+_Outcomes = list[
+    tuple[bool, list[Mismatch], list[tuple[Matcher[tp.Any], dict[str, tp.Any]]]]
+]
+
+
+class InParallel(ContainerMatcher[Sequence[T]]):
+    """Match sequences whose items match the expected ones in order, comparing
+    them in parallel processes.
+
+    .. versionadded:: 0.10.0
+
+    :param expected: sequence of the values or matchers each item must match
+    :param executor: the executor to compare the chunks in; if omitted, a
+        :py:class:`~concurrent.futures.ProcessPoolExecutor` using the
+        ``"spawn"`` start method is created (and shut down again) for each
+        comparison
+    :param chunk_size: the number of items to compare in each task; by
+        default, enough for about four tasks per CPU, but at least 1,000
+
+    :raises ValueError: if the chunk size isn't positive.
+
+    For long lists of heavyweight items (e.g. each compared with
+    :py:class:`~joythief.strings.JsonString`), where the comparison itself is
+    the bottleneck:
+
+    .. code-block:: python
+
+        with ProcessPoolExecutor() as executor:
+            assert rows == InParallel(expected_rows, executor=executor)
+
+    Each chunk of expected and actual items is pickled (see
+    :py:class:`~joythief.core.Matcher`) and compared in a worker, and the
+    state of the matchers compared there is merged back into the originals,
+    so once compared they (and this matcher, which then represents itself as
+    a list of the expected items) are represented exactly as if compared in
+    this process. Values from the actual sequence aren't copied back, except
+    where the matchers created them (e.g. parsed JSON). An expected item that
+    is a matcher, and matched, represents itself as the actual item, so the
+    state of the matchers within it isn't merged. If there's only one chunk,
+    the items are compared in this process.
+
+    The expected items, and any matchers in them, must therefore be picklable
+    (so e.g. not lambdas), and should be independent: a matcher shared between
+    items in different chunks represents itself as if compared to different
+    values, even if they are equal. Any mismatch budget only applies as the
+    results are merged, so doesn't save any work in the workers.
+
+    **Note**: like :py:class:`~joythief.data_structures.EveryItem`, this
+    comparison is not lazy; every item is compared, whether or not any are
+    unequal. Missing or extra items are reported against
+    :py:data:`~joythief.core.MISSING`.
+    """
+
+    _CHUNK: tp.ClassVar[int] = 1_000
+    """The default minimum number of items to compare in each task."""
+
+    _TASKS_PER_CPU: tp.ClassVar[int] = 4
+    """The default number of tasks per CPU, to balance uneven chunks."""
+
+    _chunk_size: tp.Optional[int]
+    _executor: tp.Optional[Executor]
+    _expected: list[MaybeMatcher[T]]
+
+    def __init__(
+        self,
+        expected: Sequence[MaybeMatcher[T]],
+        /,
+        *,
+        executor: tp.Optional[Executor] = None,
+        chunk_size: tp.Optional[int] = None,
+    ):
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk size must be positive")
+        super().__init__()
+        self._chunk_size = chunk_size
+        self._executor = executor
+        self._expected = list(expected)
+
+    def __getstate__(self) -> dict[str, tp.Any]:
+        state = super().__getstate__()
+        # executors can't be pickled, and workers shouldn't start their own
+        state["_executor"] = None
+        return state
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return self.not_implemented
+        expected, length = self._expected, min(len(self._expected), len(other))
+        size = self._chunk_size or max(
+            self._CHUNK, math.ceil(length / (self._TASKS_PER_CPU * _cpus()))
+        )
+        equal = True
+        if length <= size:
+            for index in range(length):
+                if not (yield expected[index], other[index], index):
+                    equal = False
+        else:
+            executor = self._executor or ProcessPoolExecutor(
+                # forking a multithreaded process is unsafe (and deprecated)
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            try:
+                tasks = []
+                for start in range(0, length, size):
+                    # each item is wrapped, to find where it starts in the memo
+                    items = [[item] for item in expected[start : start + size]]
+                    payload, memo = _dump((items, other[start : start + size]))
+                    tasks.append((start, executor.submit(_compare, payload), memo))
+                for start, future, memo in tasks:
+                    outcomes = _Unpickler(io.BytesIO(future.result()), memo).load()
+                    for offset, outcome in enumerate(outcomes):
+                        index = start + offset
+                        if not (yield _Precomputed(*outcome), other[index], index):
+                            equal = False
+            finally:
+                if executor is not self._executor:
+                    executor.shutdown(cancel_futures=True)
+        for index in range(length, max(len(expected), len(other))):
+            if index < len(expected):
+                yield expected[index], MISSING, index
+            else:
+                yield MISSING, other[index], index
+            equal = False
+        return equal
+
+    def represent(self) -> str:
+        expected = [self._elide(item) for item in self._expected]
+        if self._compared_once:
+            return repr(expected)
+        return f"InParallel({expected!r})"
+
+
+def _compare(payload: bytes) -> bytes:
+    """Compare a chunk of items, in a worker process.
+
+    For each item, returns the result, the mismatches and the state of each
+    matcher compared within it (i.e. first unpickled as part of it). Anything
+    that was unpickled, including the matchers, is sent back as a reference,
+    see :py:class:`_Pickler`.
+    """
+    unpickler = pickle.Unpickler(io.BytesIO(payload))
+    items, actual = unpickler.load()
+    # keeps everything unpickled alive, so no new object can reuse an ID
+    memo: list[tp.Any] = [None] * len(unpickled := unpickler.memo.copy())
+    for index, value in unpickled.items():
+        memo[index] = value
+    indices = {id(value): index for index, value in enumerate(memo)}
+    starts = [indices[id(item)] for item in items] + [indices[id(actual)]]
+    outcomes: _Outcomes = []
+    for position, ([item], other) in enumerate(zip(items, actual)):
+        result, mismatches = _evaluate(_pass_through(item, other), None, other)
+        if isinstance(item, Matcher) and item._state is _MatcherState.EQUAL_ONCE:
+            # it represents itself as the item, so its children aren't needed
+            outcomes.append((result, mismatches, [(item, item._retained())]))
+            continue
+        states = []
+        for value in memo[starts[position] : starts[position + 1]]:
+            if (kind := _KINDS.get(type(value))) is None:
+                kind = _kind(type(value))
+            if (
+                kind is _Kind.MATCHER or kind is _Kind.CONTAINER
+            ) and value._state is not _MatcherState.UNCOMPARED:
+                states.append((value, value._retained()))
+        outcomes.append((result, mismatches, states))
+    file = io.BytesIO()
+    with retain_state():
+        _Pickler(file, indices).dump(outcomes)
+    return file.getvalue()
+
+
+def _cpus() -> int:
+    return os.cpu_count() or 1
+
+
+def _dump(value: tp.Any) -> tuple[bytes, dict[int, tuple[int, tp.Any]]]:
+    """Pickle the value, also returning the pickler's memo."""
+    file = io.BytesIO()
+    pickler = pickle.Pickler(file)
+    pickler.dump(value)
+    return file.getvalue(), pickler.memo.copy()
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles anything that was unpickled from the payload as its index in
+    the memo, which is the same as in the memo of the original pickler."""
+
+    _indices: dict[int, int]
+
+    def __init__(self, file: tp.IO[bytes], indices: dict[int, int]) -> None:
+        super().__init__(file)
+        self._indices = indices
+
+    def persistent_id(self, obj: tp.Any) -> tp.Optional[int]:
+        return self._indices.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    """Resolves the indices pickled by :py:class:`_Pickler` to the originals,
+    given the memo of the pickler that sent them."""
+
+    _memo: dict[int, tuple[int, tp.Any]]
+    _originals: tp.Optional[dict[int, tp.Any]]
+
+    def __init__(self, file: tp.IO[bytes], memo: dict[int, tuple[int, tp.Any]]) -> None:
+        super().__init__(file)
+        self._memo = memo
+        self._originals = None
+
+    def load(self) -> _Outcomes:
+        return tp.cast(_Outcomes, super().load())
+
+    def persistent_load(self, pid: tp.Any) -> tp.Any:
+        if self._originals is None:
+            self._originals = dict(self._memo.values())
+        return self._originals[pid]
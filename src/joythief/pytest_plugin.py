@@ -0,0 +1,131 @@
+"""`pytest`_ plugin explaining failed comparisons with matchers.
+
+.. versionadded:: 0.10.0
+
+Installed automatically alongside JoyThief (disable it with
+``-p no:joythief``). When an ``assert ... == ...`` involving a matcher fails,
+rather than pytest's generic diff of the two representations, the output
+lists each :py:class:`~joythief.core.Mismatch` with its path:
+
+.. code-block:: text
+
+    >       assert result == DictContaining(foo=[InstanceOf(int)], bar=123)
+    E       AssertionError: assert {'foo': ['baz']} == DictContaining(**{...})
+    E         2 mismatches:
+    E         ['foo'][0]: expected InstanceOf(<class 'int'>), got 'baz'
+    E         ['bar']: expected 123, got MISSING
+
+This uses the mismatches each matcher already found, if it was compared
+directly (e.g. as an item of a :py:class:`list`). Otherwise, it compares a
+:py:meth:`~joythief.core.Matcher.clone` (so the original matchers still
+represent the assertion), unless that has side effects (e.g. calling a
+callable again), in which case the matcher is reported as it is. Every value is shown
+with :py:mod:`reprlib`, so large values aren't rendered in full, and only the
+first 20 mismatches are listed (use ``-vv`` to see them all).
+
+.. _pytest: https://docs.pytest.org/en/stable/
+"""
+
+import reprlib
+import typing as tp
+
+from joythief.core import MISSING, Matcher, Mismatch, _clone, _is_repeatable, explain
+
+if tp.TYPE_CHECKING:
+    import pytest
+
+_LISTED = 20
+"""The maximum number of mismatches to list, without ``-vv``."""
+
+_REPR = reprlib.Repr()
+_REPR.maxlevel = 3
+_REPR.maxother = 80
+_REPR.maxstring = 60
+
+
+def pytest_assertrepr_compare(
+    config: "pytest.Config", op: str, left: tp.Any, right: tp.Any
+) -> tp.Optional[list[str]]:
+    """Explain a failed ``==`` comparison in which either side has matchers."""
+    if op != "==":
+        return None
+    if _has_matcher(right):
+        expected, actual = right, left
+    elif _has_matcher(left):
+        expected, actual = left, right
+    else:
+        return None
+    mismatches = _mismatches(expected, actual)
+    if not mismatches:
+        return None
+    listed = mismatches if config.getoption("verbose", 0) > 1 else mismatches[:_LISTED]
+    lines = [
+        f"{_REPR.repr(left)} == {_REPR.repr(right)}",
+        f"{len(mismatches)} mismatch{'' if len(mismatches) == 1 else 'es'}:",
+        *(_describe(mismatch) for mismatch in listed),
+    ]
+    if len(listed) < len(mismatches):
+        lines.append(f"... {len(mismatches) - len(listed)} more, use -vv to show")
+    return lines
+
+
+def _describe(mismatch: Mismatch) -> str:
+    path = "".join(f"[{_REPR.repr(key)}]" for key in mismatch.path) or "value"
+    return (
+        f"{path}: expected {_REPR.repr(mismatch.expected)},"
+        f" got {_REPR.repr(mismatch.actual)}"
+    )
+
+
+def _has_matcher(value: tp.Any) -> bool:
+    """Whether the value is, or (in plain containers) contains, a matcher."""
+    stack, seen = [value], set()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Matcher):
+            return True
+        if type(value) in {list, tuple, dict} and id(value) not in seen:
+            seen.add(id(value))
+            stack.extend(value.values() if type(value) is dict else value)
+    return False
+
+
+def _mismatches(expected: tp.Any, actual: tp.Any) -> list[Mismatch]:
+    """Collect the mismatches the matchers (in plain containers) recorded.
+
+    Those that weren't compared to the value at their path (e.g. because an
+    earlier item didn't match) are compared again as a clone, unless that has
+    side effects, in which case they're just reported as they are.
+    """
+    mismatches: list[Mismatch] = []
+    stack: list[tuple[tuple[tp.Any, ...], tp.Any, tp.Any]] = [((), expected, actual)]
+    while stack:
+        path, expected, actual = stack.pop()
+        if isinstance(expected, Matcher):
+            if expected._compared_once and expected._compared_to is actual:
+                found = expected.mismatches()
+            elif _is_repeatable(expected):
+                found = explain(_clone(expected, {}), actual)
+            else:
+                found = [Mismatch((), expected, actual)]
+            mismatches.extend(Mismatch(path + m.path, *m[1:]) for m in found)
+        elif type(expected) in {list, tuple, dict} and _has_matcher(expected):
+            if type(actual) is not type(expected) or len(actual) != len(expected):
+                mismatches.append(Mismatch(path, expected, actual))
+            elif type(expected) is dict:
+                stack.extend(
+                    (path + (key,), item, actual.get(key, MISSING))
+                    for key, item in reversed(expected.items())
+                )
+            else:
+                stack.extend(
+                    (path + (index,), item, other)
+                    for index, (item, other) in reversed(
+                        list(enumerate(zip(expected, actual)))
+                    )
+                )
+        else:
+            mismatches.extend(
+                Mismatch(path + m.path, *m[1:]) for m in explain(expected, actual)
+            )
+    return mismatches
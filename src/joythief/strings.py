@@ -7,12 +7,20 @@ import json
 import re
 import typing as tp
 from collections.abc import Mapping, Sequence
+from datetime import datetime
 from urllib.parse import parse_qs, urlparse
+from uuid import UUID
 
-from joythief.core import Matcher, MaybeMatcher
+from joythief.core import (
+    Comparison,
+    ContainerMatcher,
+    Matcher,
+    MaybeMatcher,
+    _Sentinel,
+)
 
 
-class JsonString(Matcher[str]):
+class JsonString(ContainerMatcher[str]):
     """Matches any :py:class:`str` instance representing JSON.
 
     :param expected: What the result of parsing the JSON should be.
@@ -20,7 +28,9 @@ class JsonString(Matcher[str]):
 
     """
 
-    __ANYTHING = object()
+    __ANYTHING = _Sentinel(__name__, "JsonString._JsonString__ANYTHING", "<anything>")
+
+    _accepts = (str,)
 
     _expected: tp.Any
 
@@ -28,14 +38,16 @@ class JsonString(Matcher[str]):
         super().__init__()
         self._expected = expected
 
-    def compare(self, other: tp.Any) -> bool:
+    def compare_children(self, other: tp.Any) -> Comparison:
         if not isinstance(other, str):
             return self.not_implemented
         try:
             parsed = json.loads(other)
         except json.decoder.JSONDecodeError:
             return False
-        return self._expected is self.__ANYTHING or parsed == self._expected
+        if self._expected is self.__ANYTHING:
+            return True
+        return (yield self._expected, parsed)
 
     def represent(self) -> str:
         if self._expected is self.__ANYTHING:
@@ -56,6 +68,8 @@ class StringMatching(Matcher[str]):
 
     """
 
+    _accepts = (str,)
+
     _pattern: re.Pattern[str]
 
     @classmethod
@@ -72,7 +86,8 @@ class StringMatching(Matcher[str]):
             '2025-07-22T14:16:48.708298'
 
         **Note** the match is only on structure, it does not attempt to validate
-        the actual datetime represented by the string.
+        the actual datetime represented by the string; see
+        :py:class:`DatetimeString` for that.
 
         .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
         """
@@ -97,6 +112,8 @@ class StringMatching(Matcher[str]):
 
             '36962eb6-d198-4661-9d97-437796e5146b'
 
+        See also :py:class:`UuidString`, which can check the version too.
+
         .. _UUIDs: https://en.wikipedia.org/wiki/Universally_unique_identifier
         """
         return cls(
@@ -145,6 +162,8 @@ class UrlString(Matcher[str]):
 
     """
 
+    _accepts = (str,)
+
     _hostname: tp.Optional[MaybeMatcher[str]]
     _path: tp.Optional[MaybeMatcher[str]]
     _query: tp.Optional[Mapping[str, Sequence[str]]]
@@ -202,6 +221,8 @@ class StringContaining(Matcher[str]):
 
     """
 
+    _accepts = (str,)
+
     _substring: str
 
     def __init__(self, substring: str):
@@ -215,3 +236,130 @@ class StringContaining(Matcher[str]):
 
     def represent(self) -> str:
         return f"{type(self).__name__}({self._substring!r})"
+
+
+class DatetimeString(Matcher[str]):
+    """Matches any :py:class:`str` instance representing a valid `ISO 8601`_
+    timestamp, or any :py:class:`~datetime.datetime` instance.
+
+    .. versionadded:: 0.10.0
+
+    :param strict: whether the string must have a full date *and* time in the
+      extended format created by :py:meth:`datetime.datetime.isoformat`, rather
+      than anything :py:meth:`datetime.datetime.fromisoformat` will accept
+      (e.g. a date alone)
+    :param timezone: whether the timestamp must (:py:const:`True`) or must not
+      (:py:const:`False`) have a UTC offset; either is matched if omitted
+
+    Unlike :py:meth:`StringMatching.iso8601`, the string is parsed, so e.g.
+    ``'2025-02-30T12:00:00'`` does *not* match. A trailing ``Z`` is accepted
+    as UTC on every supported Python version.
+
+    To validate a whole column of timestamps, use it as the template for
+    :py:class:`~joythief.data_structures.EveryItem`:
+
+    .. code-block:: python
+
+        assert [row["created_at"] for row in rows] == EveryItem(
+            DatetimeString(timezone=True)
+        )
+
+    .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
+    """
+
+    _accepts = (str, datetime)
+
+    _strict: bool
+    _timezone: tp.Optional[bool]
+
+    def __init__(self, *, strict: bool = True, timezone: tp.Optional[bool] = None):
+        super().__init__()
+        self._strict = strict
+        self._timezone = timezone
+
+    def compare(self, other: tp.Any) -> bool:
+        if isinstance(other, datetime):
+            parsed = other
+        elif isinstance(other, str):
+            if self._strict and (len(other) < 19 or other[4:17:3] not in _EXTENDED):
+                return False
+            if other[-1:] in {"Z", "z"}:
+                other = f"{other[:-1]}+00:00"
+            try:
+                parsed = datetime.fromisoformat(other)
+            except ValueError:
+                return False
+        else:
+            return self.not_implemented
+        if self._timezone is None:
+            return True
+        return (parsed.utcoffset() is not None) is self._timezone
+
+    def represent(self) -> str:
+        parameters = []
+        if not self._strict:
+            parameters.append("strict=False")
+        if self._timezone is not None:
+            parameters.append(f"timezone={self._timezone!r}")
+        return f"DatetimeString({', '.join(parameters)})"
+
+
+class UuidString(Matcher[str]):
+    """Matches any :py:class:`str` instance representing a `UUID`_, or any
+    :py:class:`~uuid.UUID` instance.
+
+    .. versionadded:: 0.10.0
+
+    :param strict: whether the string must be in the hyphenated 8-4-4-4-12
+      format created by stringifying :py:class:`~uuid.UUID`, rather than
+      anything the :py:class:`~uuid.UUID` constructor will accept (e.g.
+      without hyphens, or wrapped in braces)
+    :param version: the UUID version (e.g. ``4``) required, if any
+
+    :raises ValueError: if the version is not between 1 and 8.
+
+    .. _UUID: https://en.wikipedia.org/wiki/Universally_unique_identifier
+    """
+
+    _accepts = (str, UUID)
+
+    _strict: bool
+    _version: tp.Optional[int]
+
+    def __init__(self, *, strict: bool = True, version: tp.Optional[int] = None):
+        super().__init__()
+        if version is not None and not 1 <= version <= 8:
+            raise ValueError(f"invalid UUID version: {version!r}")
+        self._strict = strict
+        self._version = version
+
+    def compare(self, other: tp.Any) -> bool:
+        if isinstance(other, UUID):
+            return self._version is None or other.version == self._version
+        if not isinstance(other, str):
+            return self.not_implemented
+        if not self._strict:
+            try:
+                other = str(UUID(other))
+            except ValueError:
+                return False
+        elif _HYPHENATED.fullmatch(other) is None:
+            return False
+        return self._version is None or (
+            other[19] in "89abAB" and int(other[14], 16) == self._version
+        )
+
+    def represent(self) -> str:
+        parameters = []
+        if not self._strict:
+            parameters.append("strict=False")
+        if self._version is not None:
+            parameters.append(f"version={self._version!r}")
+        return f"UuidString({', '.join(parameters)})"
+
+
+_EXTENDED = frozenset({"--T::", "--t::", "-- ::"})
+"""The punctuation of ``YYYY-MM-DDTHH:MM:SS`` (every third character from the
+fifth), with each of the allowed separators."""
+
+_HYPHENATED = re.compile(r"[\da-fA-F]{8}(?:-[\da-fA-F]{4}){3}-[\da-fA-F]{12}")
@@ -0,0 +1,86 @@
+import typing as tp
+from operator import itemgetter
+
+import pytest
+
+from joythief.core import Matcher, Mismatch
+from joythief.data_structures import AllUnique
+from tests.marks import type_only
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [1, 2, 3],
+        [[1], [2], [1, 2]],
+        [dict(a=1), dict(a=2)],
+        pytest.param((i for i in range(5)), id="generator"),
+    ],
+    ids=repr,
+)
+def test_matches_unique_items(value: tp.Iterable[tp.Any]):
+    matcher: Matcher[tp.Iterable[tp.Any]] = AllUnique()
+    assert matcher == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1, 2, 1],
+        [1, 1.0],
+        [[1], [2], [1]],
+        [dict(a=1), dict(a=1)],
+        pytest.param((i % 2 for i in range(5)), id="generator"),
+    ],
+    ids=repr,
+)
+def test_does_not_match_duplicate_items(value: tp.Iterable[tp.Any]):
+    matcher: Matcher[tp.Iterable[tp.Any]] = AllUnique()
+    assert matcher != value
+
+
+@pytest.mark.parametrize("value", [123, None, "abc"], ids=repr)
+def test_does_not_match_non_iterables(value: tp.Any):
+    matcher: Matcher[tp.Iterable[tp.Any]] = AllUnique()
+    assert matcher != value
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ([3, 1, 3, 2, 1], [2, 4]),
+        ([[3], [1], [3], [2], [1]], [2, 4]),
+        ([{3}, {1}, {3}, {2}, {1}], [2, 4]),
+        ([dict(a=3), dict(a=1), dict(a=3), dict(a=2), dict(a=1)], [2, 4]),
+    ],
+    ids=["hashable", "sortable", "sets", "neither"],
+)
+def test_reports_duplicates_in_order(value: list[tp.Any], expected: list[int]):
+    matcher: Matcher[tp.Iterable[tp.Any]] = AllUnique()
+    assert matcher != value
+    assert [mismatch.path for mismatch in matcher.mismatches()] == [
+        (index,) for index in expected
+    ]
+
+
+def test_key_reports_original_items():
+    matcher: Matcher[tp.Iterable[dict[str, int]]] = AllUnique(key=itemgetter("id"))
+    assert matcher == [dict(id=1, v=1), dict(id=2, v=1)]
+    assert matcher != [dict(id=1, v=1), dict(id=1, v=2)]
+    assert matcher.mismatches() == [Mismatch((1,), matcher, dict(id=1, v=2))]
+
+
+def test_reports_at_most_ten_duplicates():
+    matcher: Matcher[tp.Iterable[int]] = AllUnique()
+    assert matcher != [0] * 100
+    assert len(matcher.mismatches()) == 10
+
+
+def test_repr():
+    assert repr(AllUnique[int]()) == "AllUnique()"
+
+
+@type_only
+def test_type_allunique_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[int]] = AllUnique()
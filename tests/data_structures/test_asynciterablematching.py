@@ -0,0 +1,117 @@
+import asyncio
+import typing as tp
+
+import pytest
+
+from joythief import Mismatch
+from joythief.core import Matcher
+from joythief.data_structures import AsyncIterableMatching
+from joythief.objects import InstanceOf
+from tests.marks import type_only
+
+
+async def produce(*items: tp.Any, delay: float = 0) -> tp.AsyncIterator[tp.Any]:
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+
+def test_check_matches_async_iterable():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int), length=3)
+    assert asyncio.run(matcher.check(produce(1, 2, 3)))
+    assert matcher.mismatches() == []
+
+
+def test_check_reports_failing_items():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int))
+    assert not asyncio.run(matcher.check(produce(1, "two", 3)))
+    assert [(m.path, m.actual) for m in matcher.mismatches()] == [((1,), "two")]
+    assert repr(matcher) == "[1, InstanceOf(<class 'int'>), 3]"
+
+
+def test_check_reports_wrong_length():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int), length=3)
+    assert not asyncio.run(matcher.check(produce(1, 2)))
+    assert matcher.mismatches() == [Mismatch((), 3, 2)]
+
+
+def test_check_consumes_whole_stream_by_default():
+    consumed: list[int] = []
+
+    async def producer() -> tp.AsyncIterator[tp.Any]:
+        for item in [1, "two", 3]:
+            consumed.append(1)
+            yield item
+
+    assert not asyncio.run(AsyncIterableMatching[tp.Any](1).check(producer()))
+    assert len(consumed) == 3
+
+
+def test_check_closes_stream_once_failed_in_fast_mode():
+    closed = False
+
+    async def producer() -> tp.AsyncIterator[int]:
+        nonlocal closed
+        try:
+            for item in range(1_000):
+                yield item
+        finally:
+            closed = True
+
+    matcher = AsyncIterableMatching[tp.Any](0)
+    assert not asyncio.run(matcher.check(producer(), fail_fast=True))
+    assert closed
+    assert matcher.mismatches() == [Mismatch((1,), 0, 1)]
+
+
+def test_check_stops_at_excess_items_in_fast_mode():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int), length=2)
+    assert not asyncio.run(matcher.check(produce(*range(100)), fail_fast=True))
+    assert matcher.mismatches() == [Mismatch((), 2, 3)]
+
+
+def test_check_times_out():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int))
+    with pytest.raises(TimeoutError):
+        asyncio.run(matcher.check(produce(1, 2, delay=1), timeout=0.01))
+
+
+def test_check_takes_length_from_queue():
+    async def check() -> bool:
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        asyncio.get_running_loop().call_later(0.01, queue.put_nowait, 2)
+        queue.put_nowait(1)
+        return await AsyncIterableMatching[tp.Any](InstanceOf(int), length=2).check(
+            queue
+        )
+
+    assert asyncio.run(check())
+
+
+def test_check_drains_queue_without_length():
+    async def check() -> bool:
+        queue: asyncio.Queue[tp.Any] = asyncio.Queue()
+        for item in [1, 2, "three"]:
+            queue.put_nowait(item)
+        return await AsyncIterableMatching[tp.Any](InstanceOf(int)).check(queue)
+
+    assert not asyncio.run(check())
+
+
+def test_check_rejects_synchronous_iterable():
+    matcher = AsyncIterableMatching[tp.Any](InstanceOf(int))
+    with pytest.raises(TypeError):
+        asyncio.run(matcher.check([1, 2]))  # type: ignore[arg-type]
+
+
+def test_compares_synchronous_iterable():
+    matcher: Matcher[tp.Iterable[int]] = AsyncIterableMatching(InstanceOf(int))
+    assert matcher == iter([1, 2])
+    assert repr(AsyncIterableMatching[tp.Any](1, length=2)) == (
+        "AsyncIterableMatching(1, length=2)"
+    )
+
+
+@type_only
+def test_type_asynciterablematching_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[int]] = AsyncIterableMatching(InstanceOf(int))
@@ -0,0 +1,144 @@
+import pickle
+import typing as tp
+from collections import OrderedDict
+
+import pytest
+
+from joythief.core import MISSING, Mismatch, explain
+from joythief.data_structures import AtPath, DictContaining
+from joythief.objects import InstanceOf
+
+DOCUMENT = {
+    "data": {
+        "items": [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}],
+        "links": {"next page": "/items?page=2"},
+    },
+    "total": 2,
+}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("total", 2),
+        ("data.items[0].id", 1),
+        ("data.items[-1].name", "bar"),
+        ('data.links["next page"]', "/items?page=2"),
+        ('["data"]["items"][1]["id"]', 2),
+        ("data.items", [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}]),
+    ],
+)
+def test_equals_value_at_path(path: str, expected: tp.Any):
+    assert AtPath(path, expected) == DOCUMENT
+
+
+def test_matches_value_at_path_with_matcher():
+    assert AtPath("data.items[1].id", InstanceOf(int)) == DOCUMENT
+    assert AtPath("data.items[1].id", InstanceOf(str)) != DOCUMENT
+
+
+def test_matches_all_paths():
+    matcher = AtPath(
+        {"data.items[0].id": 1, "data.items[1].id": InstanceOf(int), "total": 2}
+    )
+    assert matcher == DOCUMENT
+    assert AtPath({"data.items[0].id": 1, "total": 3}) != DOCUMENT
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["missing", "data.items[2]", "data.items[-3]", "total.foo", "data.items.id"],
+)
+def test_does_not_equal_missing_path(path: str):
+    assert AtPath(path, InstanceOf(object)) != DOCUMENT
+
+
+def test_looks_up_indices_as_mapping_keys():
+    assert AtPath("[1].foo", 123) == {1: {"foo": 123}}
+    assert AtPath("a.1", 123) == {"a": {"1": 123}}
+
+
+def test_accepts_any_mapping_or_sequence():
+    assert AtPath("a[0]", 123) == OrderedDict(a=(123,))
+
+
+@pytest.mark.parametrize("value", ["abc", b"abc", 123, None])
+def test_does_not_equal_non_document(value: tp.Any):
+    assert AtPath("[0]", InstanceOf(object)) != value
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["", ".foo", "foo.", "foo..bar", "foo[bar]", 'foo["bar]', "foo]", "foo[1.5]"],
+)
+def test_rejects_invalid_path(path: str):
+    with pytest.raises(ValueError):
+        AtPath(path, 123)
+
+
+def test_rejects_no_paths():
+    with pytest.raises(ValueError) as exc_info:
+        AtPath({})
+    assert exc_info.match("matches any document")
+
+
+def test_reports_mismatches_at_full_path():
+    expected = InstanceOf(str)
+    matcher = AtPath({"data.items[0].id": expected, "data.items[1].id": 2})
+    assert explain(matcher, DOCUMENT) == [
+        Mismatch(("data", "items", 0, "id"), expected, 1)
+    ]
+
+
+def test_reports_missing_prefix_against_paths_below_it():
+    matcher = AtPath({"data.meta.count": 2, "data.meta.pages[0]": 1, "total": 2})
+    [mismatch] = explain(matcher, DOCUMENT)
+    assert mismatch.path == ("data", "meta")
+    assert mismatch.actual is MISSING
+    assert repr(mismatch.expected) == "AtPath({'count': 2, 'pages[0]': 1})"
+
+
+def test_shares_lookups_of_common_prefixes():
+    class Document(dict[str, tp.Any]):
+        lookups = 0
+
+        def get(self, key: str, default: tp.Any = None) -> tp.Any:
+            Document.lookups += 1
+            return super().get(key, default)
+
+    document = Document(data=Document(a=1, b=2, c=3))
+    assert AtPath({"data.a": 1, "data.b": 2, "data.c": 3}) == document
+    assert Document.lookups == 4
+
+
+def test_repr_shows_single_path_before_comparison():
+    matcher = AtPath("data.items[0].id", InstanceOf(int))
+    assert repr(matcher) == "AtPath('data.items[0].id', InstanceOf(<class 'int'>))"
+
+
+def test_repr_shows_value_after_equal_comparison():
+    matcher = AtPath({"total": InstanceOf(int)})
+    assert matcher == DOCUMENT
+    assert repr(matcher) == repr(DOCUMENT)
+
+
+def test_repr_shows_compared_paths_after_unequal_comparison():
+    matcher = AtPath(
+        {"data.items[0].name": InstanceOf(str), "data.items[1].id": InstanceOf(str)}
+    )
+    assert matcher != DOCUMENT
+    assert repr(matcher) == (
+        "AtPath({'data.items[0].name': 'foo',"
+        " 'data.items[1].id': InstanceOf(<class 'str'>)})"
+    )
+
+
+def test_nests_in_other_matchers():
+    matcher = DictContaining(data=AtPath("items[0].id", 1))
+    assert matcher == DOCUMENT
+    assert matcher != dict(data=dict(items=[]))
+
+
+def test_pickled_matcher_is_equal():
+    matcher = AtPath({"data.items[0].id": 1, "data.items[1].id": InstanceOf(int)})
+    assert pickle.loads(pickle.dumps(matcher)) == DOCUMENT
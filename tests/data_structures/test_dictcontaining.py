@@ -7,6 +7,7 @@ import pytest
 from joythief.core import Matcher
 from joythief.data_structures import DictContaining
 from joythief.objects import InstanceOf
+from joythief.strings import StringMatching
 
 
 @pytest.mark.parametrize(
@@ -129,3 +130,45 @@ def test_supports_explicitly_optional_keys():
     assert dict() == matcher
     assert repr(matcher) == "DictContaining(**{'foo': DictContaining.optionally(123)})"
     assert dict(foo="bar") != matcher
+
+
+def test_clone_does_not_copy_compared_mapping():
+    matcher = DictContaining(foo=InstanceOf(int))
+    assert matcher == dict(foo=123, bar=456)
+    clone = matcher.clone()
+    assert isinstance(clone, DictContaining)
+    assert set(clone) == {"foo"}
+    assert repr(clone) == "DictContaining(**{'foo': InstanceOf(<class 'int'>)})"
+    assert clone == dict(foo=789)
+    assert repr(matcher) == "{'foo': 123, 'bar': 456}"
+
+
+def test_clone_clones_nested_matchers_in_plain_values():
+    matcher = DictContaining(foo=[InstanceOf(int)], bar="baz")
+    clone = matcher.clone()
+    assert clone["foo"][0] is not matcher["foo"][0]
+    assert clone == dict(foo=[123], bar="baz")
+    assert repr(matcher["foo"][0]) == "InstanceOf(<class 'int'>)"
+
+
+def test_reset_forgets_compared_mapping():
+    matcher = DictContaining(foo=InstanceOf(int))
+    assert matcher == dict(foo=123, bar=456)
+    matcher.reset()
+    assert set(matcher) == {"foo"}
+    assert repr(matcher) == "DictContaining(**{'foo': InstanceOf(<class 'int'>)})"
+
+
+def test_clone_supports_recursive_matchers():
+    matcher = DictContaining(foo=123)
+    matcher["self"] = matcher
+    clone = matcher.clone()
+    assert clone["self"] is clone
+    clone.reset()
+
+
+def test_frozen_matcher_key_matches_equal_key():
+    matcher = DictContaining({StringMatching("^f").frozen(): 1})
+    assert matcher == {"bar": 2, "foo": 1}
+    assert matcher != {"foo": 2}
+    assert matcher != {"bar": 1}
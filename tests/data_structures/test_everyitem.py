@@ -0,0 +1,119 @@
+import typing as tp
+from datetime import datetime, timedelta
+
+import pytest
+
+from joythief.core import Matcher
+from joythief.data_structures import DictContaining, EveryItem
+from joythief.datetimes import DatetimeCloseTo
+from joythief.objects import InstanceOf
+from tests.marks import type_only
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [1, 2, 3],
+        (1, 2, 3),
+        {1, 2, 3},
+        pytest.param((i for i in range(3)), id="generator"),
+    ],
+    ids=lambda v: type(v).__name__,
+)
+def test_equals_iterable_of_matching_items(value: tp.Iterable[int]):
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher == value
+
+
+def test_equals_empty_iterable():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher == []
+
+
+def test_does_not_equal_iterable_with_mismatching_item():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher != [1, "two", 3]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [123, None, "foo"],
+    ids=lambda v: type(v).__name__,
+)
+def test_does_not_equal_non_iterable(value: tp.Any):
+    matcher: Matcher[tp.Iterable[str]] = EveryItem(InstanceOf(str))
+    assert matcher != value
+
+
+def test_accepts_plain_value_template():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(123)
+    assert matcher == [123, 123]
+    assert matcher != [123, 456]
+    assert repr(matcher) == "EveryItem(123)"
+
+
+def test_repr_shows_template_before_comparison():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert repr(matcher) == "EveryItem(InstanceOf(<class 'int'>))"
+
+
+def test_repr_shows_value_after_equal_comparison():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher == [1, 2]
+    assert repr(matcher) == "[1, 2]"
+
+
+def test_repr_shows_failing_items_after_unequal_comparison():
+    matcher: Matcher[tp.Iterable[tp.Any]] = EveryItem(
+        DictContaining(id=InstanceOf(int), name=InstanceOf(str))
+    )
+    assert matcher != [dict(id=1, name="foo"), dict(id="2", name="bar")]
+    assert repr(matcher) == (
+        "[{'id': 1, 'name': 'foo'},"
+        " DictContaining(**{'id': InstanceOf(<class 'int'>), 'name': 'bar'})]"
+    )
+
+
+def test_repr_preserves_tuple():
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher != (1, "two")
+    assert repr(matcher) == "(1, InstanceOf(<class 'int'>))"
+
+
+def test_does_not_compare_template():
+    template = InstanceOf(int)
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(template)
+    assert matcher != [1, "two"]
+    assert matcher == [3]
+    assert repr(template) == "InstanceOf(<class 'int'>)"
+
+
+def test_only_copies_template_for_failures(monkeypatch: pytest.MonkeyPatch):
+    copies = 0
+    copy_template = EveryItem._copy_template
+
+    def counting_copy(self: EveryItem[int]) -> tp.Any:
+        nonlocal copies
+        copies += 1
+        return copy_template(self)
+
+    monkeypatch.setattr(EveryItem, "_copy_template", counting_copy)
+    matcher: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
+    assert matcher != [*range(1_000), "foo", None]
+    assert copies == 2
+
+
+def test_result_of_copied_template_is_used():
+    start = datetime(2025, 1, 1)
+    instants = iter([start, start + timedelta(hours=1)])
+    matcher: Matcher[tp.Iterable[datetime]] = EveryItem(
+        DatetimeCloseTo(lambda: next(instants), 1)
+    )
+    later = start + timedelta(hours=1)
+    assert matcher == [start, later]
+    assert repr(matcher) == repr([start, later])
+
+
+@type_only
+def test_type_everyitem_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[int]] = EveryItem(InstanceOf(int))
@@ -0,0 +1,123 @@
+import itertools
+import typing as tp
+from operator import itemgetter
+
+import pytest
+
+from joythief.core import Matcher, Mismatch
+from joythief.data_structures import IsSorted
+from tests.marks import type_only
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [1],
+        [1, 2, 2, 3],
+        (1.5, 2, 3),
+        pytest.param((i for i in range(5)), id="generator"),
+    ],
+    ids=repr,
+)
+def test_matches_sorted_iterables(value: tp.Iterable[float]):
+    matcher: Matcher[tp.Iterable[float]] = IsSorted()
+    assert matcher == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [2, 1],
+        [1, 3, 2],
+        [1, "two"],
+        pytest.param((i for i in [1, 0]), id="generator"),
+    ],
+    ids=repr,
+)
+def test_does_not_match_unsorted_iterables(value: tp.Iterable[tp.Any]):
+    matcher: Matcher[tp.Iterable[tp.Any]] = IsSorted()
+    assert matcher != value
+
+
+@pytest.mark.parametrize("value", [123, None, "cba"], ids=repr)
+def test_does_not_match_non_iterables(value: tp.Any):
+    matcher: Matcher[tp.Iterable[tp.Any]] = IsSorted()
+    assert matcher != value
+
+
+@pytest.mark.parametrize(
+    "kwargs, value, expected",
+    [
+        (dict(strict=True), [1, 2, 3], True),
+        (dict(strict=True), [1, 2, 2], False),
+        (dict(reverse=True), [3, 2, 2], True),
+        (dict(reverse=True), [1, 2], False),
+        (dict(reverse=True, strict=True), [3, 2, 2], False),
+        (dict(key=len), ["a", "bb", "cc"], True),
+        (dict(key=len), ["bb", "a"], False),
+    ],
+    ids=repr,
+)
+def test_options(kwargs: dict[str, tp.Any], value: list[tp.Any], expected: bool):
+    matcher: Matcher[tp.Iterable[tp.Any]] = IsSorted(**kwargs)
+    assert (matcher == value) is expected
+
+
+def test_reports_first_items_out_of_order():
+    matcher: Matcher[tp.Iterable[int]] = IsSorted()
+    assert matcher != (i % 3 for i in range(100))
+    mismatches = matcher.mismatches()
+    assert len(mismatches) == 10
+    assert mismatches[:2] == [
+        Mismatch((3,), matcher, 0),
+        Mismatch((6,), matcher, 0),
+    ]
+
+
+@pytest.mark.parametrize("wrap", [iter, tuple], ids=["iterator", "sequence"])
+@pytest.mark.parametrize("index", [1, 1023, 1024, 1025, 2999])
+def test_reports_items_out_of_order_across_chunks(
+    wrap: tp.Callable[[list[int]], tp.Iterable[int]], index: int
+):
+    values = list(range(3000))
+    values[index] = -1
+    matcher: Matcher[tp.Iterable[int]] = IsSorted()
+    assert matcher != wrap(values)
+    assert matcher.mismatches() == [Mismatch((index,), matcher, -1)]
+
+
+def test_stops_consuming_after_first_items_out_of_order():
+    matcher: Matcher[tp.Iterable[int]] = IsSorted()
+    assert matcher != itertools.count(0, -1)
+    assert [m.path for m in matcher.mismatches()] == [(i,) for i in range(1, 11)]
+
+
+def test_reports_original_items_with_key():
+    matcher: Matcher[tp.Iterable[dict[str, int]]] = IsSorted(key=itemgetter("id"))
+    assert matcher != [dict(id=2), dict(id=1)]
+    assert matcher.mismatches() == [Mismatch((1,), matcher, dict(id=1))]
+
+
+def test_does_not_match_unorderable_keys():
+    assert [dict(id=1), dict(id="two")] != IsSorted(key=itemgetter("id"))
+
+
+def test_propagates_errors_from_key():
+    def key(item: tp.Any) -> tp.Any:
+        return item + 1
+
+    with pytest.raises(TypeError):
+        _ = [1, "two"] == IsSorted(key=key)
+
+
+def test_repr():
+    assert repr(IsSorted[int]()) == "IsSorted()"
+    assert repr(IsSorted[int](reverse=True, strict=True)) == (
+        "IsSorted(reverse=True, strict=True)"
+    )
+
+
+@type_only
+def test_type_issorted_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[int]] = IsSorted()
@@ -0,0 +1,103 @@
+import typing as tp
+
+import pytest
+
+from joythief import Mismatch, explain
+from joythief.core import MISSING, Matcher
+from joythief.data_structures import IterableEqual, IterableMatching
+from joythief.numbers import AtLeast
+from joythief.objects import InstanceOf
+from tests.marks import type_only
+
+
+def test_matching_equals_generator_of_matching_items():
+    matcher: Matcher[tp.Iterable[int]] = IterableMatching(InstanceOf(int))
+    assert matcher == (i for i in range(1_000))
+
+
+def test_matching_does_not_equal_generator_with_mismatching_item():
+    matcher: Matcher[tp.Iterable[int]] = IterableMatching(InstanceOf(int))
+    assert matcher != iter([1, "two", 3])
+
+
+@pytest.mark.parametrize("value", [123, "foo", None], ids=lambda v: type(v).__name__)
+def test_matching_does_not_equal_non_iterable(value: tp.Any):
+    matcher: Matcher[tp.Iterable[int]] = IterableMatching(InstanceOf(int))
+    assert matcher != value
+
+
+def test_matching_checks_length():
+    matcher: Matcher[tp.Iterable[int]] = IterableMatching(123, length=AtLeast(2))
+    assert matcher == iter([123, 123])
+    assert matcher != iter([123])
+    assert explain(IterableMatching(123, length=3), iter([123])) == [Mismatch((), 3, 1)]
+
+
+def test_matching_shows_context_around_failures():
+    matcher: Matcher[tp.Iterable[tp.Any]] = IterableMatching(InstanceOf(int))
+    assert matcher != iter([*range(10), "foo", *range(11, 20), None])
+    assert repr(matcher) == (
+        "[..., 8, 9, InstanceOf(<class 'int'>), 11, 12, ..., 18, 19,"
+        " InstanceOf(<class 'int'>)]"
+    )
+
+
+def test_matching_merges_adjacent_context():
+    matcher: Matcher[tp.Iterable[tp.Any]] = IterableMatching(InstanceOf(int))
+    assert matcher != iter(["a", 1, 2, "b", 4, 5, 6])
+    assert repr(matcher) == (
+        "[InstanceOf(<class 'int'>), 1, 2, InstanceOf(<class 'int'>), 4, 5, ...]"
+    )
+
+
+def test_matching_reports_limited_failures():
+    matcher: Matcher[tp.Iterable[tp.Any]] = IterableMatching(InstanceOf(int))
+    failures = explain(matcher, (str(i) for i in range(1_000)))
+    assert [mismatch.path for mismatch in failures] == [(i,) for i in range(10)]
+
+
+def test_matching_repr_before_comparison():
+    matcher: Matcher[tp.Iterable[int]] = IterableMatching(InstanceOf(int), length=2)
+    assert repr(matcher) == ("IterableMatching(InstanceOf(<class 'int'>), length=2)")
+
+
+def test_equal_compares_items_in_order():
+    matcher: Matcher[tp.Iterable[int]] = IterableEqual(range(5))
+    assert matcher == (i for i in range(5))
+    assert IterableEqual([1, InstanceOf(str)]) == iter([1, "two"])
+    assert IterableEqual([1, 2]) != iter([2, 1])
+
+
+def test_equal_consumes_expected_lazily():
+    matcher: Matcher[tp.Iterable[int]] = IterableEqual(i * 2 for i in range(3))
+    assert matcher == iter([0, 2, 4])
+
+
+def test_equal_reports_different_lengths():
+    assert explain(IterableEqual([1, 2, 3]), iter([1])) == [
+        Mismatch((1,), 2, MISSING),
+        Mismatch((2,), 3, MISSING),
+    ]
+    assert explain(IterableEqual([1]), iter([1, 2])) == [Mismatch((1,), MISSING, 2)]
+
+
+def test_equal_shows_expected_items_around_differences():
+    matcher: Matcher[tp.Iterable[int]] = IterableEqual(range(10))
+    assert matcher != iter([0, 1, 2, 3, 4, 99, 6, 7, 8, 9])
+    assert repr(matcher) == "[..., 3, 4, 5, 6, 7, ...]"
+
+
+def test_equal_omits_extra_items():
+    matcher: Matcher[tp.Iterable[int]] = IterableEqual([1])
+    assert matcher != iter([1, 2])
+    assert repr(matcher) == "[1]"
+
+
+@type_only
+def test_type_iterablematching_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[int]] = IterableMatching(InstanceOf(int))
+
+
+@type_only
+def test_type_iterableequal_matches_iterable() -> None:
+    _: Matcher[tp.Iterable[str]] = IterableEqual(["foo", InstanceOf(str)])
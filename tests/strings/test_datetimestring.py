@@ -0,0 +1,86 @@
+import typing as tp
+from datetime import date, datetime, timezone
+
+import pytest
+
+from joythief.core import Matcher
+from joythief.data_structures import EveryItem
+from joythief.strings import DatetimeString
+from tests.marks import type_only
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(datetime.now().isoformat(), id="isoformat"),
+        pytest.param(datetime.now(tz=timezone.utc).isoformat(), id="isoformat UTC"),
+        pytest.param(str(datetime.now()), id="str"),
+        pytest.param(
+            datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z"),
+            id="isoformat Zulu",
+        ),
+        pytest.param(datetime.now(), id="datetime"),
+    ],
+)
+def test_matches_timestamp(value: tp.Any):
+    matcher = DatetimeString()
+    assert matcher == value
+    assert repr(matcher) == repr(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("2025-02-30T12:00:00", id="invalid day"),
+        pytest.param("2025-07-22T25:00:00", id="invalid hour"),
+        pytest.param(f"foo {datetime.now().isoformat()}", id="embedded"),
+        pytest.param("2025-07-22", id="date only"),
+        pytest.param("20250722T141648", id="basic format"),
+        pytest.param(date.today(), id="date"),
+        123,
+    ],
+)
+def test_does_not_match_invalid_timestamp(value: tp.Any):
+    assert DatetimeString() != value
+
+
+def test_non_strict_accepts_other_formats():
+    matcher = DatetimeString(strict=False)
+    assert matcher == "2025-07-22"
+    assert matcher != "2025-02-30"
+
+
+@pytest.mark.parametrize(
+    "value, aware",
+    [
+        ("2025-07-22T14:16:48", False),
+        ("2025-07-22T14:16:48+01:00", True),
+        ("2025-07-22T14:16:48Z", True),
+        (datetime(2025, 7, 22), False),
+        (datetime(2025, 7, 22, tzinfo=timezone.utc), True),
+    ],
+)
+def test_timezone_requirement(value: tp.Any, aware: bool):
+    assert (DatetimeString(timezone=True) == value) is aware
+    assert (DatetimeString(timezone=False) == value) is not aware
+
+
+def test_repr():
+    assert repr(DatetimeString()) == "DatetimeString()"
+    assert repr(DatetimeString(strict=False, timezone=True)) == (
+        "DatetimeString(strict=False, timezone=True)"
+    )
+
+
+def test_validates_column_of_timestamps():
+    column = [f"2025-07-{day:02}T12:00:00Z" for day in range(1, 32)]
+    matcher: Matcher[tp.Iterable[str]] = EveryItem(DatetimeString(timezone=True))
+    assert matcher == column
+    matcher = EveryItem(DatetimeString(timezone=True))
+    assert matcher != [*column, "2025-07-32T12:00:00Z"]
+    assert repr(matcher) == repr([*column, DatetimeString(timezone=True)])
+
+
+@type_only
+def test_type_datetimestring_matches_str() -> None:
+    _: Matcher[str] = DatetimeString()
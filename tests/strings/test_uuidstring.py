@@ -0,0 +1,69 @@
+import typing as tp
+from uuid import UUID, uuid1, uuid4
+
+import pytest
+
+from joythief.core import Matcher
+from joythief.strings import UuidString
+from tests.marks import type_only
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(str(uuid4()).lower(), id="lowercase"),
+        pytest.param(str(uuid4()).upper(), id="uppercase"),
+        pytest.param(uuid4(), id="UUID"),
+    ],
+)
+def test_matches_uuid(value: tp.Any):
+    matcher = UuidString()
+    assert matcher == value
+    assert repr(matcher) == repr(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "foo.bar",
+        pytest.param(f"foo {uuid4()} bar", id="embedded"),
+        pytest.param(uuid4().hex, id="unhyphenated"),
+        pytest.param(f"{{{uuid4()}}}", id="braces"),
+        pytest.param("+" + str(uuid4())[1:], id="sign"),
+        123,
+    ],
+)
+def test_does_not_match_non_uuid(value: tp.Any):
+    assert UuidString() != value
+
+
+def test_non_strict_accepts_other_formats():
+    matcher = UuidString(strict=False)
+    assert matcher == uuid4().hex
+    assert matcher == f"{{{uuid4()}}}"
+    assert matcher != "foo.bar"
+
+
+def test_matches_version():
+    matcher = UuidString(version=4)
+    assert matcher == str(uuid4())
+    assert matcher == uuid4()
+    assert matcher != str(uuid1())
+    assert matcher != UUID(int=0)
+
+
+def test_rejects_invalid_version():
+    with pytest.raises(ValueError):
+        UuidString(version=9)
+
+
+def test_repr():
+    assert repr(UuidString()) == "UuidString()"
+    assert repr(UuidString(strict=False, version=4)) == (
+        "UuidString(strict=False, version=4)"
+    )
+
+
+@type_only
+def test_type_uuidstring_matches_str() -> None:
+    _: Matcher[str] = UuidString()
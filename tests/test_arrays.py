@@ -0,0 +1,119 @@
+import math
+import typing as tp
+
+import pytest
+
+from joythief import Mismatch, explain
+from joythief.arrays import ArrayAllNaN, ArrayClose, ArrayNaNAt
+from joythief.numbers import NaN
+
+np = pytest.importorskip("numpy")
+
+
+def test_nan_matches_numpy_nan():
+    assert np.float32("nan") == NaN()
+    assert np.float64(1.5) != NaN()
+    assert np.int64(1) != NaN()
+
+
+def test_all_nan_matches_array_of_nan():
+    assert np.full((3, 2), np.nan) == ArrayAllNaN()
+    assert np.array([], dtype=np.float32) == ArrayAllNaN()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(np.array([np.nan, 1.0]), id="partial"),
+        pytest.param(np.zeros(3, dtype=int), id="integer"),
+        pytest.param([math.nan], id="list"),
+    ],
+)
+def test_all_nan_does_not_match_others(value: tp.Any):
+    assert value != ArrayAllNaN()
+
+
+def test_all_nan_reports_mismatched_elements():
+    matcher = ArrayAllNaN()
+    assert np.array([[np.nan, 1.0], [2.0, np.nan]]) != matcher
+    assert [mismatch.path for mismatch in matcher.mismatches()] == [(0, 1), (1, 0)]
+    assert matcher.mismatch_count() == 2
+
+
+def test_nan_at_matches_mask():
+    matcher = ArrayNaNAt([False, True, False])
+    assert np.array([1.0, np.nan, 3.0]) == matcher
+    assert np.array([np.nan, np.nan, 3.0]) != matcher
+    assert np.array([1.0, np.nan]) != matcher
+
+
+def test_nan_at_reports_expected_element():
+    matcher = ArrayNaNAt([False, True])
+    assert np.array([np.nan, 2.0]) != matcher
+    assert [repr(mismatch.expected) for mismatch in matcher.mismatches()] == [
+        "Not(NaN())",
+        "NaN()",
+    ]
+
+
+def test_close_matches_within_tolerance():
+    matcher = ArrayClose([1.0, 2.0, 3.0], atol=0.01)
+    assert np.array([1.001, 2.0, 2.999]) == matcher
+    assert np.array([1.1, 2.0, 3.0]) != matcher
+
+
+def test_close_requires_same_shape():
+    assert np.ones(2) == ArrayClose([1.0, 1.0])
+    assert np.ones(1) != ArrayClose([1.0, 1.0])
+    matcher = ArrayClose([1.0, 1.0])
+    assert np.ones((2, 2)) != matcher
+    assert matcher.mismatch_count() == 4
+
+
+def test_close_nan_only_matches_with_equal_nan():
+    assert np.array([np.nan]) != ArrayClose([np.nan])
+    assert np.array([np.nan]) == ArrayClose([np.nan], equal_nan=True)
+
+
+def test_close_reports_limited_mismatches_with_count():
+    matcher = ArrayClose(np.zeros(1_000_000))
+    actual = np.zeros(1_000_000)
+    actual[::1_000] = 1.0
+    assert actual != matcher
+    mismatches = matcher.mismatches()
+    assert len(mismatches) == 10
+    assert mismatches[1] == Mismatch((1_000,), 0.0, 1.0)
+    assert matcher.mismatch_count() == 1_000
+
+
+def test_mismatch_count_is_not_affected_by_later_changes():
+    matcher = ArrayClose(np.zeros(3))
+    actual = np.ones(3)
+    assert actual != matcher
+    actual[:] = 0.0
+    assert matcher.mismatch_count() == 3
+
+
+def test_mismatch_count_when_nested():
+    matcher = ArrayClose(np.zeros(3))
+    assert dict(foo=np.array([0.0, 1.0, 1.0])) != dict(foo=matcher)
+    assert matcher.mismatch_count() == 2
+
+
+def test_close_is_reported_at_path_when_nested():
+    matcher = ArrayClose([1.0])
+    assert explain(dict(foo=matcher), dict(foo=np.array([2.0]))) == [
+        Mismatch(("foo",), matcher, np.array([2.0]))
+    ]
+
+
+def test_close_repr():
+    assert repr(ArrayClose([1.0], atol=0.5, equal_nan=True)) == (
+        "ArrayClose(array([1.]), rtol=1e-05, atol=0.5, equal_nan=True)"
+    )
+
+
+def test_mismatch_count_requires_single_comparison():
+    matcher = ArrayAllNaN()
+    with pytest.raises(ValueError):
+        matcher.mismatch_count()
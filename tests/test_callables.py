@@ -0,0 +1,244 @@
+import asyncio
+import itertools
+import re
+import time
+import tracemalloc
+import typing as tp
+
+import pytest
+
+from joythief import Matcher, Mismatch
+from joythief.callables import (
+    AllocatesAtMost,
+    CompletesWithin,
+    Eventually,
+    Throughput,
+)
+from joythief.data_structures import DictContaining
+from joythief.numbers import AtLeast
+from tests.marks import type_only
+
+
+def counter() -> tp.Callable[[], int]:
+    return itertools.count().__next__
+
+
+def test_eventually_matches_once_result_matches():
+    matcher: Matcher[tp.Callable[[], int]] = Eventually(AtLeast(3), interval=0.001)
+    assert matcher == counter()
+    assert matcher.mismatches() == []
+
+
+def test_eventually_returns_without_waiting_for_first_match():
+    start = time.monotonic()
+    assert Eventually(0, timeout=10) == counter()
+    assert time.monotonic() - start < 1
+
+
+def test_eventually_backs_off_exponentially(monkeypatch: pytest.MonkeyPatch):
+    delays: list[float] = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    assert Eventually(4, interval=0.1, backoff=3) == counter()
+    assert delays == pytest.approx([0.1, 0.3, 0.9, 2.7])
+
+
+def test_eventually_reports_last_value_on_timeout():
+    matcher = Eventually[tp.Any](DictContaining(status="done"), timeout=0.05)
+    assert matcher != (lambda: dict(status="pending"))
+    assert repr(matcher) == "DictContaining(**{'status': 'done'})"
+    assert matcher.mismatches() == [Mismatch(("status",), "done", "pending")]
+
+
+def test_eventually_does_not_match_non_callable():
+    assert Eventually(1) != 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(timeout=-1), dict(interval=0), dict(backoff=0.5)],
+    ids=lambda kwargs: next(iter(kwargs)),
+)
+def test_eventually_rejects_invalid_configuration(kwargs: dict[str, float]):
+    with pytest.raises(ValueError):
+        Eventually(1, **kwargs)
+
+
+def test_eventually_repr():
+    assert repr(Eventually(1, timeout=2)) == (
+        "Eventually(1, timeout=2, interval=0.01, backoff=2.0)"
+    )
+
+
+def test_eventually_checks_coroutine_function():
+    values = counter()
+
+    async def poll() -> int:
+        return values()
+
+    matcher = Eventually[int](AtLeast(3), interval=0.001)
+    assert asyncio.run(matcher.check(poll))
+    assert repr(matcher) == repr(poll)
+
+
+def test_eventually_check_reports_last_value_on_timeout():
+    matcher = Eventually[tp.Any](DictContaining(status="done"), timeout=0.05)
+    assert not asyncio.run(matcher.check(lambda: dict(status="pending")))
+    assert matcher.mismatches() == [Mismatch(("status",), "done", "pending")]
+
+
+def fake_clock(
+    monkeypatch: pytest.MonkeyPatch, *durations: int
+) -> tp.Callable[[], None]:
+    """Make each call of the returned function take the next duration (ns)."""
+    now = 0
+    remaining = iter(durations)
+
+    def call() -> None:
+        nonlocal now
+        now += next(remaining)
+
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: now)
+    return call
+
+
+def test_completes_within_matches_fast_callable():
+    matcher: Matcher[tp.Callable[[], tp.Any]] = CompletesWithin(1)
+    assert matcher == (lambda: None)
+
+
+def test_completes_within_uses_percentile(monkeypatch: pytest.MonkeyPatch):
+    call = fake_clock(monkeypatch, 0, *[10_000_000] * 4, 90_000_000)
+    assert call == CompletesWithin(0.02)
+    call = fake_clock(monkeypatch, 0, *[10_000_000] * 4, 90_000_000)
+    assert call != CompletesWithin(0.02, percentile=100)
+
+
+def test_completes_within_discards_warmup(monkeypatch: pytest.MonkeyPatch):
+    call = fake_clock(monkeypatch, 10**9, 10**9, 1, 1, 1)
+    assert call == CompletesWithin(0.001, repeat=3, warmup=2)
+
+
+def test_completes_within_shows_distribution_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    call = fake_clock(monkeypatch, 0, 30_000_000, 10_000_000, 20_000_000)
+    matcher = CompletesWithin(0.01, repeat=3)
+    assert call != matcher
+    assert repr(matcher) == (
+        "CompletesWithin(0.01, repeat=3, warmup=1, percentile=50,"
+        " measured=[0.01, 0.02, 0.03])"
+    )
+
+
+def test_throughput_compares_rate(monkeypatch: pytest.MonkeyPatch):
+    call = fake_clock(monkeypatch, 0, *[1_000_000] * 5)
+    assert call == Throughput(at_least=1_000)
+    call = fake_clock(monkeypatch, 0, 1_000_000, 2_000_000, 4_000_000)
+    matcher = Throughput(at_least=1_000, repeat=3)
+    assert call != matcher
+    assert repr(matcher) == (
+        "Throughput(at_least=1000, repeat=3, warmup=1, percentile=50,"
+        " measured=[250, 500, 1e+03])"
+    )
+
+
+def test_timed_matchers_do_not_match_non_callable():
+    assert CompletesWithin(1) != 1
+    assert Throughput(at_least=1) != "foo"
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        pytest.param(lambda: CompletesWithin(-1), id="negative limit"),
+        pytest.param(lambda: Throughput(at_least=0), id="zero rate"),
+        pytest.param(lambda: CompletesWithin(1, repeat=0), id="repeat"),
+        pytest.param(lambda: CompletesWithin(1, warmup=-1), id="warmup"),
+        pytest.param(lambda: CompletesWithin(1, percentile=0), id="percentile"),
+        pytest.param(lambda: Throughput(at_least=1, percentile=101), id="above 100"),
+    ],
+)
+def test_timed_matchers_reject_invalid_configuration(
+    factory: tp.Callable[[], Matcher[tp.Any]],
+):
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_allocates_at_most_matches_small_allocation():
+    assert (lambda: None) == AllocatesAtMost(1_024, net=0)
+
+
+def test_allocates_at_most_checks_peak():
+    matcher: Matcher[tp.Callable[[], tp.Any]] = AllocatesAtMost(100_000)
+    assert (lambda: bytearray(1_000_000)) != matcher
+    assert (lambda: bytearray(1_000)) == AllocatesAtMost(100_000, net=0)
+
+
+def test_allocates_at_most_checks_net_allocation():
+    leaked: list[bytearray] = []
+    assert (lambda: leaked.append(bytearray(10_000))) != AllocatesAtMost(
+        1_000_000, net=1_000
+    )
+
+
+def test_allocates_at_most_shows_allocating_lines_on_failure():
+    leaked: list[bytearray] = []
+
+    def leak() -> None:
+        leaked.append(bytearray(10_000))
+
+    matcher = AllocatesAtMost(1_000)
+    assert leak != matcher
+    assert re.fullmatch(
+        r"AllocatesAtMost\(1000, measured_peak=\d+, measured_net=\d+,"
+        r" top=\['[^']*test_callables\.py:\d+: \+\d+ B'.*\]\)",
+        repr(matcher),
+    )
+
+
+def test_allocates_at_most_restores_tracing():
+    assert not tracemalloc.is_tracing()
+    assert (lambda: None) == AllocatesAtMost(1_024)
+    assert not tracemalloc.is_tracing()
+    tracemalloc.start()
+    try:
+        assert (lambda: None) == AllocatesAtMost(1_024)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_allocates_at_most_does_not_match_non_callable():
+    assert AllocatesAtMost(1) != 1
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        pytest.param(lambda: AllocatesAtMost(-1), id="size"),
+        pytest.param(lambda: AllocatesAtMost(1, net=-1), id="net"),
+        pytest.param(lambda: AllocatesAtMost(1, traceback_limit=0), id="traceback"),
+    ],
+)
+def test_allocates_at_most_rejects_invalid_configuration(
+    factory: tp.Callable[[], Matcher[tp.Any]],
+):
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_allocates_at_most_repr():
+    assert repr(AllocatesAtMost(10, net=0, traceback_limit=5)) == (
+        "AllocatesAtMost(10, net=0, traceback_limit=5)"
+    )
+
+
+@type_only
+def test_type_eventually_matches_callable() -> None:
+    _: Matcher[tp.Callable[[], int]] = Eventually(AtLeast(1))
+
+
+@type_only
+def test_type_completeswithin_matches_callable() -> None:
+    _: Matcher[tp.Callable[[], tp.Any]] = CompletesWithin(1)
@@ -1,7 +1,36 @@
+import typing as tp
+from collections import OrderedDict
+from unittest import mock
+
 import pytest
 
-from joythief.compound import AllOf, AnyOf
+from joythief import explain
+from joythief.compound import AllOf, AnyOf, Not
+from joythief.core import Matcher, Mismatch
+from joythief.data_structures import DictContaining
+from joythief.objects import Anything, InstanceOf, Nothing, Nullable
 from joythief.strings import JsonString, StringMatching
+from tests.marks import type_only
+
+
+class IntegerCounter(Matcher[int]):
+
+    _accepts = (int,)
+
+    calls: int
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def compare(self, other: tp.Any) -> bool:
+        self.calls += 1
+        if not isinstance(other, int):
+            return self.not_implemented
+        return True
+
+    def represent(self) -> str:
+        return super().represent()
 
 
 def test_allof_false_if_none_match():
@@ -52,3 +81,213 @@ def test_anyof_requires_some_matchers():
 def test_anyof_warns_on_single_matcher():
     with pytest.warns(UserWarning):
         _ = AnyOf(JsonString())
+
+
+def test_clone_clones_child_matchers():
+    child = StringMatching(r"fo+")
+    matcher = AllOf(JsonString(), child)
+    assert "foo" != matcher
+    clone = matcher.clone()
+    assert repr(clone) == "AllOf(JsonString(), StringMatching(re.compile('fo+')))"
+    assert "bar" != clone
+    assert repr(child) == "'foo'"
+
+
+def test_reset_resets_child_matchers():
+    matcher = AnyOf(JsonString(), StringMatching(r"fo+"))
+    assert "foo" == matcher
+    assert "bar" != matcher
+    matcher.reset()
+    assert "foo" != AllOf(matcher, JsonString())
+    assert repr(matcher) == "'foo'"
+
+
+def test_allof_represents_elided_matchers():
+    matcher = AllOf(JsonString(), StringMatching(r"fo+")).limit_mismatches(1)
+    assert "bar" != matcher
+    assert repr(matcher) == "AllOf(JsonString(), ...)"
+
+
+def test_allof_represents_elided_leaf_matchers():
+    matcher = AllOf[tp.Any](InstanceOf(str), InstanceOf(bytes)).limit_mismatches(1)
+    assert 123 != matcher
+    assert repr(matcher) == "AllOf(InstanceOf(<class 'str'>), ...)"
+
+
+def test_allof_reports_mismatches_of_nested_compounds():
+    inner, negated, outer = InstanceOf(str), Not(InstanceOf(int)), InstanceOf(bytes)
+    matcher = AllOf[tp.Any](
+        Nullable(inner), negated, outer, AnyOf[tp.Any](inner, InstanceOf(int))
+    )
+    assert explain(matcher, 123) == [
+        Mismatch((), inner, 123),
+        Mismatch((), negated, 123),
+        Mismatch((), outer, 123),
+    ]
+
+
+def test_deeply_nested_compounds_do_not_reach_recursion_limit():
+    matcher: Matcher[tp.Any] = InstanceOf(int)
+    for _ in range(10_000):
+        matcher = Not(matcher)
+    assert matcher == 123
+    assert matcher != "foo"
+
+
+def test_not_true_if_child_does_not_match():
+    assert "foo" == Not(JsonString())
+
+
+def test_not_false_if_child_matches():
+    assert "{}" != Not(JsonString())
+
+
+def test_not_accepts_plain_value():
+    matcher = Not(None)
+    assert matcher == 123
+    assert matcher != None  # noqa: E711
+
+
+def test_not_reports_itself_as_mismatch():
+    matcher = Not(DictContaining(foo=InstanceOf(int)))
+    assert explain(matcher, dict(foo=123)) == [Mismatch((), matcher, dict(foo=123))]
+    assert explain(matcher, dict(foo="bar")) == []
+
+
+def test_or_operator_builds_anyof():
+    matcher = InstanceOf(int) | InstanceOf(str)
+    assert isinstance(matcher, AnyOf)
+    assert matcher == "foo"
+    assert repr(matcher) == "'foo'"
+
+
+def test_and_operator_builds_allof():
+    matcher = JsonString() & StringMatching(r"^{}$")
+    assert isinstance(matcher, AllOf)
+    assert "{}" == matcher
+    assert "[]" != matcher
+
+
+def test_invert_operator_builds_not():
+    matcher = ~JsonString()
+    assert isinstance(matcher, Not)
+    assert "foo" == matcher
+
+
+def test_operators_flatten_nested_compounds():
+    a, b, c, d = (StringMatching(pattern) for pattern in "abcd")
+    assert repr((a | b) | (c | AnyOf(d, a))) == repr(AnyOf(a, b, c, d))
+    assert repr((a & b) & (c & d)) == repr(AllOf(a, b, c, d))
+
+
+def test_operators_do_not_flatten_other_compounds():
+    a, b, c = (StringMatching(pattern) for pattern in "abc")
+    assert repr((a & b) | c) == repr(AnyOf(AllOf(a, b), c))
+
+
+def test_operators_deduplicate_identical_children():
+    matcher = (InstanceOf(int) | InstanceOf(str)) | (
+        InstanceOf(str) | InstanceOf(int, nullable=True)
+    )
+    assert repr(matcher) == (
+        "AnyOf(InstanceOf(<class 'int'>), InstanceOf(<class 'str'>),"
+        " InstanceOf(<class 'int'>, nullable=True))"
+    )
+
+
+def test_operators_deduplicate_compared_children():
+    first = DictContaining(foo=[InstanceOf(int)])
+    assert first == dict(foo=[1])
+    assert repr(first | DictContaining(foo=[InstanceOf(int)])) == "{'foo': [1]}"
+
+
+def test_operators_return_single_remaining_child():
+    matcher = InstanceOf(int)
+    assert (matcher | InstanceOf(int)) is matcher
+    assert (matcher & Anything()) is matcher
+    assert (Nothing() | matcher) is matcher
+
+
+@pytest.mark.parametrize(
+    "matcher, expected",
+    [
+        (InstanceOf(int) | Anything(), Anything),
+        (InstanceOf(int) & Nothing(), Nothing),
+        (Anything() & Anything(), Anything),
+        (Nothing() | Nothing(), Nothing),
+        (~Anything(), Nothing),
+        (~Nothing(), Anything),
+    ],
+)
+def test_operators_fold_constants(matcher: Matcher[tp.Any], expected: type):
+    assert type(matcher) is expected
+
+
+def test_double_inversion_cancels_out():
+    matcher = JsonString()
+    assert ~~matcher is matcher
+
+
+def test_operators_reject_plain_values():
+    with pytest.raises(TypeError):
+        _ = InstanceOf(int) | None  # type: ignore[operator]
+
+
+def test_or_operator_combines_dictcontaining():
+    matcher = DictContaining(foo=1) | DictContaining(bar=2)
+    assert isinstance(matcher, AnyOf)
+    assert matcher == dict(bar=2)
+
+
+@type_only
+def test_type_or_operator_matches_either_type() -> None:
+    _: Matcher[tp.Union[int, str]] = InstanceOf(int) | InstanceOf(str)
+
+
+def strings(count: int = 7) -> list[Matcher[tp.Any]]:
+    return [StringMatching(rf"x{i}") for i in range(count)]
+
+
+def test_anyof_skips_matchers_not_accepting_type():
+    counter = IntegerCounter()
+    matcher = AnyOf[tp.Any](counter, StringMatching(r"fo+"), *strings(6))
+    assert "foo" == matcher
+    assert "bar" != matcher
+    assert counter.calls == 0
+    assert 123 == matcher
+    assert counter.calls == 1
+
+
+def test_anyof_compares_all_of_few_matchers():
+    counter = IntegerCounter()
+    assert "foo" == AnyOf[tp.Any](counter, StringMatching(r"fo+"))
+    assert counter.calls == 1
+
+
+@pytest.mark.parametrize("others", [[], strings()], ids=["few", "many"])
+def test_anyof_compares_plain_values(others: list[Matcher[tp.Any]]):
+    matcher = AnyOf[tp.Any](None, InstanceOf(int), *others)  # type: ignore[arg-type]
+    assert None == matcher  # noqa: E711
+    assert 1 == matcher
+    assert "1" != matcher
+
+
+def test_anyof_dispatches_on_subclasses():
+    matcher = AnyOf[tp.Any](*strings(), DictContaining(foo=1))
+    assert matcher == OrderedDict(foo=1)
+
+
+def test_anyof_falls_back_to_reflected_comparison_for_skipped_matchers():
+    assert mock.ANY == AnyOf[tp.Any](JsonString(), DictContaining(foo=1), *strings())
+
+
+def test_anyof_reports_itself_if_all_matchers_skipped():
+    matcher = AnyOf[tp.Any](JsonString(), DictContaining(foo=1), *strings())
+    assert explain(matcher, 123) == [Mismatch((), matcher, 123)]
+
+
+def test_anyof_compares_all_matchers_for_spec_mocks():
+    counter = IntegerCounter()
+    matcher = AnyOf[tp.Any](counter, *(InstanceOf(bytes) for _ in range(7)))
+    assert matcher != mock.Mock(spec=str)
+    assert counter.calls == 1
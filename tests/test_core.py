@@ -1,10 +1,32 @@
+import copy
+import functools
+import os
+import pickle
+import subprocess
+import sys
 import typing as tp
+from unittest import mock
 
 import pytest
 
-from joythief.core import Matcher, MaybeMatcher
-from joythief.objects import InstanceOf
-from joythief.strings import StringMatching
+from joythief import Mismatch, explain
+from joythief.compound import AllOf, AnyOf, Not
+from joythief.core import (
+    ELIDED,
+    MISSING,
+    Comparison,
+    ContainerMatcher,
+    Frozen,
+    Matcher,
+    MaybeMatcher,
+    _ShallowMatcher,
+    mismatch_budget,
+    retain_state,
+)
+from joythief.data_structures import DictContaining, EveryItem
+from joythief.numbers import Close
+from joythief.objects import InstanceOf, Nullable
+from joythief.strings import JsonString, StringMatching
 from tests.marks import type_only
 
 
@@ -69,6 +91,514 @@ def test_core_matcher_permits_not_implemented(recwarn: pytest.WarningsRecorder):
     assert len(recwarn.list) == 0
 
 
+def test_core_matcher_clone_is_uncompared():
+    matcher = EqMatcher(123)
+    assert matcher == 123
+    clone = matcher.clone()
+    assert repr(clone) == "EqMatcher(123)"
+    assert repr(matcher) == "123"
+
+
+def test_core_matcher_clone_does_not_share_state():
+    matcher = EqMatcher(123)
+    clone = matcher.clone()
+    assert clone == 123
+    assert repr(clone) == "123"
+    assert repr(matcher) == "EqMatcher(123)"
+
+
+def test_core_matcher_clone_preserves_type_and_configuration():
+    clone = EqMatcher(123).clone()
+    assert type(clone) is EqMatcher
+    assert clone == 123
+    assert clone != 456
+
+
+def test_core_matcher_reset_forgets_comparison():
+    matcher = EqMatcher(123)
+    assert matcher == 123
+    matcher.reset()
+    assert repr(matcher) == "EqMatcher(123)"
+    assert matcher == 123
+    assert repr(matcher) == "123"
+
+
+class Pair(ContainerMatcher[tuple[tp.Any, tp.Any]]):
+
+    def __init__(self, first: tp.Any, second: tp.Any) -> None:
+        super().__init__()
+        self._first = first
+        self._second = second
+
+    def compare_children(self, other: tp.Any) -> Comparison:
+        if not isinstance(other, tuple) or len(other) != 2:
+            return self.not_implemented
+        first = yield self._first, other[0]
+        second = yield self._second, other[1]
+        return first and second
+
+    def represent(self) -> str:
+        return f"Pair({self._first!r}, {self._second!r})"
+
+
+def test_container_matcher_compares_children():
+    assert Pair(InstanceOf(int), "foo") == (123, "foo")
+    assert Pair(InstanceOf(int), "foo") != (123, "bar")
+    assert Pair(InstanceOf(int), "foo") != [123, "foo"]
+
+
+def test_container_matcher_records_child_comparisons():
+    first, second = InstanceOf(int), InstanceOf(str)
+    matcher = Pair(first, second)
+    assert matcher != (123, 456)
+    assert repr(matcher) == "Pair(123, InstanceOf(<class 'str'>))"
+    assert repr(first) == "123"
+
+
+def test_container_matcher_unpacks_plain_containers():
+    inner = InstanceOf(str)
+    matcher = Pair([EqMatcher(1), {"foo": inner}], (EqMatcher(2),))
+    assert matcher == ([1, {"foo": "bar"}], (2,))
+    assert repr(inner) == "'bar'"
+    assert matcher != ([1, {"foo": "bar"}], [2])
+    assert matcher != ([1, {"foo": "bar", "baz": "qux"}], (2,))
+
+
+def test_container_matcher_falls_back_to_reflected_comparison():
+    assert Pair(EqMatcher(1), EqMatcher(2)) == (mock.ANY, 2)
+    assert Pair(EqMatcher(1), EqMatcher(2)) != ("foo", 2)
+
+
+def test_container_matcher_handles_arbitrary_depth():
+    node = DictContaining(value=InstanceOf(int))
+    node["child"] = Nullable(node)
+    value: tp.Any = None
+    for index in range(10_000):
+        value = dict(value=index, child=value)
+    assert node == value
+    bottom = value
+    while bottom["child"] is not None:
+        bottom = bottom["child"]
+    bottom["value"] = "foo"
+    assert node != value
+
+
+def test_container_matcher_handles_cycles_in_value():
+    node = DictContaining(value=InstanceOf(int))
+    node["next"] = node
+    first: dict[str, tp.Any] = dict(value=1)
+    first["next"] = dict(value=2, next=first)
+    assert node == first
+    first["next"]["value"] = "two"
+    assert node != first
+
+
+def test_container_matcher_handles_cycles_in_unrecorded_comparisons():
+    node = DictContaining(value=InstanceOf(int))
+    node["children"] = EveryItem(node)
+    root: dict[str, tp.Any] = dict(value=1, children=[dict(value=2, children=[])])
+    root["children"][0]["children"].append(root)
+    assert node == root
+
+
+class StrictDict(DictContaining):
+
+    def compare(self, other: tp.Any) -> bool:
+        return super().compare(other) and len(other) == len(self)
+
+
+class ShortJsonString(JsonString):
+
+    def compare(self, other: tp.Any) -> bool:
+        return len(other) <= 10 and super().compare(other)
+
+
+def test_container_matcher_subclass_can_override_compare():
+    assert StrictDict(foo=1) == dict(foo=1)
+    assert StrictDict(foo=1) != dict(foo=1, bar=2)
+    assert ShortJsonString({"foo": 1}) == '{"foo": 1}'
+    assert ShortJsonString({"foo": 1}) != '{"foo":        1}'
+
+
+def test_container_matcher_subclass_overriding_compare_is_used_as_child():
+    assert DictContaining(foo=StrictDict(bar=1)) == dict(foo=dict(bar=1))
+    assert DictContaining(foo=StrictDict(bar=1)) != dict(foo=dict(bar=1, baz=2))
+    assert [ShortJsonString({"foo": 1})] != ['{"foo":        1}']
+
+
+def test_container_matcher_subclass_overriding_compare_is_one_mismatch():
+    matcher = StrictDict(foo=InstanceOf(int))
+    assert matcher != dict(foo=1, bar=2)
+    assert matcher.mismatches() == [Mismatch((), matcher, dict(foo=1, bar=2))]
+
+
+def test_explain_lists_nothing_for_equal_values():
+    assert explain(DictContaining(foo=[InstanceOf(int)]), dict(foo=[123])) == []
+
+
+def test_explain_lists_mismatches_with_paths():
+    inner = InstanceOf(int)
+    mismatches = explain(
+        DictContaining(foo=[inner, "bar"], baz=123, qux=456),
+        dict(foo=["one", "bar"], baz=789),
+    )
+    assert mismatches == [
+        Mismatch(("foo", 0), inner, "one"),
+        Mismatch(("baz",), 123, 789),
+        Mismatch(("qux",), 456, MISSING),
+    ]
+
+
+def test_explain_reports_type_mismatch_at_container():
+    matcher = DictContaining(foo=123)
+    assert explain(dict(bar=matcher), dict(bar="foo")) == [
+        Mismatch(("bar",), matcher, "foo")
+    ]
+
+
+def test_explain_reports_failed_alternatives_as_single_mismatch():
+    matcher = AnyOf[tp.Any](InstanceOf(int), InstanceOf(str))
+    assert explain([matcher], [None]) == [Mismatch((0,), matcher, None)]
+
+
+def test_explain_reports_all_failures_for_conjunction():
+    first, second = InstanceOf(int), InstanceOf(str)
+    assert explain(AllOf(first, second), None) == [
+        Mismatch((), first, None),
+        Mismatch((), second, None),
+    ]
+
+
+def test_explain_ignores_failures_of_successful_alternatives():
+    matcher = DictContaining(foo=AnyOf[tp.Any](InstanceOf(int), InstanceOf(str)))
+    assert explain(matcher, dict(foo="bar")) == []
+
+
+def test_explain_reports_every_item():
+    matcher: Matcher[tp.Any] = EveryItem(DictContaining(id=InstanceOf(int)))
+    mismatches = explain(matcher, [dict(id=1), dict(id="2"), dict()])
+    assert [mismatch.path for mismatch in mismatches] == [(1, "id"), (2, "id")]
+    assert [mismatch.actual for mismatch in mismatches] == ["2", MISSING]
+
+
+def test_explain_reports_leaf_matcher():
+    matcher = EqMatcher(123)
+    assert explain(matcher, 456) == [Mismatch((), matcher, 456)]
+
+
+def test_explain_reports_plain_values():
+    assert explain([1, [2, 3]], [1, [2, 4]]) == [Mismatch((1, 1), 3, 4)]
+    assert explain([1, 2], [1]) == [Mismatch((), [1, 2], [1])]
+
+
+def test_mismatches_found_by_last_comparison():
+    matcher = DictContaining(foo=InstanceOf(int))
+    assert matcher.mismatches() == []
+    assert matcher != dict(foo="bar")
+    assert matcher.mismatches() == [Mismatch(("foo",), matcher["foo"], "bar")]
+    assert matcher == dict(foo=123)
+    assert matcher.mismatches() == []
+
+
+def test_mismatches_of_shallow_matcher_agree_with_explain():
+    matcher = DictContaining(
+        foo=AllOf[tp.Any](InstanceOf(int), Nullable(InstanceOf(str))),
+        bar=DictContaining.optionally(1),
+        baz=AnyOf[tp.Any](InstanceOf(int), InstanceOf(str)),
+        qux=123,
+    )
+    value = dict(foo=1.5, bar="two", baz=None)
+    assert matcher != value
+    assert matcher.mismatches() == explain(matcher, value)
+    assert [mismatch.path for mismatch in matcher.mismatches()] == [
+        ("foo",),
+        ("foo",),
+        ("bar",),
+        ("baz",),
+        ("qux",),
+    ]
+
+
+SHALLOW_COMPARISONS: list[tuple[tp.Any, tp.Any]] = [
+    (AllOf[tp.Any](InstanceOf(int), Nullable(InstanceOf(str))), 1.5),
+    (AllOf[tp.Any](InstanceOf(int), EqMatcher(2), EqMatcher(3)).limit_mismatches(1), 1),
+    (AnyOf[tp.Any](InstanceOf(int), StringMatching("f.*")), "bar"),
+    (AnyOf[tp.Any](InstanceOf(str), StringMatching("f.*")), 1),
+    (Not(InstanceOf(int)), 1),
+    (Nullable(InstanceOf(int)), None),
+    (Nullable(InstanceOf(int)), "foo"),
+    (
+        DictContaining(
+            {InstanceOf(str).frozen(): 1},
+            foo=DictContaining.optionally(InstanceOf[tp.Any](int)),
+            bar=2,
+        ),
+        dict(baz=1, foo="qux"),
+    ),
+    (DictContaining(foo=1, bar=2, baz=3).limit_mismatches(2), dict()),
+    (DictContaining.optionally(InstanceOf(int)), "foo"),
+]
+
+
+@pytest.mark.parametrize("matcher, value", SHALLOW_COMPARISONS)
+def test_shallow_comparison_agrees_with_compare_children(
+    matcher: _ShallowMatcher[tp.Any], value: tp.Any
+):
+    shallow, stacked = matcher.clone(), matcher.clone()
+    result, mismatches = shallow._explain_shallow(value)
+    expected_result, expected_mismatches = ContainerMatcher._explain(stacked, value)
+    assert result == expected_result
+    assert repr(mismatches) == repr(expected_mismatches)
+    assert repr(shallow) == repr(stacked)
+
+
+def test_mismatches_of_leaf_matcher():
+    matcher = EqMatcher(123)
+    assert matcher != 456
+    assert matcher.mismatches() == [Mismatch((), matcher, 456)]
+
+
+def test_mismatches_are_forgotten_on_reset():
+    matcher = EqMatcher(123)
+    assert matcher != 456
+    matcher.reset()
+    assert matcher.mismatches() == []
+
+
+def test_mismatch_budget_stops_comparison_early():
+    matcher: Matcher[tp.Any] = EveryItem(InstanceOf(int))
+    with mismatch_budget(2):
+        mismatches = explain(matcher, [1, "two", 3, "four", "five"])
+    assert [mismatch.path for mismatch in mismatches] == [(1,), (3,)]
+    assert (
+        repr(matcher)
+        == "[1, InstanceOf(<class 'int'>), 3, InstanceOf(<class 'int'>), ...]"
+    )
+
+
+def test_mismatch_budget_does_not_change_result():
+    with mismatch_budget(1):
+        assert DictContaining(foo=1, bar=2) != dict(foo=0, bar=2)
+        assert DictContaining(foo=1, bar=2) == dict(foo=1, bar=2)
+
+
+def test_mismatch_budget_ignores_failed_alternatives():
+    matcher = AnyOf[tp.Any](
+        DictContaining(foo=InstanceOf(str), bar=InstanceOf(str)),
+        DictContaining(foo=InstanceOf(int)),
+    )
+    with mismatch_budget(1):
+        assert matcher == dict(foo=1, bar=2)
+
+
+def test_mismatch_budget_is_restored_after_context():
+    matcher = DictContaining(foo=1, bar=2)
+    with mismatch_budget(1):
+        pass
+    assert matcher != dict(foo=0, bar=0)
+    assert len(matcher.mismatches()) == 2
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_mismatch_budget_must_be_positive(limit: int):
+    with pytest.raises(ValueError):
+        with mismatch_budget(limit):
+            pass
+
+
+def test_limit_mismatches_stops_container_early():
+    matcher = DictContaining(foo=InstanceOf(int), bar=InstanceOf(int))
+    assert matcher.limit_mismatches(1) is matcher
+    assert matcher != dict(foo="one", bar="two")
+    assert matcher.mismatches() == [Mismatch(("foo",), matcher["foo"], "one")]
+    assert (
+        repr(matcher)
+        == "DictContaining(**{'foo': InstanceOf(<class 'int'>), 'bar': ...})"
+    )
+
+
+def test_limit_mismatches_applies_per_container():
+    matcher = DictContaining(foo=DictContaining(a=1, b=2).limit_mismatches(1), bar=3)
+    assert explain(matcher, dict(foo=dict(a=0, b=0), bar=0)) == [
+        Mismatch(("foo", "a"), 1, 0),
+        Mismatch(("bar",), 3, 0),
+    ]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_limit_mismatches_must_be_positive(limit: int):
+    with pytest.raises(ValueError):
+        DictContaining(foo=1).limit_mismatches(limit)
+
+
+def test_limit_mismatches_not_supported_for_alternatives():
+    with pytest.raises(TypeError):
+        AnyOf[tp.Any](InstanceOf(int), InstanceOf(str)).limit_mismatches(1)
+
+
+def test_frozen_matchers_with_same_configuration_are_equal():
+    frozen = {
+        InstanceOf(int).frozen(),
+        InstanceOf(int).frozen(),
+        InstanceOf(str).frozen(),
+        DictContaining(foo=[InstanceOf(int)]).frozen(),
+        DictContaining(foo=[InstanceOf(int)]).frozen(),
+    }
+    assert len(frozen) == 3
+    assert InstanceOf(int).frozen() != InstanceOf(str).frozen()
+
+
+def test_frozen_matcher_ignores_previous_comparisons():
+    matcher = EqMatcher(123)
+    assert matcher == 123
+    assert matcher.frozen() == EqMatcher(123).frozen()
+    assert hash(matcher.frozen()) == hash(EqMatcher(123).frozen())
+
+
+def test_frozen_matcher_compares_like_wrapped_matcher():
+    matcher = DictContaining(foo=InstanceOf(int)).frozen()
+    assert matcher == dict(foo=1, bar=2)
+    assert repr(matcher) == "{'foo': 1, 'bar': 2}"
+    assert [(m.path, m.actual) for m in explain(matcher, dict(foo="1"))] == [
+        (("foo",), "1")
+    ]
+
+
+def test_frozen_matcher_is_not_affected_by_original():
+    original = DictContaining(foo=1)
+    frozen = original.frozen()
+    original["foo"] = 2
+    assert frozen == dict(foo=1)
+    assert frozen == DictContaining(foo=1).frozen()
+
+
+def test_frozen_matcher_is_not_affected_by_expected_values():
+    expected = dict(foo=[1])
+    frozen = JsonString(expected).frozen()
+    expected["foo"].append(2)
+    assert frozen == '{"foo": [1]}'
+    assert frozen != '{"foo": [1, 2]}'
+    assert frozen == JsonString(dict(foo=[1])).frozen()
+    assert hash(frozen) == hash(JsonString(dict(foo=[1])).frozen())
+
+
+def test_frozen_matcher_is_immutable():
+    frozen = InstanceOf(int).frozen()
+    with pytest.raises(AttributeError):
+        frozen._matcher = InstanceOf(int)
+    assert frozen.frozen() is frozen
+
+
+def test_frozen_matcher_can_be_memoized():
+    calls = 0
+
+    @functools.lru_cache
+    def describe(matcher: Frozen[tp.Any]) -> str:
+        nonlocal calls
+        calls += 1
+        return repr(matcher)
+
+    describe(InstanceOf(int).frozen())
+    describe(InstanceOf(int).frozen())
+    assert calls == 1
+
+
+def test_pickled_matcher_is_uncompared():
+    matcher = DictContaining(foo=InstanceOf(int))
+    assert matcher != dict(foo="bar")
+    unpickled = pickle.loads(pickle.dumps(matcher))
+    assert repr(unpickled) == "DictContaining(**{'foo': InstanceOf(<class 'int'>)})"
+    assert unpickled.mismatches() == []
+    assert unpickled == dict(foo=123)
+
+
+def test_pickled_matcher_excludes_compared_values():
+    matcher = InstanceOf(int)
+    uncompared = len(pickle.dumps(matcher))
+    assert matcher == 123_456_789
+    assert len(pickle.dumps(matcher)) == uncompared
+
+
+def test_pickled_matcher_retains_state_on_request():
+    matcher = [1, Close(1.0), InstanceOf(int)]
+    assert matcher != [1, 1.0, "two"]
+    with retain_state():
+        unpickled = pickle.loads(pickle.dumps(matcher))
+    assert repr(unpickled) == repr(matcher) == "[1, 1.0, InstanceOf(<class 'int'>)]"
+    assert [(m.path, m.actual) for m in unpickled[2].mismatches()] == [((), "two")]
+
+
+def test_copied_matcher_is_uncompared():
+    matcher = EveryItem[int](InstanceOf(int))
+    assert matcher == [1, 2, 3]
+    assert repr(copy.deepcopy(matcher)) == "EveryItem(InstanceOf(<class 'int'>))"
+    with retain_state():
+        assert repr(copy.deepcopy(matcher)) == "[1, 2, 3]"
+
+
+@pytest.mark.parametrize("sentinel", [ELIDED, MISSING])
+def test_sentinels_keep_their_identity(sentinel: tp.Any):
+    assert pickle.loads(pickle.dumps(sentinel)) is sentinel
+    assert copy.deepcopy(sentinel) is sentinel
+
+
+def test_pickled_json_string_still_matches_anything():
+    matcher = pickle.loads(pickle.dumps(JsonString()))
+    assert matcher == "[1, 2, 3]"
+    assert repr(JsonString()) == "JsonString()"
+
+
+def test_pickled_frozen_matcher_is_equal():
+    frozen = DictContaining(foo=InstanceOf(str)).frozen()
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    assert unpickled == frozen
+    assert hash(unpickled) == hash(frozen)
+    assert unpickled == dict(foo="bar")
+
+
+def test_matchers_round_trip_through_subprocess():
+    expected = [
+        JsonString(),
+        [Close(0.5), EveryItem[float](Close(0.5))],
+        DictContaining({InstanceOf(str).frozen(): [InstanceOf(int), InstanceOf(int)]}),
+        MISSING,
+    ]
+    script = (
+        "import pickle, sys\n"
+        "from joythief.core import MISSING, retain_state\n"
+        "*matchers, missing = pickle.load(sys.stdin.buffer)\n"
+        "assert missing is MISSING\n"
+        "assert matchers != ['{}', [0.5, [0.5, 0.5]], {'foo': [1, 'two']}]\n"
+        "with retain_state():\n"
+        "    pickle.dump(matchers, sys.stdout.buffer)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        input=pickle.dumps(expected),
+        capture_output=True,
+        check=True,
+        # a different seed, so str hashes differ from this process
+        env={
+            **os.environ,
+            "PYTHONHASHSEED": "1",
+            "PYTHONPATH": os.pathsep.join(sys.path),
+        },
+    )
+    compared = pickle.loads(result.stdout)
+    assert repr(compared) == (
+        "['{}', [0.5, [0.5, 0.5]],"
+        " DictContaining(**{'foo': [1, InstanceOf(<class 'int'>)]})]"
+    )
+    assert [(m.path, m.actual) for m in compared[2].mismatches()] == [
+        (("foo", 1), "two")
+    ]
+
+
+@type_only
+def test_type_clone_returns_same_type() -> None:
+    _: EqMatcher = EqMatcher(123).clone()
+
+
 @type_only
 def test_type_maybematcher_accepts_matcher() -> None:
     _: MaybeMatcher[str] = InstanceOf(str)
@@ -87,3 +617,8 @@ def test_type_maybematcher_does_not_accept_other_matcher() -> None:
 @type_only
 def test_type_maybematcher_does_not_accept_other_value() -> None:
     _: MaybeMatcher[str] = 123  # type: ignore[assignment]
+
+
+@type_only
+def test_type_frozen_preserves_type() -> None:
+    _: Matcher[int] = EqMatcher(123).frozen()
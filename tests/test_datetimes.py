@@ -0,0 +1,114 @@
+import typing as tp
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+
+import pytest
+
+from joythief import Matcher, Mismatch, explain
+from joythief.data_structures import DictContaining
+from joythief.datetimes import DatetimeCloseTo, _parse
+from tests.marks import type_only
+
+REFERENCE = datetime(2025, 7, 22, 14, 16, 48, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(REFERENCE, id="same"),
+        pytest.param(REFERENCE + timedelta(seconds=5), id="after"),
+        pytest.param(REFERENCE - timedelta(seconds=5), id="before"),
+        pytest.param("2025-07-22T14:16:50+00:00", id="string"),
+        pytest.param("2025-07-22T14:16:50Z", id="string Zulu"),
+        pytest.param("2025-07-22T16:16:50+02:00", id="string other offset"),
+    ],
+)
+def test_matches_datetime_within_tolerance(value: tp.Any):
+    assert DatetimeCloseTo(REFERENCE, timedelta(seconds=5)) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(REFERENCE + timedelta(seconds=6), id="after"),
+        pytest.param(REFERENCE - timedelta(seconds=6), id="before"),
+        pytest.param(REFERENCE.replace(tzinfo=None), id="naive"),
+        pytest.param("2025-07-22T14:17:00Z", id="string"),
+        pytest.param("not a timestamp", id="invalid string"),
+        pytest.param(REFERENCE.date(), id="date"),
+        123,
+    ],
+)
+def test_does_not_match_other_values(value: tp.Any):
+    assert DatetimeCloseTo(REFERENCE, 5) != value
+
+
+def test_accepts_string_reference():
+    matcher = DatetimeCloseTo("2025-07-22T14:16:48Z", 1)
+    assert matcher == REFERENCE
+    with pytest.raises(ValueError):
+        DatetimeCloseTo("yesterday", 1)
+
+
+def test_rejects_negative_tolerance():
+    with pytest.raises(ValueError):
+        DatetimeCloseTo(REFERENCE, -1)
+
+
+def test_calls_reference_function_once():
+    calls: list[datetime] = []
+
+    def now() -> datetime:
+        calls.append(datetime.now())
+        return calls[-1]
+
+    matcher = DatetimeCloseTo(now, 5)
+    assert not calls
+    assert matcher == datetime.now()
+    assert matcher == datetime.now()
+    assert len(calls) == 1
+    assert matcher.clone() == datetime.now()
+    assert len(calls) == 2
+
+
+def test_checks_payload_in_one_comparison():
+    now = partial(datetime.now, tz=timezone.utc)
+    created = (now() - timedelta(seconds=1)).isoformat()
+    matcher = DictContaining(
+        created_at=DatetimeCloseTo(now, 5),
+        updated_at=DatetimeCloseTo(now, 5),
+    )
+    payload = {"created_at": created, "updated_at": "2000-01-01T00:00:00Z"}
+    assert explain(matcher, payload) == [
+        Mismatch(("updated_at",), matcher["updated_at"], "2000-01-01T00:00:00Z")
+    ]
+
+
+def test_caches_parsed_strings():
+    _parse.cache_clear()
+    matcher = DatetimeCloseTo(REFERENCE, 5)
+    for _ in range(3):
+        assert matcher == "2025-07-22T14:16:48Z"
+    assert _parse.cache_info().hits == 2
+
+
+def test_repr():
+    assert repr(DatetimeCloseTo(REFERENCE, 5)) == (
+        f"DatetimeCloseTo({REFERENCE!r}, datetime.timedelta(seconds=5))"
+    )
+
+
+def test_repr_shows_value_after_equal_comparison():
+    matcher = DatetimeCloseTo(REFERENCE, 5)
+    assert matcher == "2025-07-22T14:16:48Z"
+    assert repr(matcher) == "'2025-07-22T14:16:48Z'"
+
+
+@type_only
+def test_type_datetimecloseto_matches_datetime() -> None:
+    _: Matcher[datetime] = DatetimeCloseTo(datetime.now, timedelta(seconds=1))
+
+
+@type_only
+def test_type_datetimecloseto_requires_datetime_reference() -> None:
+    DatetimeCloseTo(date.today, 1)  # type: ignore[arg-type]
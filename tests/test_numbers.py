@@ -1,10 +1,24 @@
 import math
 import typing as tp
+from decimal import Decimal
+from fractions import Fraction
+from unittest import mock
 
 import pytest
 
-from joythief.core import Matcher
-from joythief.numbers import NaN
+from joythief import Mismatch
+from joythief.compound import AnyOf
+from joythief.core import MISSING, Matcher
+from joythief.numbers import (
+    AtLeast,
+    AtMost,
+    Between,
+    Close,
+    GreaterThan,
+    LessThan,
+    NaN,
+)
+from joythief.objects import InstanceOf
 from tests.marks import type_only
 
 
@@ -53,3 +67,288 @@ def test_type_nan_allows_int() -> None:
 @type_only
 def test_type_nan_does_not_allow_other() -> None:
     _: Matcher[str] = NaN()  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1, 1.5, 2, Decimal("1.25"), Fraction(3, 2)],
+    ids=lambda v: type(v).__name__,
+)
+def test_between_matches_numbers_in_range(value: tp.Any):
+    assert value == Between(1, 2)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, 2.000001, Decimal("0.99"), Fraction(7, 3), math.nan, Decimal("NaN")],
+    ids=repr,
+)
+def test_between_does_not_match_numbers_out_of_range(value: tp.Any):
+    assert value != Between(1, 2)
+
+
+@pytest.mark.parametrize("value", [True, "1", None], ids=repr)
+def test_between_does_not_match_non_numbers(value: tp.Any):
+    assert value != Between(0, 2)
+
+
+def test_between_compares_mixed_types_exactly():
+    assert 0.1 != Between(0, Decimal("0.1"))
+    assert Fraction(1, 10) == Between(Decimal("0.1"), 0.2)
+    assert Decimal("0.1") == Between(0, Fraction(1, 10))
+
+
+def test_between_exclusive_bounds():
+    matcher = Between(1, 2, include_lower=False, include_upper=False)
+    assert 1 != matcher
+    assert 1.5 == matcher
+    assert 2 != matcher
+
+
+@pytest.mark.parametrize(
+    "lower, upper, kwargs",
+    [
+        (2, 1, {}),
+        (1, 1, dict(include_upper=False)),
+        (math.nan, 1, {}),
+        (1, Decimal("NaN"), {}),
+    ],
+)
+def test_between_rejects_empty_ranges(
+    lower: tp.Any, upper: tp.Any, kwargs: dict[str, bool]
+):
+    with pytest.raises(ValueError):
+        _ = Between(lower, upper, **kwargs)
+
+
+def test_between_rejects_non_numeric_bounds():
+    with pytest.raises(TypeError):
+        _ = Between("a", "b")
+
+
+@pytest.mark.parametrize(
+    "matcher, expected",
+    [
+        (Between(1, 2), "Between(1, 2)"),
+        (Between(1.5, 2, include_lower=False), "Between(1.5, 2, include_lower=False)"),
+        (GreaterThan(1), "GreaterThan(1)"),
+        (AtLeast(1), "AtLeast(1)"),
+        (LessThan(1), "LessThan(1)"),
+        (AtMost(1), "AtMost(1)"),
+    ],
+    ids=lambda v: v if isinstance(v, str) else "",
+)
+def test_range_repr(matcher: Matcher[tp.Any], expected: str):
+    assert repr(matcher) == expected
+
+
+@pytest.mark.parametrize(
+    "matcher, below, at, above",
+    [
+        (GreaterThan(1), False, False, True),
+        (AtLeast(1), False, True, True),
+        (LessThan(1), True, False, False),
+        (AtMost(1), True, True, False),
+    ],
+    ids=repr,
+)
+def test_one_sided_ranges(matcher: Matcher[tp.Any], below: bool, at: bool, above: bool):
+    assert (Fraction(1, 2) == matcher) is below
+    assert (Decimal(1) == matcher) is at
+    assert (1.5 == matcher) is above
+
+
+@pytest.fixture
+def buckets() -> AnyOf[int]:
+    return AnyOf(
+        LessThan(0),
+        *(Between(i * 10, i * 10 + 5) for i in range(20)),
+        GreaterThan(1_000),
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (-1, True),
+        (0, True),
+        (3.5, True),
+        (Fraction(11, 2), False),
+        (195, True),
+        (196, False),
+        (1_000, False),
+        (Decimal("1000.5"), True),
+        (math.nan, False),
+        (True, False),
+    ],
+    ids=repr,
+)
+def test_anyof_indexes_many_ranges(buckets: AnyOf[int], value: tp.Any, expected: bool):
+    assert (value == buckets) is expected
+
+
+def test_anyof_only_compares_ranges_containing_value(buckets: AnyOf[int]):
+    with mock.patch.object(Between, "compare", autospec=True) as compare:
+        compare.return_value = True
+        assert 42 == buckets
+    compare.assert_called_once_with(mock.ANY, 42)
+
+
+def test_anyof_does_not_record_ranges_not_containing_value(buckets: AnyOf[int]):
+    with mock.patch.object(Between, "_record", autospec=True) as record:
+        assert 42 == buckets
+    record.assert_called_once_with(mock.ANY, 42, True)
+
+
+def test_anyof_indexes_overlapping_ranges():
+    ranges = [Between(i, i + 10) for i in range(10)]
+    assert 9.5 == AnyOf(*ranges)
+    assert [repr(range_) for range_ in ranges] == ["9.5"] * 10
+    assert 19.5 != AnyOf(*ranges[:-1])
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        (1.0, 1.0000001),
+        (0, 1e-13),
+        (1, Fraction(1, 1)),
+        (Decimal("0.1"), 0.1000000001),
+        (math.inf, math.inf),
+        ([1.0, (2.0, 3.0)], [1.0, (2.0000001, 3.0)]),
+        (dict(a=1.0, b=dict(c=[2.0])), dict(a=1.0, b=dict(c=[2.0000001]))),
+    ],
+    ids=repr,
+)
+def test_close_matches_within_tolerance(expected: tp.Any, actual: tp.Any):
+    assert actual == Close(expected)
+
+
+@pytest.mark.parametrize(
+    "expected, actual",
+    [
+        (1.0, 1.001),
+        (1.0, True),
+        (1.0, "1.0"),
+        (math.inf, 1e308),
+        (math.nan, math.nan),
+        ([1.0, 2.0], (1.0, 2.0)),
+        ([1.0, 2.0], [1.0]),
+        (dict(a=1.0), dict(a=1.0, b=2.0)),
+        (dict(a=1.0), dict()),
+    ],
+    ids=repr,
+)
+def test_close_does_not_match_outside_tolerance(expected: tp.Any, actual: tp.Any):
+    assert actual != Close(expected)
+
+
+def test_close_tolerances():
+    assert 1.05 == Close(1.0, rel=0.1)
+    assert 1.05 != Close(1.0, rel=0.01)
+    assert 0.05 == Close(0.0, abs=0.1)
+
+
+def test_close_nan_equal():
+    assert [math.nan, Decimal("NaN")] == Close([math.nan, math.nan], nan_equal=True)
+    assert 1.0 != Close(math.nan, nan_equal=True)
+
+
+def test_close_compares_other_values_and_matchers():
+    matcher = Close(dict(id=InstanceOf(int), name="foo", value=1.0))
+    assert dict(id=1, name="foo", value=1.0000001) == matcher
+    assert dict(id="1", name="foo", value=1.0) != matcher
+
+
+def test_close_reports_every_mismatch_with_path():
+    matcher = Close(dict(a=[1.0, 2.0, 3.0], b=4.0, c=5.0))
+    assert dict(a=[1.0, 2.5, 3.5], c=5.0) != matcher
+    assert matcher.mismatches() == [
+        Mismatch(("a", 1), 2.0, 2.5),
+        Mismatch(("a", 2), 3.0, 3.5),
+        Mismatch(("b",), 4.0, MISSING),
+    ]
+
+
+@pytest.mark.parametrize("index", [0, 50, 99])
+def test_close_batches_long_lists(index: int):
+    expected = [float(i + 1) for i in range(100)]
+    actual = expected.copy()
+    actual[index] += 1e-9
+    assert actual == Close(expected)
+    actual[index] += 0.5
+    assert actual != Close(expected)
+    actual[index] = math.nan
+    assert actual != Close(expected)
+
+
+def test_close_batched_lists_only_match_zero_within_absolute_tolerance():
+    expected = [float(i) for i in range(100)]
+    actual = expected.copy()
+    actual[0] = 1e-13
+    assert actual == Close(expected)
+    actual[0] = 1e-9
+    assert actual != Close(expected)
+
+
+@pytest.mark.parametrize("index", [0, 50, 99])
+def test_close_batched_lists_match_infinity_exactly(index: int):
+    expected = [float(i) for i in range(100)]
+    expected[index] = math.inf
+    actual = expected.copy()
+    assert actual == Close(expected)
+    actual[index] = 1e308
+    assert actual != Close(expected)
+    actual[index] = -math.inf
+    assert actual != Close(expected)
+
+
+@pytest.mark.parametrize("index", [0, 50, 99])
+def test_close_batched_lists_reject_huge_int(index: int):
+    expected = [float(i) for i in range(100)]
+    actual: list[tp.Any] = expected.copy()
+    actual[index] = 10**400
+    matcher = Close(expected)
+    assert actual != matcher
+    assert matcher.mismatches() == [Mismatch((index,), expected[index], 10**400)]
+
+
+def test_close_compares_huge_int():
+    assert 10**400 != Close(1.0)
+    assert 1.0 != Close(10**400)
+    assert 10**400 + 1 == Close(10**400)
+    assert 2 * 10**400 != Close(10**400)
+
+
+def test_close_batched_lists_report_mismatches():
+    matcher = Close([float(i) for i in range(100)])
+    actual = [float(i) for i in range(100)]
+    actual[42] = 42.5
+    actual[43] = 43
+    actual[44] = True
+    assert actual != matcher
+    assert matcher.mismatches() == [
+        Mismatch((42,), 42.0, 42.5),
+        Mismatch((44,), 44.0, True),
+    ]
+
+
+def test_close_rejects_negative_tolerance():
+    with pytest.raises(ValueError):
+        _ = Close(1.0, rel=-1)
+
+
+def test_close_repr():
+    assert repr(Close([1.0], rel=0.1, nan_equal=True)) == (
+        "Close([1.0], rel=0.1, abs=1e-12, nan_equal=True)"
+    )
+
+
+@type_only
+def test_type_between_allows_int() -> None:
+    _: Matcher[int] = Between(1, 2)
+
+
+@type_only
+def test_type_between_does_not_allow_other() -> None:
+    _: Matcher[str] = Between(1, 2)  # type: ignore[arg-type]
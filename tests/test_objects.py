@@ -1,5 +1,8 @@
 import typing as tp
+from abc import ABC
+from collections.abc import Mapping, Sized
 from datetime import date, datetime
+from unittest import mock
 
 import pytest
 
@@ -13,6 +16,15 @@ class NewType:
     pass
 
 
+@tp.runtime_checkable
+class SupportsClose(tp.Protocol):
+    def close(self) -> None: ...
+
+
+class NotRuntimeCheckable(tp.Protocol):
+    def close(self) -> None: ...
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -91,6 +103,67 @@ def test_instanceof_nullable_repr():
     )
 
 
+def test_instanceof_abstract_base_class():
+    matcher: Matcher[Sized] = InstanceOf(Sized)
+    assert matcher == []
+    assert matcher == {}
+    assert matcher != 123
+
+
+def test_instanceof_abstract_base_class_registration():
+    class Abstract(ABC):
+        pass
+
+    matcher: Matcher[Abstract] = InstanceOf(Abstract)
+    assert matcher != NewType()
+    Abstract.register(NewType)
+    assert matcher == NewType()
+
+
+def test_instanceof_abstract_base_class_uses_class_attribute():
+    assert mock.Mock(spec=dict) == InstanceOf(Mapping)
+
+
+def test_instanceof_abstract_base_class_many_types():
+    matcher: Matcher[tp.Any] = InstanceOf(Sized, nullable=True)
+    for index in range(300):
+        assert matcher != type(f"Type{index}", (), {})()
+    assert matcher == "foo"
+    assert matcher == None
+
+
+def test_instanceof_runtime_checkable_protocol():
+    closeable = NewType()
+    matcher: Matcher[tp.Any] = InstanceOf(SupportsClose)
+    assert matcher != closeable
+    setattr(closeable, "close", lambda: None)
+    assert matcher == closeable
+
+
+def test_instanceof_rejects_protocol_not_runtime_checkable():
+    with pytest.raises(TypeError):
+        _ = InstanceOf(NotRuntimeCheckable)
+
+
+def test_instanceof_clone_and_reset():
+    matcher: Matcher[Sized] = InstanceOf(Sized)
+    assert matcher == []
+    clone = matcher.clone()
+    assert repr(clone) == "InstanceOf(<class 'collections.abc.Sized'>)"
+    assert clone == "foo"
+    matcher.reset()
+    assert matcher != 123
+
+
+def test_instanceof_clone_does_not_share_decisions():
+    matcher = InstanceOf[Sized](Sized)
+    assert matcher == []
+    clone = matcher.clone()
+    assert clone == "foo"
+    assert clone._decisions is not matcher._decisions
+    assert list(matcher._decisions) == [list]
+
+
 @type_only
 def test_type_instanceof_matches_type() -> None:
     _: Matcher[str] = InstanceOf(str)
@@ -0,0 +1,133 @@
+import multiprocessing
+import typing as tp
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pytest
+
+from joythief.core import MISSING, Mismatch, explain, mismatch_budget
+from joythief.data_structures import DictContaining
+from joythief.objects import InstanceOf
+from joythief.parallel import InParallel
+from joythief.strings import JsonString
+
+
+@pytest.fixture(scope="module")
+def executor() -> tp.Iterator[Executor]:
+    with ProcessPoolExecutor(
+        2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        yield executor
+
+
+def expected_records(count: int) -> list[tp.Any]:
+    return [
+        DictContaining(id=InstanceOf(int), body=JsonString({"name": InstanceOf(str)}))
+        for _ in range(count)
+    ]
+
+
+def actual_records(count: int) -> list[dict[str, tp.Any]]:
+    return [dict(id=i, body=f'{{"name": "record {i}"}}') for i in range(count)]
+
+
+def test_equals_matching_sequence(executor: Executor):
+    matcher = InParallel(expected_records(5), executor=executor, chunk_size=2)
+    assert matcher == actual_records(5)
+
+
+def test_does_not_equal_sequence_with_mismatching_item(executor: Executor):
+    actual = actual_records(5)
+    actual[3]["id"] = "three"
+    matcher = InParallel(expected_records(5), executor=executor, chunk_size=2)
+    assert matcher != actual
+
+
+@pytest.mark.parametrize("value", ["abc", b"abc", 123, {1, 2, 3}])
+def test_does_not_equal_non_sequence(value: tp.Any):
+    matcher = InParallel[tp.Any](["a", "b", "c"])
+    assert matcher != value
+
+
+def test_compares_in_own_executor():
+    matcher = InParallel[int]([InstanceOf(int) for _ in range(4)], chunk_size=2)
+    assert matcher == [1, 2, 3, 4]
+    assert repr(matcher) == "[1, 2, 3, 4]"
+
+
+def test_compares_single_chunk_in_process():
+    matcher = InParallel[int]([InstanceOf(int) for _ in range(3)])
+    assert matcher != [1, "two", 3]
+    assert repr(matcher) == "[1, InstanceOf(<class 'int'>), 3]"
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_chunk_size_must_be_positive(chunk_size: int):
+    with pytest.raises(ValueError):
+        InParallel([1, 2, 3], chunk_size=chunk_size)
+
+
+def test_repr_shows_expected_before_comparison():
+    matcher = InParallel[int]([InstanceOf(int)])
+    assert repr(matcher) == "InParallel([InstanceOf(<class 'int'>)])"
+
+
+def test_repr_matches_serial_comparison(executor: Executor):
+    actual = actual_records(6)
+    actual[1]["id"] = "one"
+    actual[4]["body"] = '{"name": 4}'
+    serial = InParallel(expected_records(6), chunk_size=6)
+    parallel = InParallel(expected_records(6), executor=executor, chunk_size=2)
+    assert serial != actual
+    assert parallel != actual
+    assert repr(parallel) == repr(serial)
+
+
+def test_mismatches_match_serial_comparison(executor: Executor):
+    actual = actual_records(6)
+    actual[1]["id"] = "one"
+    actual[4]["body"] = '{"name": 4}'
+    serial = explain(InParallel(expected_records(6), chunk_size=6), actual)
+    matcher = InParallel(expected_records(6), executor=executor, chunk_size=2)
+    parallel = explain(matcher, actual)
+    assert [(m.path, m.actual) for m in parallel] == [
+        (m.path, m.actual) for m in serial
+    ]
+    assert [m.path for m in parallel] == [(1, "id"), (4, "body", "name")]
+
+
+def test_mismatches_refer_to_original_matchers(executor: Executor):
+    expected = expected_records(4)
+    actual = actual_records(4)
+    actual[2]["id"] = "two"
+    matcher = InParallel(expected, executor=executor, chunk_size=2)
+    assert matcher.mismatches() == []
+    assert matcher != actual
+    assert matcher.mismatches() == [Mismatch((2, "id"), expected[2]["id"], "two")]
+    assert repr(expected[2]["id"]) == "InstanceOf(<class 'int'>)"
+
+
+def test_reports_missing_and_extra_items(executor: Executor):
+    matcher = InParallel[int]([1, 2, 3, 4], executor=executor, chunk_size=1)
+    assert [(m.path, m.actual) for m in explain(matcher, [1, 2, 3])] == [
+        ((3,), MISSING)
+    ]
+    assert [(m.path, m.expected) for m in explain(matcher, [1, 2, 3, 4, 5])] == [
+        ((4,), MISSING)
+    ]
+
+
+def test_mismatch_budget_applies_to_results(executor: Executor):
+    actual = actual_records(4)
+    for record in actual:
+        record["id"] = str(record["id"])
+    matcher = InParallel(expected_records(4), executor=executor, chunk_size=2)
+    with mismatch_budget(1):
+        assert matcher != actual
+    assert [m.path for m in matcher.mismatches()] == [(0, "id")]
+
+
+def test_frozen_matcher_shares_executor(executor: Executor):
+    matcher = InParallel(expected_records(4), executor=executor, chunk_size=2)
+    frozen = matcher.frozen()
+    assert tp.cast(InParallel[tp.Any], frozen._matcher)._executor is executor
+    assert frozen == actual_records(4)
@@ -0,0 +1,103 @@
+import typing as tp
+from unittest import mock
+
+import pytest
+
+from joythief.callables import CompletesWithin, Eventually
+from joythief.data_structures import DictContaining, EveryItem, IterableMatching
+from joythief.objects import InstanceOf
+from joythief.pytest_plugin import pytest_assertrepr_compare
+
+
+def explain(left: tp.Any, right: tp.Any, *, verbose: int = 0) -> tp.Any:
+    config = mock.Mock(**{"getoption.return_value": verbose})
+    return pytest_assertrepr_compare(config, "==", left, right)
+
+
+def test_lists_mismatches_with_paths():
+    actual = dict(foo=["baz"])
+    matcher = DictContaining(foo=[InstanceOf(int)], bar=123)
+    assert actual != matcher
+    assert explain(actual, matcher)[1:] == [
+        "2 mismatches:",
+        "['foo'][0]: expected InstanceOf(<class 'int'>), got 'baz'",
+        "['bar']: expected 123, got MISSING",
+    ]
+
+
+def test_finds_matchers_in_plain_containers():
+    expected = [1, {"foo": InstanceOf(str)}]
+    assert explain([1, {"foo": 2}], expected)[1:] == [
+        "1 mismatch:",
+        "[1]['foo']: expected InstanceOf(<class 'str'>), got 2",
+    ]
+    assert repr(expected) == "[1, {'foo': InstanceOf(<class 'str'>)}]"
+
+
+def test_uses_mismatches_recorded_in_plain_containers():
+    calls = mock.Mock(return_value="pending")
+    expected = [Eventually("done", timeout=0, interval=0.01)]
+    assert [calls] != expected
+    assert calls.call_count == 1
+    assert explain([calls], expected)[1:] == [
+        "1 mismatch:",
+        "[0]: expected 'done', got 'pending'",
+    ]
+    assert calls.call_count == 1
+
+
+def test_explains_recorded_iterables_without_consuming_them_again():
+    actual = iter([1, "two"])
+    expected = dict(items=IterableMatching[tp.Any](InstanceOf(int)))
+    assert dict(items=actual) != expected
+    assert explain(dict(items=actual), expected)[1:] == [
+        "1 mismatch:",
+        "['items'][1]: expected InstanceOf(<class 'int'>), got 'two'",
+    ]
+
+
+def test_does_not_compare_again_matchers_with_side_effects():
+    slow = mock.Mock()
+    expected = [InstanceOf(int), CompletesWithin(1)]
+    assert explain(["one", slow], expected)[1:] == [
+        "2 mismatches:",
+        "[0]: expected InstanceOf(<class 'int'>), got 'one'",
+        f"[1]: expected {expected[1]!r}, got {slow!r}",
+    ]
+    slow.assert_not_called()
+
+
+def test_accepts_matcher_on_left():
+    assert explain(InstanceOf(str), 1)[1:] == [
+        "1 mismatch:",
+        "value: expected InstanceOf(<class 'str'>), got 1",
+    ]
+
+
+def test_limits_size_of_output():
+    actual = [str(i) * 1_000 for i in range(100)]
+    lines = explain(actual, EveryItem(InstanceOf(int)))
+    assert len(lines) == 23
+    assert lines[-1] == "... 80 more, use -vv to show"
+    assert max(len(line) for line in lines) < 500
+
+
+def test_lists_all_mismatches_when_very_verbose():
+    actual = list(map(str, range(100)))
+    assert len(explain(actual, EveryItem(InstanceOf(int)), verbose=2)) == 102
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        pytest.param([1], [2], id="no matchers"),
+        pytest.param(1, InstanceOf(int), id="no mismatches"),
+    ],
+)
+def test_leaves_other_comparisons_to_pytest(left: tp.Any, right: tp.Any):
+    assert explain(left, right) is None
+
+
+def test_ignores_other_operators():
+    config = mock.Mock()
+    assert pytest_assertrepr_compare(config, "!=", 1, InstanceOf(int)) is None